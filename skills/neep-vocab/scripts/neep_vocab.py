@@ -63,12 +63,27 @@ ERROR_INFO: dict[str, dict[str, Any]] = {
     "invalid_match": {
         "message": "Lookup match mode is invalid.",
         "retryable": False,
-        "hint": "Use --match auto or --match word.",
+        "hint": "Use --match auto, word or norm.",
+    },
+    "invalid_versions": {
+        "message": "Cross-version lookup options are invalid.",
+        "retryable": False,
+        "hint": "Pass --versions all or comma-separated version keys, without --version or --match norm.",
     },
     "invalid_mode": {
         "message": "Search mode is invalid.",
         "retryable": False,
-        "hint": "Use one of: prefix, suffix, contains, fuzzy, wildcard.",
+        "hint": "Use one of: prefix, suffix, contains, fuzzy, wildcard, typo.",
+    },
+    "invalid_cursor": {
+        "message": "Search cursor is invalid or belongs to a different search.",
+        "retryable": False,
+        "hint": "Pass the next_cursor returned by the previous page with the same query and mode.",
+    },
+    "invalid_max_distance": {
+        "message": "Typo search distance is out of range.",
+        "retryable": False,
+        "hint": "Pass --max-distance 0, 1 or 2.",
     },
     "invalid_query": {
         "message": "Search query is invalid after normalization.",
@@ -126,9 +141,14 @@ def _build_parser() -> argparse.ArgumentParser:
     lookup.add_argument("words", nargs="+", help="Words to look up.")
     lookup.add_argument(
         "--match",
-        choices=["auto", "word"],
+        choices=["auto", "word", "norm"],
         default="auto",
-        help="Matching strategy (default: auto).",
+        help="Matching strategy (default: auto); norm ignores case, hyphens and UK/US spelling.",
+    )
+    lookup.add_argument(
+        "--versions",
+        default=None,
+        help="Report which versions contain each word: 'all' or comma-separated version keys.",
     )
     _add_shared_args(lookup)
 
@@ -136,12 +156,33 @@ def _build_parser() -> argparse.ArgumentParser:
     search.add_argument("query", help="Search query.")
     search.add_argument(
         "--mode",
-        choices=["prefix", "suffix", "contains", "fuzzy", "wildcard"],
+        choices=["prefix", "suffix", "contains", "fuzzy", "wildcard", "typo"],
         default="contains",
         help="Search mode (default: contains).",
     )
+    search.add_argument(
+        "--max-distance",
+        type=int,
+        default=None,
+        help="Typo mode only: max edits, 0-2 (default: 1 for short queries, else 2).",
+    )
     search.add_argument("--limit", type=int, default=10, help="Max results to return.")
     search.add_argument("--offset", type=int, default=0, help="Pagination offset.")
+    search.add_argument(
+        "--cursor",
+        default=None,
+        help="next_cursor from the previous page of the same search.",
+    )
+    search.add_argument(
+        "--with-total",
+        action="store_true",
+        help="Also report the total number of matches.",
+    )
+    search.add_argument(
+        "--count",
+        action="store_true",
+        help="Only report the total number of matches.",
+    )
     _add_shared_args(search)
 
     list_versions_parser = subparsers.add_parser(
@@ -199,8 +240,12 @@ def _format_lookup(results: list[dict[str, Any]], warnings: list[str]) -> str:
             f"{row['input']}: found",
             f"word={row['word']}",
         ]
+        if row.get("matched_by"):
+            parts.append(f"matched_by={row['matched_by']}")
         if row.get("version"):
             parts.append(f"version={row['version']}")
+        if row.get("versions"):
+            parts.append(f"versions={','.join(row['versions'])}")
         if row.get("source"):
             parts.append(f"source={row['source']}")
         if row.get("added_at"):
@@ -213,12 +258,21 @@ def _format_search(data: dict[str, Any], warnings: list[str]) -> str:
     lines: list[str] = []
     if warnings:
         lines.append(f"warnings: {', '.join(warnings)}")
-    header = f"query={data['query']} mode={data['mode']} limit={data['limit']} offset={data['offset']}"
+    header = f"query={data['query']} mode={data['mode']}"
+    if "limit" in data:
+        header += f" limit={data['limit']} offset={data['offset']}"
     if data.get("version"):
         header += f" version={data['version']}"
     lines.append(header)
-    for row in data["results"]:
-        lines.append(row["word"])
+    if "total" in data:
+        lines.append(f"total={data['total']}" + ("" if data["total_exact"] else "+"))
+    for row in data.get("results", []):
+        if "distance" in row:
+            lines.append(f"{row['word']} (distance={row['distance']})")
+        else:
+            lines.append(row["word"])
+    if data.get("next_cursor"):
+        lines.append(f"next_cursor={data['next_cursor']}")
     return "\n".join(lines)
 
 
@@ -333,7 +387,12 @@ def main() -> int:
         lexicon = build_lexicon(db_path, start=Path.cwd())
 
         if args.command == "lookup":
-            data, warnings = lexicon.lookup_words(args.words, match=args.match, version=args.version)
+            versions = args.versions
+            if versions is not None and versions.strip().lower() != "all":
+                versions = [value.strip() for value in versions.split(",") if value.strip()]
+            data, warnings = lexicon.lookup_words(
+                args.words, match=args.match, version=args.version, versions=versions
+            )
             for row in data["results"]:
                 if row.get("found"):
                     row["status"] = "found"
@@ -355,6 +414,10 @@ def main() -> int:
                 limit=args.limit,
                 offset=args.offset,
                 version=args.version,
+                max_distance=args.max_distance,
+                cursor=args.cursor,
+                with_total=args.with_total,
+                count_only=args.count,
             )
             response = _success_response(args.command, data, warnings)
             if args.json:
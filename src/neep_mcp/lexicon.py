@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import bisect
+import json
+import os
 import re
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Sequence
 
-from word_extractor.storage import ResolvedVersion, detect_schema_mode, resolve_configured_version
+from neep_mcp.snapshot import SNAPSHOTS
+from neep_mcp.typo import MAX_TYPO_DISTANCE
+from word_extractor.morphology import headword_candidates, norm_key
+from word_extractor.storage import (
+    NORM_KEY_INDEX,
+    REVERSED_WORD_INDEX,
+    SEARCH_INDEX_TABLE,
+    WORD_FORMS_TABLE,
+    ResolvedVersion,
+    detect_schema_mode,
+    has_index,
+    has_search_index,
+    has_word_forms,
+    resolve_configured_version,
+)
 from word_extractor.storage import list_versions as list_version_rows
 from word_extractor.storage import resolve_db_path as resolve_storage_db_path
 from word_extractor.storage import resolve_version as resolve_db_version
@@ -16,6 +35,20 @@ from word_extractor.storage import resolve_version as resolve_db_version
 MAX_WORD_LENGTH = 64
 MAX_LOOKUP = 200
 MAX_SEARCH = 200
+# Counting stops here; larger totals are reported as this with ``total_exact`` false.
+MAX_COUNT = 10_000
+ENGINES = ("sqlite", "memory")
+SEARCH_MODES = ("prefix", "suffix", "contains", "fuzzy", "wildcard", "typo")
+
+# The trigram index only narrows a LIKE pattern with a literal run this long.
+_TRIGRAM_MIN_RUN = 3
+
+# A suffix shared by this many words is cheaper to find with the ordered LIKE
+# scan, which stops after one page, than by sorting every reversed-index hit.
+_COMMON_SUFFIX_ROWS = 2000
+
+# Stays well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999).
+_LOOKUP_CHUNK_SIZE = 500
 
 _WORD_RE = re.compile(r"[A-Za-z-]+")
 
@@ -107,20 +140,307 @@ def sanitize_wildcard(value: str) -> tuple[str | None, list[str]]:
     return cleaned, warnings
 
 
-def _row_to_result(row: sqlite3.Row, *, version: str | None) -> WordsQueryResult:
-    return WordsQueryResult(
-        word=row["word"],
-        source=row["source"],
-        added_at=row["added_at"],
-        version=version,
+def _uses_trigram_index(pattern: str) -> bool:
+    return max(map(len, re.split(r"[%_]", pattern))) >= _TRIGRAM_MIN_RUN
+
+
+def _suffix_range(suffix: str) -> tuple[str, str]:
+    """Bounds of the ``reversed_word`` range holding every word ending in ``suffix``."""
+    low = suffix[::-1]
+    return low, low[:-1] + chr(ord(low[-1]) + 1)
+
+
+def _is_common_suffix(conn: sqlite3.Connection, version_id: int, low: str, high: str) -> bool:
+    row = conn.execute(
+        """
+        SELECT COUNT(*) FROM (
+            SELECT 1 FROM words
+            WHERE version_id = ? AND reversed_word >= ? AND reversed_word < ?
+            LIMIT ?
+        )
+        """,
+        (version_id, low, high, _COMMON_SUFFIX_ROWS),
+    ).fetchone()
+    return row[0] >= _COMMON_SUFFIX_ROWS
+
+
+def _match_query(
+    conn: sqlite3.Connection,
+    mode: str,
+    query: str,
+    pattern: str,
+    version_id: int | None,
+    *,
+    after: str = "",
+    counting: bool = False,
+) -> tuple[str, tuple[Any, ...]]:
+    """SQL selecting every ``word`` matching ``pattern`` that sorts after ``after``.
+
+    Callers append ``ORDER BY word LIMIT ? OFFSET ?`` for a page or wrap it in
+    a capped ``COUNT(*)``. A count has to visit every match, so it takes the
+    reversed-word and trigram indexes even where an ordered page would stop
+    sooner without them.
+    """
+    if version_id is None:
+        return "SELECT word FROM words WHERE word LIKE ? AND word > ?", (pattern, after)
+    if (
+        mode == "suffix"
+        and has_index(conn, REVERSED_WORD_INDEX)
+        and (counting or not _is_common_suffix(conn, version_id, *_suffix_range(query)))
+    ):
+        # Rows written by tools that predate the column have no reversed_word
+        # yet and are matched with LIKE instead.
+        low, high = _suffix_range(query)
+        return (
+            f"""
+            SELECT word FROM (
+                SELECT w.word FROM words AS w
+                WHERE w.version_id = ? AND w.reversed_word >= ? AND w.reversed_word < ?
+                UNION ALL
+                SELECT w.word FROM words AS w INDEXED BY {REVERSED_WORD_INDEX}
+                WHERE w.version_id = ? AND w.reversed_word IS NULL AND w.word LIKE ?
+            )
+            WHERE word > ?
+            """,
+            (version_id, low, high, version_id, pattern, after),
+        )
+    if (counting or mode != "prefix") and _uses_trigram_index(pattern) and has_search_index(conn):
+        # Prefix pages already stop early in index order. The unary + keeps
+        # the planner from scanning the version index instead; candidates are
+        # re-checked with LIKE so results match exactly.
+        return (
+            f"""
+            SELECT w.word
+            FROM words AS w
+            WHERE w.id IN (SELECT rowid FROM {SEARCH_INDEX_TABLE} WHERE word LIKE ?)
+            AND +w.version_id = ? AND w.word LIKE ? AND +w.word > ?
+            """,
+            (pattern, version_id, pattern, after),
+        )
+    return (
+        "SELECT w.word FROM words AS w WHERE w.version_id = ? AND w.word > ? AND w.word LIKE ?",
+        (version_id, after, pattern),
     )
 
 
+def _total_fields(count: int) -> dict[str, Any]:
+    """``total`` capped at ``MAX_COUNT``; ``count`` is taken with a limit of ``MAX_COUNT + 1``."""
+    return {"total": min(count, MAX_COUNT), "total_exact": count <= MAX_COUNT}
+
+
+def encode_cursor(mode: str, query: str, after: object) -> str:
+    """Opaque cursor resuming a search after the row whose sort key is ``after``."""
+    raw = json.dumps({"m": mode, "q": query, "a": after}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, mode: str, query: str) -> Any:
+    """Return the sort key stored in ``cursor``; it must come from the same search."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("invalid_cursor") from exc
+    if not isinstance(payload, dict) or payload.get("m") != mode or payload.get("q") != query:
+        raise ValueError("invalid_cursor")
+    return payload.get("a")
+
+
+def resolve_engine(explicit: str | None = None) -> str:
+    """Pick the lookup engine: explicit value, then ``NEEP_WORDS_ENGINE``, then ``sqlite``."""
+    value = (explicit or os.environ.get("NEEP_WORDS_ENGINE") or "sqlite").strip().lower()
+    if value not in ENGINES:
+        raise ValueError("invalid_engine")
+    return value
+
+
+def _fetch_words(
+    conn: sqlite3.Connection, words: Sequence[str], *, version_id: int | None
+) -> dict[str, tuple[str | None, str | None]]:
+    """Fetch ``(source, added_at)`` for ``words`` with one ``IN (...)`` query per chunk."""
+    unique_words = list(dict.fromkeys(words))
+    rows: dict[str, tuple[str | None, str | None]] = {}
+    for start in range(0, len(unique_words), _LOOKUP_CHUNK_SIZE):
+        chunk = unique_words[start : start + _LOOKUP_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk))
+        if version_id is None:
+            cursor = conn.execute(f"SELECT * FROM words WHERE word IN ({placeholders})", chunk)
+        else:
+            cursor = conn.execute(
+                f"""
+                SELECT w.word, w.source, w.added_at
+                FROM words AS w
+                WHERE w.version_id = ? AND w.word IN ({placeholders})
+                """,
+                (version_id, *chunk),
+            )
+        for row in cursor:
+            rows.setdefault(row["word"], (row["source"], row["added_at"]))
+    return rows
+
+
+def _fetch_norm_keys(
+    conn: sqlite3.Connection, keys: Sequence[str], *, version_id: int | None
+) -> dict[str, list[tuple[str, str | None, str | None]]]:
+    """Fetch every ``(word, source, added_at)`` per normalized key, in word order.
+
+    Uses the ``norm_key`` index where the schema has it; rows that predate the
+    column, and databases without it, get their key computed by SQLite.
+    """
+    conn.create_function("neep_norm_key", 1, norm_key, deterministic=True)
+    unique_keys = list(dict.fromkeys(keys))
+    found: dict[str, list[tuple[str, str | None, str | None]]] = {}
+    # The indexed query binds every key twice.
+    chunk_size = _LOOKUP_CHUNK_SIZE // 2
+    for start in range(0, len(unique_keys), chunk_size):
+        chunk = unique_keys[start : start + chunk_size]
+        placeholders = ", ".join("?" * len(chunk))
+        if version_id is None:
+            cursor = conn.execute(
+                f"""
+                SELECT word, source, added_at, neep_norm_key(word) AS key
+                FROM words WHERE neep_norm_key(word) IN ({placeholders})
+                ORDER BY word
+                """,
+                chunk,
+            )
+        elif has_index(conn, NORM_KEY_INDEX):
+            cursor = conn.execute(
+                f"""
+                SELECT word, source, added_at, key FROM (
+                    SELECT w.word, w.source, w.added_at, w.norm_key AS key FROM words AS w
+                    WHERE w.version_id = ? AND w.norm_key IN ({placeholders})
+                    UNION ALL
+                    SELECT w.word, w.source, w.added_at, neep_norm_key(w.word)
+                    FROM words AS w INDEXED BY {NORM_KEY_INDEX}
+                    WHERE w.version_id = ? AND w.norm_key IS NULL
+                    AND neep_norm_key(w.word) IN ({placeholders})
+                )
+                ORDER BY word
+                """,
+                (version_id, *chunk, version_id, *chunk),
+            )
+        else:
+            cursor = conn.execute(
+                f"""
+                SELECT w.word, w.source, w.added_at, neep_norm_key(w.word) AS key
+                FROM words AS w
+                WHERE w.version_id = ? AND neep_norm_key(w.word) IN ({placeholders})
+                ORDER BY w.word
+                """,
+                (version_id, *chunk),
+            )
+        for row in cursor:
+            found.setdefault(row["key"], []).append((row["word"], row["source"], row["added_at"]))
+    return found
+
+
+def _fetch_word_forms(
+    conn: sqlite3.Connection, forms: Sequence[str], *, version_id: int
+) -> dict[str, list[tuple[str, str | None, str | None]]]:
+    """Resolve inflected ``forms`` to their headwords' ``(word, source, added_at)``, in word order."""
+    unique_forms = list(dict.fromkeys(forms))
+    found: dict[str, list[tuple[str, str | None, str | None]]] = {}
+    for start in range(0, len(unique_forms), _LOOKUP_CHUNK_SIZE):
+        chunk = unique_forms[start : start + _LOOKUP_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"""
+            SELECT f.form, w.word, w.source, w.added_at
+            FROM {WORD_FORMS_TABLE} AS f
+            JOIN words AS w ON w.version_id = f.version_id AND w.word = f.word
+            WHERE f.version_id = ? AND f.form IN ({placeholders})
+            ORDER BY f.form, w.word
+            """,
+            (version_id, *chunk),
+        )
+        for row in cursor:
+            found.setdefault(row["form"], []).append((row["word"], row["source"], row["added_at"]))
+    return found
+
+
+def _candidate_headwords(forms: Sequence[str]) -> dict[str, list[str]]:
+    """Possible headwords of each form, for databases without a ``word_forms`` table."""
+    candidates = {form: headword_candidates(form) for form in dict.fromkeys(forms)}
+    return {form: words for form, words in candidates.items() if words}
+
+
+def _fetch_headwords(
+    conn: sqlite3.Connection, forms: Sequence[str], *, version_id: int
+) -> dict[str, list[tuple[str, str | None, str | None]]]:
+    """Like ``_fetch_word_forms``, but computes the forms at query time."""
+    candidates = _candidate_headwords(forms)
+    entries = _fetch_words(
+        conn, [word for words in candidates.values() for word in words], version_id=version_id
+    )
+    found: dict[str, list[tuple[str, str | None, str | None]]] = {}
+    for form, words in candidates.items():
+        matches = [(word, *entries[word]) for word in words if word in entries]
+        if matches:
+            found[form] = matches
+    return found
+
+
+def _fetch_versions_by_key(
+    conn: sqlite3.Connection, keys: Sequence[str], *, version_ids: Sequence[int], forms: bool
+) -> dict[str, list[tuple[str, list[str]]]]:
+    """Group the versions holding each key as ``(word, version_keys)``, in word order.
+
+    Keys are stored words, or inflected forms resolved through ``word_forms``
+    when ``forms`` is set. One grouped query per chunk probes the
+    ``(version_id, word)`` or ``(version_id, form)`` key for every version at once.
+    """
+    if forms:
+        source = f"SELECT form AS key, word, version_id FROM {WORD_FORMS_TABLE} AS w"
+        column = "w.form"
+    else:
+        source = "SELECT word AS key, word, version_id FROM words AS w"
+        column = "w.word"
+    unique_keys = list(dict.fromkeys(keys))
+    found: dict[str, list[tuple[str, list[str]]]] = {}
+    chunk_size = max(1, _LOOKUP_CHUNK_SIZE - len(version_ids))
+    id_placeholders = ", ".join("?" * len(version_ids))
+    for start in range(0, len(unique_keys), chunk_size):
+        chunk = unique_keys[start : start + chunk_size]
+        placeholders = ", ".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"""
+            SELECT m.key, m.word, json_group_array(vv.version_key) AS version_keys
+            FROM (
+                {source}
+                WHERE w.version_id IN ({id_placeholders}) AND {column} IN ({placeholders})
+            ) AS m
+            JOIN vocab_versions AS vv ON vv.id = m.version_id
+            GROUP BY m.key, m.word
+            ORDER BY m.key, m.word
+            """,
+            (*version_ids, *chunk),
+        )
+        for row in cursor:
+            found.setdefault(row["key"], []).append(
+                (row["word"], sorted(json.loads(row["version_keys"])))
+            )
+    return found
+
+
 class WordsLexicon:
-    def __init__(self, path: Path, configured_version: str | None = None) -> None:
+    """Lookups and searches over one words database.
+
+    The ``sqlite`` engine queries the database on every call. The ``memory``
+    engine loads each version's words once into a process-wide snapshot and
+    answers from it with the same results and ordering, reloading the snapshot
+    whenever the database file changes.
+    """
+
+    def __init__(
+        self, path: Path, configured_version: str | None = None, *, engine: str = "sqlite"
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError("invalid_engine")
         self._db = WordsDatabase(path)
         self.path = path
         self.configured_version = configured_version
+        self.engine = engine
 
     def _resolve_version(
         self, conn: sqlite3.Connection, *, version: str | None
@@ -145,7 +465,22 @@ class WordsLexicon:
         words: Iterable[str],
         match: str | None = "auto",
         version: str | None = None,
+        versions: str | Sequence[str] | None = None,
     ) -> tuple[dict[str, Any], list[str]]:
+        """Look up words in one version, or in several with ``versions``.
+
+        With ``match="auto"`` an inflected form that is not stored itself
+        resolves to its headword (``"abandoned"`` finds ``abandon``), marked
+        ``matched_by="inflection"``; the optional ``word_forms`` table is used
+        when present, otherwise the forms are computed at query time.
+        ``match="norm"`` compares normalized keys, so case, hyphens, spaces and
+        British/American spelling are ignored (``"Colour"`` finds ``color``).
+        ``word`` in each result is the stored headword.
+
+        ``versions`` (``"all"`` or a list of version keys) instead reports, per
+        word, the sorted ``versions`` that contain it, from one grouped query
+        over every requested version; it supports ``auto`` and ``word`` matching.
+        """
         if words is None:
             raise ValueError("missing_words")
 
@@ -159,53 +494,111 @@ class WordsLexicon:
         if match_value not in {"auto", "word", "norm"}:
             raise ValueError("invalid_match")
 
-        results: list[dict[str, Any]] = []
         warnings: list[str] = []
-
-        with self._db.connect() as conn:
-            resolved_version = self._resolve_version(conn, version=version)
-            for item in items:
-                original = str(item)
+        queries: list[tuple[str, str | None]] = []
+        for item in items:
+            original = str(item)
+            if match_value == "norm":
+                cleaned = norm_key(original)
+                if not cleaned:
+                    cleaned = None
+                    warnings.append("empty_input" if not original.strip() else "no_english_tokens")
+                elif len(cleaned) > MAX_WORD_LENGTH:
+                    cleaned = None
+                    warnings.append("too_long")
+            else:
                 cleaned, clean_warnings = sanitize_token(original)
                 warnings.extend(clean_warnings)
-                if cleaned is None:
-                    results.append({"input": original, "found": False, "error": "invalid_input"})
-                    continue
+            queries.append((original, cleaned))
 
-                if resolved_version is None:
-                    row = conn.execute("SELECT * FROM words WHERE word = ?", (cleaned,)).fetchone()
+        if versions is not None:
+            if version is not None or match_value == "norm":
+                raise ValueError("invalid_versions")
+            return self._lookup_across_versions(
+                queries, match=match_value, versions=versions, warnings=warnings
+            )
+
+        with self._db.connect() as conn:
+            resolved_version = self._resolve_version(conn, version=version)
+            version_id = resolved_version.id if resolved_version is not None else None
+            valid = [cleaned for _, cleaned in queries if cleaned is not None]
+            rows: dict[str, tuple[str, str | None, str | None]]
+            inflected: set[str] = set()
+            if match_value == "norm":
+                if self.engine == "memory":
+                    candidates = SNAPSHOTS.get(conn, self.path, version_id=version_id).lookup_norm(
+                        valid
+                    )
                 else:
-                    row = conn.execute(
-                        """
-                        SELECT w.word, w.source, w.added_at
-                        FROM words AS w
-                        WHERE w.version_id = ? AND w.word = ?
-                        """,
-                        (resolved_version.id, cleaned),
-                    ).fetchone()
-
-                if row is None:
-                    result: dict[str, Any] = {"input": original, "query": cleaned, "found": False}
-                    if resolved_version is not None:
-                        result["version"] = resolved_version.version_key
-                    results.append(result)
-                    continue
-
-                payload = _row_to_result(
-                    row,
-                    version=resolved_version.version_key if resolved_version is not None else None,
+                    candidates = _fetch_norm_keys(conn, valid, version_id=version_id)
+                rows = {}
+                for original, cleaned in queries:
+                    if cleaned is None or cleaned not in candidates:
+                        continue
+                    # Prefer the input's own spelling when several words share the key.
+                    spelled = re.sub(r"[^a-z]+", "", original.lower())
+                    matches = candidates[cleaned]
+                    rows.setdefault(
+                        original, next((m for m in matches if m[0] == spelled), matches[0])
+                    )
+            else:
+                snapshot = (
+                    SNAPSHOTS.get(conn, self.path, version_id=version_id)
+                    if self.engine == "memory"
+                    else None
                 )
-                result = {
-                    "input": original,
-                    "query": cleaned,
-                    "found": True,
-                    "word": payload.word,
-                    "source": payload.source,
-                    "added_at": payload.added_at,
+                if snapshot is not None:
+                    entries = snapshot.lookup(valid)
+                else:
+                    entries = _fetch_words(conn, valid, version_id=version_id)
+                rows = {
+                    word: (word, source, added_at) for word, (source, added_at) in entries.items()
                 }
-                if payload.version is not None:
-                    result["version"] = payload.version
+                missing = [cleaned for cleaned in valid if cleaned not in entries]
+                if match_value == "auto" and missing and version_id is not None:
+                    # Fall back to inflected forms ("abandoned" -> "abandon").
+                    if snapshot is not None:
+                        headwords = snapshot.lookup_forms(missing)
+                    elif has_word_forms(conn):
+                        headwords = _fetch_word_forms(conn, missing, version_id=version_id)
+                    else:
+                        headwords = _fetch_headwords(conn, missing, version_id=version_id)
+                    for form, matches in headwords.items():
+                        rows[form] = matches[0]
+                        inflected.add(form)
+
+        version_key = resolved_version.version_key if resolved_version is not None else None
+        results: list[dict[str, Any]] = []
+        for original, cleaned in queries:
+            if cleaned is None:
+                results.append({"input": original, "found": False, "error": "invalid_input"})
+                continue
+
+            row = rows.get(original if match_value == "norm" else cleaned)
+            if row is None:
+                result: dict[str, Any] = {"input": original, "query": cleaned, "found": False}
+                if version_key is not None:
+                    result["version"] = version_key
                 results.append(result)
+                continue
+
+            word, source, added_at = row
+            payload = WordsQueryResult(
+                word=word, source=source, added_at=added_at, version=version_key
+            )
+            result = {
+                "input": original,
+                "query": cleaned,
+                "found": True,
+                "word": payload.word,
+                "source": payload.source,
+                "added_at": payload.added_at,
+            }
+            if cleaned in inflected:
+                result["matched_by"] = "inflection"
+            if payload.version is not None:
+                result["version"] = payload.version
+            results.append(result)
 
         payload: dict[str, Any] = {"results": results}
         if resolved_version is not None:
@@ -213,6 +606,92 @@ class WordsLexicon:
             payload["version_source"] = resolved_version.source
         return payload, warnings
 
+    def _resolve_versions(
+        self, conn: sqlite3.Connection, versions: str | Sequence[str]
+    ) -> list[ResolvedVersion]:
+        schema_mode = detect_schema_mode(conn)
+        if schema_mode == "legacy":
+            raise ValueError("legacy_schema_no_versions")
+        if schema_mode == "missing":
+            raise ValueError("words_table_not_found")
+        if schema_mode != "versioned":
+            raise ValueError("unsupported_schema")
+        if isinstance(versions, str) and versions.strip().lower() == "all":
+            return [
+                ResolvedVersion(id=row[0], version_key=row[1], label=row[2], source="all")
+                for row in conn.execute(
+                    "SELECT id, version_key, label FROM vocab_versions ORDER BY version_key"
+                )
+            ]
+        requested = [versions] if isinstance(versions, str) else list(versions)
+        if not requested:
+            raise ValueError("invalid_versions")
+        resolved = {
+            row.id: row
+            for row in (resolve_db_version(conn, requested_version=value) for value in requested)
+        }
+        return sorted(resolved.values(), key=lambda row: row.version_key)
+
+    def _lookup_across_versions(
+        self,
+        queries: list[tuple[str, str | None]],
+        *,
+        match: str,
+        versions: str | Sequence[str],
+        warnings: list[str],
+    ) -> tuple[dict[str, Any], list[str]]:
+        valid = [cleaned for _, cleaned in queries if cleaned is not None]
+        with self._db.connect() as conn:
+            resolved = self._resolve_versions(conn, versions)
+            version_ids = [row.id for row in resolved]
+            found: dict[str, list[tuple[str, list[str]]]] = {}
+            inflected: dict[str, list[tuple[str, list[str]]]] = {}
+            if version_ids and valid:
+                found = _fetch_versions_by_key(conn, valid, version_ids=version_ids, forms=False)
+                missing = [cleaned for cleaned in valid if cleaned not in found]
+                if match == "auto" and missing and has_word_forms(conn):
+                    inflected = _fetch_versions_by_key(
+                        conn, missing, version_ids=version_ids, forms=True
+                    )
+                elif match == "auto" and missing:
+                    candidates = _candidate_headwords(missing)
+                    by_word = _fetch_versions_by_key(
+                        conn,
+                        [word for words in candidates.values() for word in words],
+                        version_ids=version_ids,
+                        forms=False,
+                    )
+                    for form, words in candidates.items():
+                        matches = [by_word[word][0] for word in words if word in by_word]
+                        if matches:
+                            inflected[form] = matches
+
+        results: list[dict[str, Any]] = []
+        for original, cleaned in queries:
+            if cleaned is None:
+                results.append({"input": original, "found": False, "error": "invalid_input"})
+                continue
+            result: dict[str, Any] = {"input": original, "query": cleaned}
+            if cleaned in found:
+                word, version_keys = found[cleaned][0]
+                result.update({"found": True, "word": word, "versions": version_keys})
+            elif cleaned in inflected:
+                word, version_keys = inflected[cleaned][0]
+                result.update(
+                    {
+                        "found": True,
+                        "word": word,
+                        "versions": version_keys,
+                        "matched_by": "inflection",
+                    }
+                )
+            else:
+                result.update({"found": False, "versions": []})
+            results.append(result)
+
+        payload = {"results": results, "versions": [row.version_key for row in resolved]}
+        return payload, warnings
+
     def search_words(
         self,
         query: str,
@@ -220,12 +699,32 @@ class WordsLexicon:
         limit: int | None = 10,
         offset: int | None = 0,
         version: str | None = None,
+        max_distance: int | None = None,
+        cursor: str | None = None,
+        with_total: bool = False,
+        count_only: bool = False,
     ) -> tuple[dict[str, Any], list[str]]:
+        """Search one version's words.
+
+        ``with_total`` adds ``total``, the number of matches for the whole
+        search regardless of paging, and ``count_only`` returns just that.
+        Counting stops at ``MAX_COUNT``; ``total_exact`` is false past it.
+
+        Every page returns ``next_cursor`` when it is full; passing it back as
+        ``cursor`` seeks straight past the last returned word instead of
+        re-scanning ``offset`` rows (an ``offset`` given with it still applies
+        after the cursor position).
+
+        ``fuzzy`` matches the query letters in order (``tst`` -> ``test``);
+        ``typo`` finds words within ``max_distance`` insertions, deletions,
+        substitutions or adjacent swaps (default 1 for queries of up to four
+        letters, else 2), closest first, from a per-version index.
+        """
         if query is None:
             raise ValueError("missing_query")
 
         mode_value = (mode or "contains").lower()
-        if mode_value not in {"prefix", "suffix", "contains", "fuzzy", "wildcard"}:
+        if mode_value not in SEARCH_MODES:
             raise ValueError("invalid_mode")
 
         if mode_value == "wildcard":
@@ -248,6 +747,24 @@ class WordsLexicon:
         limit_value = max(1, min(limit_value, MAX_SEARCH))
         offset_value = max(0, offset_value)
 
+        if mode_value == "typo":
+            return self._search_typo(
+                cleaned,
+                limit=limit_value,
+                offset=offset_value,
+                version=version,
+                max_distance=max_distance,
+                cursor=cursor,
+                with_total=with_total,
+                count_only=count_only,
+                warnings=warnings,
+            )
+
+        # Words are never empty, so "" seeks to the start.
+        after = "" if cursor is None else decode_cursor(cursor, mode=mode_value, query=cleaned)
+        if not isinstance(after, str):
+            raise ValueError("invalid_cursor")
+
         if mode_value == "prefix":
             pattern = f"{cleaned}%"
         elif mode_value == "suffix":
@@ -261,31 +778,127 @@ class WordsLexicon:
 
         with self._db.connect() as conn:
             resolved_version = self._resolve_version(conn, version=version)
-            if resolved_version is None:
-                rows = conn.execute(
-                    "SELECT word FROM words WHERE word LIKE ? ORDER BY word LIMIT ? OFFSET ?",
-                    (pattern, limit_value, offset_value),
-                ).fetchall()
+            version_id = resolved_version.id if resolved_version is not None else None
+            snapshot = (
+                SNAPSHOTS.get(conn, self.path, version_id=version_id)
+                if self.engine == "memory"
+                else None
+            )
+            total: int | None = None
+            if with_total or count_only:
+                if snapshot is not None:
+                    total = snapshot.count(mode_value, cleaned, pattern, MAX_COUNT + 1)
+                else:
+                    sql, params = _match_query(
+                        conn, mode_value, cleaned, pattern, version_id, counting=True
+                    )
+                    total = conn.execute(
+                        f"SELECT COUNT(*) FROM ({sql} LIMIT ?)", (*params, MAX_COUNT + 1)
+                    ).fetchone()[0]
+            words: list[str] = []
+            if count_only:
+                pass
+            elif snapshot is not None:
+                words = snapshot.search(
+                    mode_value, cleaned, pattern, limit_value, offset_value, after=after
+                )
             else:
-                rows = conn.execute(
-                    """
-                    SELECT w.word
-                    FROM words AS w
-                    WHERE w.version_id = ? AND w.word LIKE ?
-                    ORDER BY w.word
-                    LIMIT ? OFFSET ?
-                    """,
-                    (resolved_version.id, pattern, limit_value, offset_value),
-                ).fetchall()
-
-        results = [{"word": row["word"]} for row in rows]
+                sql, params = _match_query(
+                    conn, mode_value, cleaned, pattern, version_id, after=after
+                )
+                words = [
+                    row["word"]
+                    for row in conn.execute(
+                        f"{sql} ORDER BY word LIMIT ? OFFSET ?",
+                        (*params, limit_value, offset_value),
+                    )
+                ]
+
+        payload: dict[str, Any] = {"query": cleaned, "mode": mode_value}
+        if not count_only:
+            payload.update(
+                {
+                    "limit": limit_value,
+                    "offset": offset_value,
+                    "results": [{"word": word} for word in words],
+                    "next_cursor": (
+                        encode_cursor(mode_value, cleaned, words[-1])
+                        if len(words) == limit_value
+                        else None
+                    ),
+                }
+            )
+        if total is not None:
+            payload.update(_total_fields(total))
+        if resolved_version is not None:
+            payload["version"] = resolved_version.version_key
+            payload["version_source"] = resolved_version.source
+        return payload, warnings
+
+    def _search_typo(
+        self,
+        cleaned: str,
+        *,
+        limit: int,
+        offset: int,
+        version: str | None,
+        max_distance: int | None,
+        cursor: str | None,
+        with_total: bool,
+        count_only: bool,
+        warnings: list[str],
+    ) -> tuple[dict[str, Any], list[str]]:
+        if max_distance is None:
+            distance_value = 1 if len(cleaned) <= 4 else MAX_TYPO_DISTANCE
+        else:
+            try:
+                distance_value = int(max_distance)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("invalid_max_distance") from exc
+            if not 0 <= distance_value <= MAX_TYPO_DISTANCE:
+                raise ValueError("invalid_max_distance")
+
+        # Typo search always runs on the snapshot, whichever engine is selected.
+        with self._db.connect() as conn:
+            resolved_version = self._resolve_version(conn, version=version)
+            snapshot = SNAPSHOTS.get(
+                conn,
+                self.path,
+                version_id=resolved_version.id if resolved_version is not None else None,
+            )
+        matches = snapshot.typo_index.search(cleaned, distance_value)
         payload: dict[str, Any] = {
             "query": cleaned,
-            "mode": mode_value,
-            "limit": limit_value,
-            "offset": offset_value,
-            "results": results,
+            "mode": "typo",
+            "max_distance": distance_value,
         }
+        if with_total or count_only:
+            payload.update(_total_fields(len(matches)))
+        if not count_only:
+            if cursor is not None:
+                # Typo results are ordered by (distance, word), so that pair is the key.
+                after = decode_cursor(cursor, mode="typo", query=cleaned)
+                if (
+                    not isinstance(after, list)
+                    or len(after) != 2
+                    or not isinstance(after[0], int)
+                    or not isinstance(after[1], str)
+                ):
+                    raise ValueError("invalid_cursor")
+                matches = matches[bisect.bisect_right(matches, (after[0], after[1])) :]
+            page = matches[offset : offset + limit]
+            payload.update(
+                {
+                    "limit": limit,
+                    "offset": offset,
+                    "results": [{"word": word, "distance": distance} for distance, word in page],
+                    "next_cursor": (
+                        encode_cursor("typo", cleaned, list(page[-1]))
+                        if len(page) == limit
+                        else None
+                    ),
+                }
+            )
         if resolved_version is not None:
             payload["version"] = resolved_version.version_key
             payload["version_source"] = resolved_version.source
@@ -377,7 +990,8 @@ def build_lexicon(
     db_path: str | Path | None = None,
     *,
     start: Path | None = None,
+    engine: str | None = None,
 ) -> WordsLexicon:
     path = resolve_db_path(db_path, start=start)
     configured_version, _ = resolve_configured_version(start=start)
-    return WordsLexicon(path, configured_version=configured_version)
+    return WordsLexicon(path, configured_version=configured_version, engine=resolve_engine(engine))
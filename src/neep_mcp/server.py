@@ -51,6 +51,7 @@ def lookup_words(
     words: Iterable[str],
     match: str | None = "auto",
     version: str | None = None,
+    versions: str | list[str] | None = None,
 ) -> dict[str, Any]:
     """
     Look up multiple words in the NEEP (Postgraduate Entrance Exam) syllabus.
@@ -58,16 +59,23 @@ def lookup_words(
     Args:
         words: List of words to query (e.g., ["abandon", "ability"]).
         match: Matching strategy:
-            - "auto" (default): Uses the normalized stored word form.
+            - "auto" (default): Uses the normalized stored word form; an inflected form
+              ("abandoned", "went") resolves to its headword with `matched_by: "inflection"`.
             - "word": strict exact spelling match.
+            - "norm": ignores case, hyphens, spaces and British/American spelling
+              (e.g., "Colour" -> "color"); `word` in the result is the stored spelling.
         version: Optional vocabulary version such as "2027" or "27考研".
+        versions: "all" or a list of versions to check in one call instead of `version`;
+            each result then lists the `versions` containing the word ("auto"/"word" match).
     """
     rate_error = _rate_limiter.check()
     if rate_error:
         return _make_response(False, error=rate_error)
 
     try:
-        data, warnings = _lexicon().lookup_words(words, match=match, version=version)
+        data, warnings = _lexicon().lookup_words(
+            words, match=match, version=version, versions=versions
+        )
     except FileNotFoundError:
         return _make_response(False, error="db_not_found")
     except ValueError as exc:
@@ -85,9 +93,13 @@ def search_words(
     limit: int | None = 10,
     offset: int | None = 0,
     version: str | None = None,
+    max_distance: int | None = None,
+    cursor: str | None = None,
+    with_total: bool = False,
+    count_only: bool = False,
 ) -> dict[str, Any]:
     """
-    Search for words in the syllabus using prefix, substring, or fuzzy matching.
+    Search for words in the syllabus using prefix, substring, fuzzy or typo-tolerant matching.
 
     Args:
         query: The search string.
@@ -97,9 +109,16 @@ def search_words(
             - "contains" (default): Matches words containing the query (e.g., "ban" -> "abandon").
             - "fuzzy": Matches characters in sequence (e.g., "tst" -> "test").
             - "wildcard": SQL LIKE pattern with %, _ (e.g., "in%tion" -> "information").
+            - "typo": Words within a few typos, closest first (e.g., "acommodate" ->
+              "accommodate"); each result carries its edit distance.
         limit: Max number of results to return (default 10, max 200).
-        offset: Pagination offset.
+        offset: Pagination offset; prefer `cursor` for deep paging.
         version: Optional vocabulary version such as "2027" or "27考研".
+        max_distance: Typo mode only: max edits, 0-2 (default 1 for short queries, else 2).
+        cursor: `next_cursor` from the previous page of the same search, to fetch the next page.
+        with_total: Also return `total`, the number of matches across all pages.
+        count_only: Return only `total`, without results. Totals stop at 10000;
+            `total_exact` is false when there are more.
     """
     rate_error = _rate_limiter.check()
     if rate_error:
@@ -112,6 +131,10 @@ def search_words(
             limit=limit,
             offset=offset,
             version=version,
+            max_distance=max_distance,
+            cursor=cursor,
+            with_total=with_total,
+            count_only=count_only,
         )
     except FileNotFoundError:
         return _make_response(False, error="db_not_found")
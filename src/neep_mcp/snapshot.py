@@ -0,0 +1,193 @@
+"""In-memory snapshots of one vocabulary version for the ``memory`` lookup engine."""
+
+from __future__ import annotations
+
+import bisect
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator
+
+from neep_mcp.typo import TypoIndex
+from word_extractor.morphology import inflections, norm_key
+
+# (mtime_ns, size) of the database file and its WAL, if any.
+FileSignature = tuple[tuple[int, int], tuple[int, int] | None]
+
+
+def file_signature(path: Path) -> FileSignature:
+    """Identify the on-disk state of a database so a stale snapshot can be dropped."""
+    stat = path.stat()
+    wal_path = path.with_name(path.name + "-wal")
+    try:
+        wal_stat = wal_path.stat()
+    except FileNotFoundError:
+        wal = None
+    else:
+        wal = (wal_stat.st_mtime_ns, wal_stat.st_size)
+    return (stat.st_mtime_ns, stat.st_size), wal
+
+
+@lru_cache(maxsize=256)
+def like_matcher(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """Compile a SQL ``LIKE`` pattern (``%``, ``_``, ASCII case-insensitive) to a matcher."""
+    parts = []
+    for ch in pattern:
+        if ch == "%":
+            parts.append(".*")
+        elif ch == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(ch))
+    return re.compile("".join(parts), re.DOTALL | re.IGNORECASE | re.ASCII).fullmatch
+
+
+@dataclass(frozen=True)
+class VersionSnapshot:
+    """Every word of one version, sorted the way ``ORDER BY word`` sorts them.
+
+    ``entries`` maps each word to its ``(source, added_at)`` and doubles as the
+    exact-match set. ``words`` keeps duplicates (legacy tables allow them) so
+    searches page exactly like the SQL path. The case-sensitive fast paths are
+    only equivalent to ``LIKE`` when every word is ``lowercase``.
+    """
+
+    words: tuple[str, ...]
+    entries: dict[str, tuple[str | None, str | None]]
+    lowercase: bool
+    signature: FileSignature
+
+    def _prefix_matches(self, prefix: str, start: int) -> Iterator[str]:
+        start = max(start, bisect.bisect_left(self.words, prefix))
+        for word in islice(self.words, start, None):
+            if not word.startswith(prefix):
+                return
+            yield word
+
+    def _matches(self, mode: str, query: str, pattern: str, after: str) -> Iterator[str]:
+        start = bisect.bisect_right(self.words, after) if after else 0
+        candidates = islice(self.words, start, None)
+        if mode == "prefix" and self.lowercase:
+            return self._prefix_matches(query, start)
+        if mode == "contains" and self.lowercase:
+            return (word for word in candidates if query in word)
+        if mode == "suffix" and self.lowercase:
+            return (word for word in candidates if word.endswith(query))
+        matcher = like_matcher(pattern)
+        return (word for word in candidates if matcher(word))
+
+    def search(
+        self, mode: str, query: str, pattern: str, limit: int, offset: int, *, after: str = ""
+    ) -> list[str]:
+        """Return one page of words matching ``pattern``, as ``LIKE`` would.
+
+        ``query`` is the sanitized search term and ``pattern`` the ``LIKE``
+        pattern built from it; prefix searches bisect, the rest scan. Only
+        words sorting after ``after`` are considered.
+        """
+        return list(islice(self._matches(mode, query, pattern, after), offset, offset + limit))
+
+    def count(self, mode: str, query: str, pattern: str, cap: int) -> int:
+        """Number of words matching ``pattern``, counting no further than ``cap``."""
+        if mode == "prefix" and self.lowercase:
+            # Sanitized queries are lowercase ASCII, so bumping the last letter
+            # gives the first word past the prefix range.
+            low = bisect.bisect_left(self.words, query)
+            high = bisect.bisect_left(self.words, query[:-1] + chr(ord(query[-1]) + 1))
+            return min(high - low, cap)
+        return sum(1 for _ in islice(self._matches(mode, query, pattern, ""), cap))
+
+    @cached_property
+    def typo_index(self) -> TypoIndex:
+        """Deletion index for typo search, built on first use."""
+        return TypoIndex(self.words)
+
+    def lookup(self, words: list[str]) -> dict[str, tuple[str | None, str | None]]:
+        return {word: self.entries[word] for word in words if word in self.entries}
+
+    @cached_property
+    def norm_index(self) -> dict[str, list[str]]:
+        """Words grouped by normalized key, in word order, built on first use."""
+        index: dict[str, list[str]] = {}
+        for word in dict.fromkeys(self.words):
+            index.setdefault(norm_key(word), []).append(word)
+        return index
+
+    @cached_property
+    def form_index(self) -> dict[str, list[str]]:
+        """Headwords by inflected form, as in the ``word_forms`` table, built on first use."""
+        index: dict[str, list[str]] = {}
+        for word in dict.fromkeys(self.words):
+            for form in inflections(word):
+                index.setdefault(form, []).append(word)
+        return index
+
+    def lookup_forms(self, forms: list[str]) -> dict[str, list[tuple[str, str | None, str | None]]]:
+        return {
+            form: [(word, *self.entries[word]) for word in self.form_index[form]]
+            for form in forms
+            if form in self.form_index
+        }
+
+    def lookup_norm(self, keys: list[str]) -> dict[str, list[tuple[str, str | None, str | None]]]:
+        return {
+            key: [(word, *self.entries[word]) for word in self.norm_index[key]]
+            for key in keys
+            if key in self.norm_index
+        }
+
+
+def load_snapshot(
+    conn: sqlite3.Connection, *, version_id: int | None, signature: FileSignature
+) -> VersionSnapshot:
+    if version_id is None:
+        cursor = conn.execute("SELECT word, source, added_at FROM words ORDER BY rowid")
+    else:
+        cursor = conn.execute(
+            "SELECT word, source, added_at FROM words WHERE version_id = ? ORDER BY rowid",
+            (version_id,),
+        )
+    words: list[str] = []
+    entries: dict[str, tuple[str | None, str | None]] = {}
+    for row in cursor:
+        words.append(row["word"])
+        entries.setdefault(row["word"], (row["source"], row["added_at"]))
+    # Code-point order is UTF-8 byte order, i.e. SQLite's BINARY collation.
+    return VersionSnapshot(
+        words=tuple(sorted(words)),
+        entries=entries,
+        lowercase=all(word == word.lower() for word in entries),
+        signature=signature,
+    )
+
+
+class SnapshotCache:
+    """Process-wide snapshots keyed by database path and version id."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshots: dict[tuple[str, int | None], VersionSnapshot] = {}
+
+    def get(
+        self, conn: sqlite3.Connection, path: Path, *, version_id: int | None
+    ) -> VersionSnapshot:
+        """Return the cached snapshot, reloading it through ``conn`` if the file changed."""
+        key = (str(path.resolve()), version_id)
+        signature = file_signature(path)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None or snapshot.signature != signature:
+                snapshot = load_snapshot(conn, version_id=version_id, signature=signature)
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+
+SNAPSHOTS = SnapshotCache()
@@ -0,0 +1,83 @@
+"""Typo-tolerant word search over symmetric-deletion neighbourhoods."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+MAX_TYPO_DISTANCE = 2
+# Only the first few letters are indexed, as in SymSpell; candidates are always
+# verified against the full word, so this bounds index size without losing hits.
+_PREFIX_LENGTH = 6
+
+
+def osa_distance(first: str, second: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or ``max_distance + 1`` once it is exceeded.
+
+    Counts insertions, deletions, substitutions and transpositions of adjacent
+    letters ("recieve" -> "receive" is 1).
+    """
+    if abs(len(first) - len(second)) > max_distance:
+        return max_distance + 1
+    previous_previous: list[int] = []
+    previous = list(range(len(second) + 1))
+    for i, char in enumerate(first, start=1):
+        current = [i] + [0] * len(second)
+        row_min = i
+        for j, other in enumerate(second, start=1):
+            cost = 0 if char == other else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and char == second[j - 2] and first[i - 2] == other:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """``word`` and every string reachable from it by up to ``max_distance`` deletions."""
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            variant[:index] + variant[index + 1 :]
+            for variant in frontier
+            if variant
+            for index in range(len(variant))
+        }
+        found |= frontier
+    return found
+
+
+class TypoIndex:
+    """Map deletion variants of each word's prefix back to the words.
+
+    A query shares at least one variant with every word within
+    ``max_distance`` edits, so only those candidates need the exact distance.
+    """
+
+    def __init__(self, words: Iterable[str], *, max_distance: int = MAX_TYPO_DISTANCE) -> None:
+        self.max_distance = max_distance
+        self._words = list(dict.fromkeys(words))
+        self._variants: dict[str, list[int]] = {}
+        for word_id, word in enumerate(self._words):
+            for variant in _deletes(word[:_PREFIX_LENGTH], max_distance):
+                self._variants.setdefault(variant, []).append(word_id)
+
+    def search(self, query: str, max_distance: int) -> list[tuple[int, str]]:
+        """Return ``(distance, word)`` pairs within ``max_distance``, closest first."""
+        if max_distance > self.max_distance:
+            raise ValueError("invalid_max_distance")
+        candidates: set[int] = set()
+        for variant in _deletes(query[:_PREFIX_LENGTH], max_distance):
+            candidates.update(self._variants.get(variant, ()))
+        matches = []
+        for word_id in candidates:
+            word = self._words[word_id]
+            distance = osa_distance(query, word, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, word))
+        matches.sort()
+        return matches
@@ -1,6 +1,17 @@
 """WordExtractor package."""
 
-from . import cleaner, core, image_proc, main, ocr_engine, output, pdf_renderer
+from . import (
+    batch,
+    cleaner,
+    core,
+    image_proc,
+    main,
+    ocr_engine,
+    output,
+    pdf_renderer,
+    profiling,
+    watch,
+)
 
 __all__ = [
     "core",
@@ -10,4 +21,7 @@ __all__ = [
     "ocr_engine",
     "cleaner",
     "output",
+    "profiling",
+    "batch",
+    "watch",
 ]
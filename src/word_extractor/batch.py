@@ -0,0 +1,302 @@
+"""Manifest-driven batch extraction across many PDFs and versions."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tomllib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Mapping, cast
+
+from . import core
+from .output import write_outputs
+from .storage import normalize_version_key
+
+# Per-job keyword arguments forwarded to ``core.collect_words``; a manifest can
+# set any of them under [defaults] and override them per job.
+JOB_OPTIONS = frozenset(
+    {
+        "dpi",
+        "crop_ratio_top",
+        "crop_ratio_bottom",
+        "split_offset",
+        "contrast_factor",
+        "binarize",
+        "binarize_threshold",
+        "recognition_level",
+        "language_preference",
+        "framework",
+        "ocr_unit",
+        "max_variants_per_line",
+        "min_confidence",
+        "layout_filter",
+        "thumbnail_dpi",
+        "skip_duplicate_pages",
+        "duplicate_threshold",
+    }
+)
+_JOB_KEYS = frozenset({"pdf", "start_page", "end_page", "version", "debug_dir"}) | JOB_OPTIONS
+_MANIFEST_KEYS = frozenset(
+    {
+        "output_dir",
+        "workers",
+        "spellcheck",
+        "spellcheck_rejected",
+        "spellcheck_languages",
+        "legacy_version",
+        "defaults",
+        "jobs",
+    }
+)
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One PDF page range extracted into one version."""
+
+    pdf: Path
+    start_page: int
+    end_page: int
+    version: str
+    debug_dir: Path | None = None
+    options: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BatchManifest:
+    jobs: list[BatchJob]
+    output_dir: Path
+    workers: int | None = None
+    spellcheck: bool = True
+    spellcheck_rejected: str = "csv"
+    spellcheck_languages: list[str] | None = None
+    legacy_version: str | None = None
+
+
+def _resolve_path(value: object, *, base_dir: Path, what: str) -> Path:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{what} must be a non-empty path string.")
+    path = Path(value.strip())
+    return path if path.is_absolute() else (base_dir / path).resolve()
+
+
+def _check_keys(payload: Mapping[str, Any], allowed: frozenset[str], *, where: str) -> None:
+    unknown = sorted(set(payload) - allowed)
+    if unknown:
+        raise ValueError(f"Unknown key(s) in {where}: {', '.join(unknown)}")
+
+
+def _parse_job(
+    payload: object, *, index: int, defaults: Mapping[str, Any], base_dir: Path
+) -> BatchJob:
+    where = f"jobs[{index}]"
+    if not isinstance(payload, dict):
+        raise ValueError(f"{where} must be a table/object.")
+    _check_keys(payload, _JOB_KEYS, where=where)
+    missing = [key for key in ("pdf", "start_page", "end_page", "version") if key not in payload]
+    if missing:
+        raise ValueError(f"{where} is missing: {', '.join(missing)}")
+    try:
+        version = normalize_version_key(payload["version"])
+    except ValueError as exc:
+        raise ValueError(f"{where} has an invalid version: {payload['version']!r}") from exc
+    start_page, end_page = payload["start_page"], payload["end_page"]
+    if not isinstance(start_page, int) or not isinstance(end_page, int):
+        raise ValueError(f"{where} start_page and end_page must be integers.")
+    debug_dir = payload.get("debug_dir")
+    options = {**defaults, **{key: payload[key] for key in JOB_OPTIONS if key in payload}}
+    return BatchJob(
+        pdf=_resolve_path(payload["pdf"], base_dir=base_dir, what=f"{where}.pdf"),
+        start_page=start_page,
+        end_page=end_page,
+        version=version,
+        debug_dir=(
+            _resolve_path(debug_dir, base_dir=base_dir, what=f"{where}.debug_dir")
+            if debug_dir is not None
+            else None
+        ),
+        options=options,
+    )
+
+
+def parse_manifest(payload: Mapping[str, Any], *, base_dir: Path) -> BatchManifest:
+    """Validate a decoded manifest; relative paths resolve against ``base_dir``."""
+    _check_keys(payload, _MANIFEST_KEYS, where="manifest")
+    defaults = payload.get("defaults", {})
+    if not isinstance(defaults, dict):
+        raise ValueError("defaults must be a table/object.")
+    _check_keys(defaults, JOB_OPTIONS, where="defaults")
+    raw_jobs = payload.get("jobs")
+    if not isinstance(raw_jobs, list) or not raw_jobs:
+        raise ValueError("Manifest must list at least one job.")
+    jobs = [
+        _parse_job(item, index=index, defaults=defaults, base_dir=base_dir)
+        for index, item in enumerate(raw_jobs)
+    ]
+    workers = payload.get("workers")
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("workers must be a positive integer.")
+    spellcheck_rejected = str(payload.get("spellcheck_rejected", "csv"))
+    if spellcheck_rejected not in {"csv", "db"}:
+        raise ValueError("spellcheck_rejected must be 'csv' or 'db'.")
+    languages = payload.get("spellcheck_languages")
+    legacy_version = payload.get("legacy_version")
+    return BatchManifest(
+        jobs=jobs,
+        output_dir=_resolve_path(
+            payload.get("output_dir", "output"), base_dir=base_dir, what="output_dir"
+        ),
+        workers=workers,
+        spellcheck=bool(payload.get("spellcheck", True)),
+        spellcheck_rejected=spellcheck_rejected,
+        spellcheck_languages=[str(lang) for lang in languages] if languages else None,
+        legacy_version=str(legacy_version) if legacy_version is not None else None,
+    )
+
+
+def load_manifest(path: Path) -> BatchManifest:
+    """Load a ``.toml`` or ``.json`` batch manifest."""
+    try:
+        if path.suffix.lower() == ".json":
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        else:
+            with path.open("rb") as handle:
+                payload = tomllib.load(handle)
+    except FileNotFoundError as exc:
+        raise ValueError(f"Manifest not found: {path}") from exc
+    except (json.JSONDecodeError, tomllib.TOMLDecodeError) as exc:
+        raise ValueError(f"Invalid manifest {path}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ValueError(f"Invalid manifest {path}: expected a table/object at the top level.")
+    return parse_manifest(payload, base_dir=path.parent.resolve())
+
+
+def default_worker_count() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def _run_job(job: BatchJob) -> tuple[list[dict[str, object]], dict[str, object]]:
+    return core.collect_words(
+        job.pdf,
+        job.start_page,
+        job.end_page,
+        job.debug_dir,
+        **job.options,
+    )
+
+
+def run_batch(
+    manifest: BatchManifest,
+    *,
+    workers: int | None = None,
+    on_event: Callable[[dict[str, object]], None] | None = None,
+) -> dict[str, object]:
+    """Run every job and commit each version once all of its jobs have finished.
+
+    Jobs render and OCR on a thread pool of ``workers`` (falling back to the
+    manifest, then ``default_worker_count``); PDFium and the OCR backend each
+    take one call at a time, so workers overlap the stages around them rather
+    than running two recognitions at once. Database writes stay on the
+    calling thread: a version is written in one transaction as soon as its last
+    job finishes, and a version with any failed job is not written at all.
+    ``on_event`` receives a dict for every finished job and version.
+    ``failed_count`` counts failed jobs and failed version writes.
+    """
+    budget = workers or manifest.workers or default_worker_count()
+    if budget < 1:
+        raise ValueError("workers must be a positive integer.")
+
+    pending_by_version: dict[str, int] = {}
+    for job in manifest.jobs:
+        pending_by_version[job.version] = pending_by_version.get(job.version, 0) + 1
+    collected: dict[int, tuple[list[dict[str, object]], int]] = {}
+    failed_versions: set[str] = set()
+    write_failures = 0
+    job_results: list[dict[str, object]] = [{} for _ in manifest.jobs]
+    version_results: dict[str, dict[str, object]] = {}
+
+    def emit(event: dict[str, object]) -> None:
+        if on_event is not None:
+            on_event(event)
+
+    def commit_version(version: str) -> None:
+        indices = [index for index, job in enumerate(manifest.jobs) if job.version == version]
+        if version in failed_versions:
+            for index in indices:
+                collected.pop(index, None)
+            version_results[version] = {"error": "skipped: a job for this version failed"}
+            emit({"event": "version", "version": version, **version_results[version]})
+            return
+        words: list[dict[str, object]] = []
+        truncated_line_count = 0
+        for index in indices:
+            job_words, job_truncated = collected.pop(index)
+            words.extend(job_words)
+            truncated_line_count += job_truncated
+        try:
+            stats = write_outputs(
+                words,
+                manifest.output_dir,
+                version=version,
+                spellcheck=manifest.spellcheck,
+                spellcheck_rejected=manifest.spellcheck_rejected,
+                spellcheck_languages=manifest.spellcheck_languages,
+                legacy_version=manifest.legacy_version,
+                source_pdf=",".join(str(manifest.jobs[index].pdf) for index in indices),
+                rejected_csv_path=manifest.output_dir / f"rejected_words-{version}.csv",
+            )
+        except (sqlite3.Error, OSError, RuntimeError, ValueError) as exc:
+            nonlocal write_failures
+            write_failures += 1
+            failed_versions.add(version)
+            version_results[version] = {"error": str(exc)}
+            emit({"event": "version", "version": version, **version_results[version]})
+            return
+        stats["truncated_line_count"] = truncated_line_count
+        version_results[version] = stats
+        emit({"event": "version", **stats})
+
+    with ThreadPoolExecutor(max_workers=budget, thread_name_prefix="neep-batch") as executor:
+        futures: dict[Future[tuple[list[dict[str, object]], dict[str, object]]], int] = {
+            executor.submit(_run_job, job): index for index, job in enumerate(manifest.jobs)
+        }
+        remaining = set(futures)
+        while remaining:
+            done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=futures.__getitem__):
+                index = futures[future]
+                job = manifest.jobs[index]
+                result: dict[str, object] = {
+                    "pdf": str(job.pdf),
+                    "pages": f"{job.start_page}-{job.end_page}",
+                    "version": job.version,
+                }
+                try:
+                    words, collect_stats = future.result()
+                except Exception as exc:  # reported per job, the batch carries on
+                    failed_versions.add(job.version)
+                    result["error"] = str(exc) or type(exc).__name__
+                else:
+                    truncated_line_count = cast(int, collect_stats["truncated_line_count"])
+                    collected[index] = (words, truncated_line_count)
+                    result["word_count"] = len(words)
+                    result.update(collect_stats)
+                job_results[index] = result
+                emit({"event": "job", **result})
+
+                pending_by_version[job.version] -= 1
+                if pending_by_version[job.version] == 0:
+                    commit_version(job.version)
+
+    return {
+        "workers": budget,
+        "jobs": job_results,
+        "versions": version_results,
+        # Failed jobs plus versions whose database write failed.
+        "failed_count": sum(1 for result in job_results if "error" in result) + write_failures,
+        "failed_versions": sorted(failed_versions),
+    }
@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
-import re
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Hashable, Iterable, Iterator, Sequence
 
-_WHITESPACE_RE = re.compile(r"\s+")
-_SLASH_RE = re.compile(r"\s*/\s*")
-_ALLOWED_RE = re.compile(r"[^a-zA-Z()/\\ -]+")
+from .ocr_engine import OCRAnnotation
+
+# Upper bound on candidates generated per line; k optional groups expand to
+# 2**k variants, so a garbled OCR line must not be expanded exhaustively.
+MAX_VARIANTS_PER_LINE = 64
+
+_ALLOWED_CHARS = frozenset(string.ascii_letters + "()/\\ -")
+_SPACE = ord(" ")
+_NEWLINE = ord("\n")
+
+
+class _AllowedCharTable(dict[int, int]):
+    """``str.translate`` table that maps every disallowed character to a space.
+
+    Newlines are kept so a whole page can be translated in one call. Entries
+    are filled lazily, so arbitrary Unicode input only costs one lookup per
+    distinct character.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        value = codepoint if chr(codepoint) in _ALLOWED_CHARS else _SPACE
+        self[codepoint] = value
+        return value
+
+
+_ALLOWED_TABLE = _AllowedCharTable({_NEWLINE: _NEWLINE})
 
 
 def _merge_hyphenated_lines(lines: list[str]) -> list[str]:
@@ -26,70 +52,251 @@ def _merge_hyphenated_lines(lines: list[str]) -> list[str]:
 
 
 def _normalize_line(line: str) -> str:
-    line = _ALLOWED_RE.sub(" ", line)
-    line = _SLASH_RE.sub(" / ", line)
-    line = _WHITESPACE_RE.sub(" ", line)
-    return line.strip()
+    # Disallowed characters become spaces, slashes get one space on each side,
+    # and split/join collapses every whitespace run and trims the ends.
+    return " ".join(line.translate(_ALLOWED_TABLE).replace("/", " / ").split())
 
 
 def _is_noise(line: str) -> bool:
-    if len(line) < 2:
-        return True
-    alpha_count = sum(1 for char in line if char.isalpha())
+    # Only valid for normalized lines, whose non-letters are limited to the
+    # six characters counted here; str.count beats a per-character loop.
     total_count = len(line)
-    if total_count == 0:
+    if total_count < 2:
         return True
-    return (alpha_count / total_count) < 0.5
+    non_alpha_count = (
+        line.count(" ")
+        + line.count("-")
+        + line.count("/")
+        + line.count("(")
+        + line.count(")")
+        + line.count("\\")
+    )
+    return ((total_count - non_alpha_count) / total_count) < 0.5
 
 
 def normalize_text(text: str) -> list[str]:
     """Normalize raw OCR text into cleaned, non-noise lines."""
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    lines = _merge_hyphenated_lines(lines)
+    stripped = (line.strip() for line in text.splitlines())
+    lines = _merge_hyphenated_lines([line for line in stripped if line])
+    page = "\n".join(lines).translate(_ALLOWED_TABLE).replace("/", " / ")
     cleaned: list[str] = []
-    for line in lines:
-        normalized = _normalize_line(line)
+    for line in page.split("\n"):
+        normalized = " ".join(line.split())
         if normalized and not _is_noise(normalized):
             cleaned.append(normalized)
     return cleaned
 
 
-def expand_variants(line: str) -> list[str]:
+@dataclass(frozen=True)
+class CleanedLine:
+    """Normalized line with the OCR confidence and bbox it was read from.
+
+    A line merged across a hyphenated break carries the lowest confidence of
+    its parts. Within one location the bbox is the union of both parts; across
+    locations (another column or page) it keeps the first part's bbox, and
+    ``locations`` lists every location the line was read from.
+    """
+
+    text: str
+    confidence: float | None
+    bbox: tuple[float, float, float, float] | None
+    locations: tuple[Hashable, ...] = ()
+
+
+def _union_bbox(
+    first: tuple[float, float, float, float] | None,
+    second: tuple[float, float, float, float] | None,
+) -> tuple[float, float, float, float] | None:
+    # Boxes are (x, y, width, height), as returned by ocrmac.
+    if first is None:
+        return second
+    if second is None:
+        return first
+    left = min(first[0], second[0])
+    bottom = min(first[1], second[1])
+    right = max(first[0] + first[2], second[0] + second[2])
+    top = max(first[1] + first[3], second[1] + second[3])
+    return (left, bottom, right - left, top - bottom)
+
+
+def _min_confidence(first: float | None, second: float | None) -> float | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+def _as_bbox(bbox: Sequence[float] | None) -> tuple[float, float, float, float] | None:
+    if bbox is None or len(bbox) != 4:
+        return None
+    return (float(bbox[0]), float(bbox[1]), float(bbox[2]), float(bbox[3]))
+
+
+def _iter_raw_lines(
+    annotations: Iterable[OCRAnnotation],
+    min_confidence: float | None,
+    locations: tuple[Hashable, ...],
+) -> Iterator[CleanedLine]:
+    for annotation in annotations:
+        if not annotation.text:
+            continue
+        confidence = annotation.confidence
+        if min_confidence is not None and confidence is not None and confidence < min_confidence:
+            continue
+        bbox = _as_bbox(annotation.bbox)
+        for raw in annotation.text.splitlines():
+            stripped = raw.strip()
+            if stripped:
+                yield CleanedLine(stripped, confidence, bbox, locations)
+
+
+def _merge_lines(first: CleanedLine, second: CleanedLine) -> CleanedLine:
+    if first.locations == second.locations:
+        bbox = _union_bbox(first.bbox, second.bbox)
+        locations = first.locations
+    else:
+        bbox = first.bbox if first.bbox is not None else second.bbox
+        locations = first.locations + second.locations
+    return CleanedLine(
+        first.text[:-1] + second.text,
+        _min_confidence(first.confidence, second.confidence),
+        bbox,
+        locations,
+    )
+
+
+def _clean_line(line: CleanedLine) -> CleanedLine | None:
+    normalized = _normalize_line(line.text)
+    if not normalized or _is_noise(normalized):
+        return None
+    return CleanedLine(normalized, line.confidence, line.bbox, line.locations)
+
+
+class AnnotationCleaner:
+    """Streaming cleaner that merges hyphenated lines across feeds.
+
+    Only the last raw line is held back, so a word broken at the bottom of one
+    column or page is joined with the first line of the next one in constant
+    memory. Each ``feed`` generator must be exhausted before the next call;
+    call ``flush`` after the last feed to emit the held-back line.
+    """
+
+    def __init__(self, *, min_confidence: float | None = None) -> None:
+        self.min_confidence = min_confidence
+        self._pending: CleanedLine | None = None
+
+    def feed(
+        self, annotations: Iterable[OCRAnnotation], *, location: Hashable | None = None
+    ) -> Iterator[CleanedLine]:
+        """Clean ``annotations`` read at ``location`` and yield every completed line."""
+        locations = () if location is None else (location,)
+        for current in _iter_raw_lines(annotations, self.min_confidence, locations):
+            pending = self._pending
+            if pending is None:
+                self._pending = current
+                continue
+            if pending.text.endswith("-") and current.text[0].isalpha():
+                merged = _merge_lines(pending, current)
+                self._pending = None
+            else:
+                merged = pending
+                self._pending = current
+            cleaned = _clean_line(merged)
+            if cleaned is not None:
+                yield cleaned
+
+    def flush(self) -> Iterator[CleanedLine]:
+        """Yield the held-back line, if any, and reset the cleaner."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            cleaned = _clean_line(pending)
+            if cleaned is not None:
+                yield cleaned
+
+
+def iter_clean_annotations(
+    annotations: Iterable[OCRAnnotation], *, min_confidence: float | None = None
+) -> Iterator[CleanedLine]:
+    """Lazily clean OCR annotations into lines that keep their bbox and confidence.
+
+    Produces the same text as ``normalize_text`` over the joined annotation
+    text, merging hyphenated breaks across annotations. Annotations whose
+    confidence is below ``min_confidence`` are dropped before merging.
+    """
+    cleaner = AnnotationCleaner(min_confidence=min_confidence)
+    yield from cleaner.feed(annotations)
+    yield from cleaner.flush()
+
+
+def expand_variants(line: str, *, max_variants: int = MAX_VARIANTS_PER_LINE) -> list[str]:
     """Expand slash and parentheses variants into individual word entries."""
+    variants, _ = _expand_line(line, max_variants)
+    return list(variants)
+
+
+def expand_variants_bounded(
+    line: str, *, max_variants: int = MAX_VARIANTS_PER_LINE
+) -> tuple[list[str], bool]:
+    """Like ``expand_variants``, also reporting whether the line hit ``max_variants``."""
+    variants, truncated = _expand_line(line, max_variants)
+    return list(variants), truncated
+
+
+@lru_cache(maxsize=4096)
+def _expand_line(line: str, max_variants: int) -> tuple[tuple[str, ...], bool]:
+    if max_variants < 1:
+        raise ValueError("max_variants must be a positive integer.")
     parts = [part.strip() for part in line.split(" / ") if part.strip()]
     variants: list[str] = []
     seen: set[str] = set()
+    generated = 0
+    truncated = False
     for part in parts:
-        for expanded in _expand_parentheses(part):
+        for expanded in _iter_parentheses_variants(part):
+            if generated >= max_variants:
+                truncated = True
+                break
+            generated += 1
             if expanded and expanded not in seen:
                 variants.append(expanded)
                 seen.add(expanded)
+        if truncated:
+            break
     if not variants:
-        return variants
-    variant_set = set(variants)
-    return [
-        variant
-        for variant in variants
-        if not variant.startswith("-")
-        if not (variant.endswith("ou") and f"{variant}r" in variant_set)
-    ]
-
-
-def _expand_parentheses(word: str) -> list[str]:
-    start = word.find("(")
-    if start == -1:
-        return [word]
-    end = word.find(")", start + 1)
-    if end == -1:
-        return [word.replace("(", "").replace(")", "")]
-    prefix = word[:start]
-    optional = word[start + 1 : end]
-    suffix = word[end + 1 :]
-    without_optional = f"{prefix}{suffix}"
-    if not optional:
-        return [without_optional]
-    with_optional = f"{prefix}{optional}{suffix}"
-    expanded: list[str] = []
-    for candidate in (without_optional, with_optional):
-        expanded.extend(_expand_parentheses(candidate))
-    return expanded
+        return (), truncated
+    return (
+        tuple(
+            variant
+            for variant in variants
+            if not variant.startswith("-")
+            if not (variant.endswith("ou") and f"{variant}r" in seen)
+        ),
+        truncated,
+    )
+
+
+def _iter_parentheses_variants(word: str) -> Iterator[str]:
+    # Depth-first over optional groups with an explicit stack: each group yields
+    # the variant without it before the one with it, and nothing is built
+    # beyond what the caller consumes.
+    stack = [word]
+    while stack:
+        candidate = stack.pop()
+        start = candidate.find("(")
+        if start == -1:
+            yield candidate
+            continue
+        end = candidate.find(")", start + 1)
+        if end == -1:
+            yield candidate.replace("(", "").replace(")", "")
+            continue
+        prefix = candidate[:start]
+        optional = candidate[start + 1 : end]
+        suffix = candidate[end + 1 :]
+        without_optional = f"{prefix}{suffix}"
+        if not optional:
+            yield without_optional
+            continue
+        stack.append(f"{prefix}{optional}{suffix}")
+        stack.append(without_optional)
@@ -2,18 +2,230 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, cast
 
-from .cleaner import expand_variants, normalize_text
-from .image_proc import apply_enhancements, crop_image, save_debug_images, split_columns
-from .ocr_engine import OCRAnnotation, run_ocr
+from PIL import Image
+
+from .cleaner import MAX_VARIANTS_PER_LINE, AnnotationCleaner, CleanedLine, expand_variants_bounded
+from .image_proc import (
+    LAYOUT_FILTER_MODES,
+    analyze_page_layout,
+    apply_enhancements,
+    crop_image,
+    hamming_distance,
+    page_dhash,
+    save_debug_images,
+    split_columns,
+)
+from .ocr_engine import run_ocr
 from .output import write_outputs
 from .pdf_renderer import iter_pdf_pages
+from .profiling import PipelineProfiler
+
+# Side of the difference hash used for duplicate pages: 32x32 = 1024 bits. At
+# 16x16 two different word lists with the same column layout came out only a
+# dozen bits apart, as close as a rescan of one page.
+DUPLICATE_HASH_SIZE = 32
+# Maximum differing bits (of 1024) for two pages to count as the same scan.
+DEFAULT_DUPLICATE_THRESHOLD = 24
+
+
+def collect_words(
+    pdf_path: Path,
+    start_page: int,
+    end_page: int,
+    debug_dir: Path | None = None,
+    *,
+    dpi: int = 300,
+    crop_ratio_top: float = 0.07,
+    crop_ratio_bottom: float = 0.06,
+    split_offset: float = 0.0,
+    contrast_factor: float | None = None,
+    binarize: bool = False,
+    binarize_threshold: int = 128,
+    recognition_level: str = "accurate",
+    language_preference: Sequence[str] | None = None,
+    framework: str = "vision",
+    ocr_unit: str = "line",
+    max_variants_per_line: int = MAX_VARIANTS_PER_LINE,
+    min_confidence: float | None = None,
+    layout_filter: str = "off",
+    thumbnail_dpi: int = 36,
+    skip_duplicate_pages: bool = False,
+    duplicate_threshold: int = DEFAULT_DUPLICATE_THRESHOLD,
+    profiler: PipelineProfiler | None = None,
+) -> tuple[list[dict[str, object]], dict[str, object]]:
+    """Render, OCR and clean a page range without touching the database.
+
+    Returns the word records ready for ``write_outputs`` and collection stats
+    (``truncated_line_count``, plus ``layout`` when a layout filter is on).
+    With ``layout_filter`` set to ``flag`` or ``skip``, every page is first
+    rendered at ``thumbnail_dpi`` and classified; ``skip`` then leaves pages
+    that do not look like two-column word lists out of the full render and OCR.
+    With ``skip_duplicate_pages``, a page whose difference hash is within
+    ``duplicate_threshold`` bits of an earlier page in the run is skipped and
+    listed under ``duplicate_pages``; the thumbnails of pages that pass the
+    layout filter are hashed when one is on, the full renders otherwise.
+    """
+    if layout_filter not in LAYOUT_FILTER_MODES:
+        raise ValueError(f"layout_filter must be one of: {', '.join(LAYOUT_FILTER_MODES)}")
+    if duplicate_threshold < 0:
+        raise ValueError("duplicate_threshold must be zero or greater.")
+    if profiler is None:
+        profiler = PipelineProfiler(enabled=False)
+    words: list[dict[str, object]] = []
+    truncated_line_count = 0
+    # Lines are numbered per (page, column); a hyphenated word continued in the
+    # next column or page takes a line number in both.
+    line_numbers: dict[tuple[int, str], int] = {}
+    cleaner = AnnotationCleaner(min_confidence=min_confidence)
 
+    def collect(cleaned_lines: Iterable[CleanedLine]) -> None:
+        nonlocal truncated_line_count
+        for cleaned in cleaned_lines:
+            line = cleaned.text
+            locations = cast(tuple[tuple[int, str], ...], cleaned.locations)
+            parts = []
+            for location in locations:
+                line_numbers[location] = line_numbers.get(location, 0) + 1
+                page_number, column_label = location
+                parts.append(f"{page_number}-{column_label}-{line_numbers[location]}")
+            page_number, column_label = locations[0]
+            source = f"{pdf_path.stem}-{'+'.join(parts)}-{line}"
+            variants, truncated = expand_variants_bounded(line, max_variants=max_variants_per_line)
+            truncated_line_count += truncated
+            for word in variants:
+                words.append(
+                    {
+                        "word": word,
+                        "source": source,
+                        "page": page_number,
+                        "column": column_label,
+                        "line": line_numbers[locations[0]],
+                    }
+                )
 
-def _annotations_to_text(annotations: Iterable[OCRAnnotation]) -> str:
-    return "\n".join(annotation.text for annotation in annotations if annotation.text)
+    page_hashes: list[tuple[int, int]] = []
+    duplicates: list[dict[str, int]] = []
+
+    def is_duplicate(page_number: int, image: Image.Image) -> bool:
+        fingerprint = page_dhash(
+            image,
+            hash_size=DUPLICATE_HASH_SIZE,
+            crop_ratio_top=crop_ratio_top,
+            crop_ratio_bottom=crop_ratio_bottom,
+        )
+        for earlier_page, earlier_hash in page_hashes:
+            distance = hamming_distance(fingerprint, earlier_hash)
+            if distance <= duplicate_threshold:
+                duplicates.append(
+                    {"page": page_number, "duplicate_of": earlier_page, "distance": distance}
+                )
+                return True
+        page_hashes.append((page_number, fingerprint))
+        return False
+
+    flagged: dict[int, str] = {}
+    thumbnail_seconds = 0.0
+    if layout_filter != "off":
+        started = time.perf_counter()
+        thumbnails = iter(iter_pdf_pages(pdf_path, start_page, end_page, dpi=thumbnail_dpi))
+        for page_number in range(start_page, end_page + 1):
+            with profiler.stage("layout", page=page_number):
+                thumbnail = next(thumbnails, None)
+                if thumbnail is None:
+                    break
+                layout = analyze_page_layout(
+                    thumbnail,
+                    crop_ratio_top=crop_ratio_top,
+                    crop_ratio_bottom=crop_ratio_bottom,
+                    split_offset=split_offset,
+                )
+                if skip_duplicate_pages and layout.reason is None:
+                    # Thumbnails are already at hand, so duplicates are not rendered
+                    # at all. Flagged pages are not hashed: blank or sparse pages
+                    # look alike without repeating any words.
+                    is_duplicate(page_number, thumbnail)
+            if layout.reason is not None:
+                flagged[page_number] = layout.reason
+        thumbnail_seconds = time.perf_counter() - started
+    skip_pages = set(flagged) if layout_filter == "skip" else set()
+    skip_pages.update(entry["page"] for entry in duplicates)
+
+    if skip_pages:
+        page_images = iter(
+            iter_pdf_pages(pdf_path, start_page, end_page, dpi=dpi, skip_pages=skip_pages)
+        )
+    else:
+        page_images = iter(iter_pdf_pages(pdf_path, start_page, end_page, dpi=dpi))
+    processed_pages = 0
+    processing_seconds = 0.0
+    for page_number in range(start_page, end_page + 1):
+        if page_number in skip_pages:
+            continue
+        page_started = time.perf_counter()
+        # Pages render lazily, so the render stage is the fetch from the iterator.
+        with profiler.stage("render", page=page_number):
+            image = next(page_images, None)
+        if image is None:
+            break
+        if skip_duplicate_pages and layout_filter == "off":
+            with profiler.stage("dedupe", page=page_number):
+                duplicate = is_duplicate(page_number, image)
+            if duplicate:
+                continue
+
+        with profiler.stage("preprocess", page=page_number):
+            cropped = crop_image(
+                image, crop_ratio_top=crop_ratio_top, crop_ratio_bottom=crop_ratio_bottom
+            )
+            processed = apply_enhancements(
+                cropped,
+                contrast_factor=contrast_factor,
+                binarize=binarize,
+                binarize_threshold=binarize_threshold,
+            )
+            left_image, right_image = split_columns(processed, split_offset=split_offset)
+
+        if debug_dir is not None:
+            with profiler.stage("debug_images", page=page_number):
+                save_debug_images(debug_dir, page_number, image, processed, left_image, right_image)
+
+        for column_label, column_image in (("L", left_image), ("R", right_image)):
+            with profiler.stage("ocr", page=page_number, column=column_label):
+                annotations = run_ocr(
+                    column_image,
+                    recognition_level=recognition_level,
+                    language_preference=language_preference,
+                    framework=framework,
+                    unit=ocr_unit,
+                )
+            with profiler.stage("clean", page=page_number, column=column_label):
+                collect(cleaner.feed(annotations, location=(page_number, column_label)))
+        processed_pages += 1
+        processing_seconds += time.perf_counter() - page_started
+
+    with profiler.stage("clean"):
+        collect(cleaner.flush())
+
+    stats: dict[str, object] = {"truncated_line_count": truncated_line_count}
+    if skip_duplicate_pages:
+        stats["duplicate_pages"] = duplicates
+    if layout_filter != "off":
+        seconds_per_page = processing_seconds / processed_pages if processed_pages else 0.0
+        stats["layout"] = {
+            "mode": layout_filter,
+            "flagged_pages": [
+                {"page": page, "reason": reason} for page, reason in sorted(flagged.items())
+            ],
+            "skipped_count": len(skip_pages),
+            "thumbnail_seconds": thumbnail_seconds,
+            # Net of the thumbnail pass, using the mean time of processed pages.
+            "estimated_seconds_saved": seconds_per_page * len(skip_pages) - thumbnail_seconds,
+        }
+    return words, stats
 
 
 def extract_words(
@@ -39,50 +251,48 @@ def extract_words(
     spellcheck_rejected: str = "csv",
     spellcheck_languages: Sequence[str] | None = None,
     legacy_version: str | int | None = None,
+    max_variants_per_line: int = MAX_VARIANTS_PER_LINE,
+    min_confidence: float | None = None,
+    layout_filter: str = "off",
+    thumbnail_dpi: int = 36,
+    skip_duplicate_pages: bool = False,
+    duplicate_threshold: int = DEFAULT_DUPLICATE_THRESHOLD,
+    profiler: PipelineProfiler | None = None,
 ) -> dict[str, object]:
-    """Run the end-to-end extraction pipeline and return stats."""
-    words: list[dict[str, object]] = []
+    """Run the end-to-end extraction pipeline and return stats.
 
-    page_images = iter_pdf_pages(pdf_path, start_page, end_page, dpi=dpi)
-    for page_number, image in enumerate(page_images, start=start_page):
-        cropped = crop_image(
-            image, crop_ratio_top=crop_ratio_top, crop_ratio_bottom=crop_ratio_bottom
-        )
-        processed = apply_enhancements(
-            cropped,
-            contrast_factor=contrast_factor,
-            binarize=binarize,
-            binarize_threshold=binarize_threshold,
-        )
-        left_image, right_image = split_columns(processed, split_offset=split_offset)
-
-        if debug_dir is not None:
-            save_debug_images(debug_dir, page_number, image, processed, left_image, right_image)
+    Pass an enabled ``profiler`` to collect per-stage timings for each page and
+    column; when it tracks memory, the per-stage summary is added to the stats
+    under ``memory``.
+    """
+    if profiler is None:
+        profiler = PipelineProfiler(enabled=False)
+    words, collect_stats = collect_words(
+        pdf_path,
+        start_page,
+        end_page,
+        debug_dir,
+        dpi=dpi,
+        crop_ratio_top=crop_ratio_top,
+        crop_ratio_bottom=crop_ratio_bottom,
+        split_offset=split_offset,
+        contrast_factor=contrast_factor,
+        binarize=binarize,
+        binarize_threshold=binarize_threshold,
+        recognition_level=recognition_level,
+        language_preference=language_preference,
+        framework=framework,
+        ocr_unit=ocr_unit,
+        max_variants_per_line=max_variants_per_line,
+        min_confidence=min_confidence,
+        layout_filter=layout_filter,
+        thumbnail_dpi=thumbnail_dpi,
+        skip_duplicate_pages=skip_duplicate_pages,
+        duplicate_threshold=duplicate_threshold,
+        profiler=profiler,
+    )
 
-        for column_label, column_image in (("L", left_image), ("R", right_image)):
-            annotations = run_ocr(
-                column_image,
-                recognition_level=recognition_level,
-                language_preference=language_preference,
-                framework=framework,
-                unit=ocr_unit,
-            )
-            raw_text = _annotations_to_text(annotations)
-            cleaned_lines = normalize_text(raw_text)
-            for line_index, line in enumerate(cleaned_lines, start=1):
-                source = f"{pdf_path.stem}-{page_number}-{column_label}-{line_index}-{line}"
-                for word in expand_variants(line):
-                    words.append(
-                        {
-                            "word": word,
-                            "source": source,
-                            "page": page_number,
-                            "column": column_label,
-                            "line": line_index,
-                        }
-                    )
-
-    return write_outputs(
+    stats = write_outputs(
         words,
         output_dir,
         version=version,
@@ -91,4 +301,10 @@ def extract_words(
         spellcheck_languages=spellcheck_languages,
         legacy_version=legacy_version,
         source_pdf=str(pdf_path),
+        profiler=profiler,
     )
+    stats.update(collect_stats)
+    memory = profiler.memory_summary()
+    if memory is not None:
+        stats["memory"] = memory
+    return stats
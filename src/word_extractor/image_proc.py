@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
-from PIL import Image, ImageEnhance
+from PIL import Image, ImageEnhance, ImageStat
+
+LAYOUT_FILTER_MODES = ("off", "flag", "skip")
+
+# Thresholds for ``analyze_page_layout``, tuned on ~36 DPI thumbnails of
+# syllabus pages. Densities are fractions of dark pixels.
+_INK_THRESHOLD = 160
+_BLANK_DENSITY = 0.003
+_MIN_TEXT_ROWS = 8
+_ROW_INK_FRACTION = 0.01
+_GUTTER_INK_FRACTION = 0.005
+_GUTTER_SEARCH_FRACTION = 0.15
+_MIN_GUTTER_FRACTION = 0.02
+_MIN_COLUMN_BALANCE = 0.15
 
 
 def _validate_crop_ratios(crop_ratio_top: float, crop_ratio_bottom: float) -> None:
@@ -90,6 +104,128 @@ def preprocess_page(
     return split_columns(enhanced, split_offset=split_offset)
 
 
+@dataclass(frozen=True)
+class PageLayout:
+    """Cheap layout signature of a page thumbnail.
+
+    ``gutter_width`` is the widest run of blank pixel columns near the split
+    position, as a fraction of the page width; ``text_rows`` counts bands of
+    inked pixel rows. ``reason`` says why a page is not a two-column word list.
+    """
+
+    ink_density: float
+    left_density: float
+    right_density: float
+    gutter_width: float
+    text_rows: int
+    reason: str | None
+
+    @property
+    def is_word_list(self) -> bool:
+        return self.reason is None
+
+
+def _longest_run(values: list[int], limit: float) -> int:
+    longest = current = 0
+    for value in values:
+        current = current + 1 if value <= limit else 0
+        longest = max(longest, current)
+    return longest
+
+
+def _count_bands(values: list[int], limit: float) -> int:
+    bands = 0
+    inside = False
+    for value in values:
+        if value > limit and not inside:
+            bands += 1
+        inside = value > limit
+    return bands
+
+
+def analyze_page_layout(
+    image: Image.Image,
+    *,
+    crop_ratio_top: float = 0.07,
+    crop_ratio_bottom: float = 0.06,
+    split_offset: float = 0.0,
+) -> PageLayout:
+    """Classify a (low-resolution) page as a two-column word list or not.
+
+    Projection profiles come from box-filter resizes, so this stays cheap even
+    at full resolution; it is meant for ~36 DPI thumbnails.
+    """
+    cropped = crop_image(
+        image.convert("L"), crop_ratio_top=crop_ratio_top, crop_ratio_bottom=crop_ratio_bottom
+    )
+    width, height = cropped.size
+    mid = int(round((width / 2) + (width * split_offset)))
+    if mid <= 0 or mid >= width:
+        raise ValueError("split_offset results in an invalid split position.")
+
+    ink = cropped.point([255 if level < _INK_THRESHOLD else 0 for level in range(256)])
+    ink_density = ImageStat.Stat(ink).mean[0] / 255
+    columns = list(ink.resize((width, 1), Image.Resampling.BOX).tobytes())
+    rows = list(ink.resize((1, height), Image.Resampling.BOX).tobytes())
+    left_density = sum(columns[:mid]) / (mid * 255)
+    right_density = sum(columns[mid:]) / ((width - mid) * 255)
+
+    search = int(round(width * _GUTTER_SEARCH_FRACTION))
+    window = columns[max(0, mid - search) : min(width, mid + search)]
+    gutter_width = _longest_run(window, 255 * _GUTTER_INK_FRACTION) / width
+    text_rows = _count_bands(rows, 255 * _ROW_INK_FRACTION)
+
+    if ink_density < _BLANK_DENSITY:
+        reason: str | None = "blank"
+    elif text_rows < _MIN_TEXT_ROWS:
+        reason = "sparse"
+    elif min(left_density, right_density) < _MIN_COLUMN_BALANCE * max(left_density, right_density):
+        reason = "single_column"
+    elif gutter_width < _MIN_GUTTER_FRACTION:
+        reason = "no_gutter"
+    else:
+        reason = None
+    return PageLayout(
+        ink_density=ink_density,
+        left_density=left_density,
+        right_density=right_density,
+        gutter_width=gutter_width,
+        text_rows=text_rows,
+        reason=reason,
+    )
+
+
+def page_dhash(
+    image: Image.Image,
+    *,
+    hash_size: int = 16,
+    crop_ratio_top: float = 0.07,
+    crop_ratio_bottom: float = 0.06,
+) -> int:
+    """Difference hash of the page body as a ``hash_size**2``-bit integer.
+
+    Header and footer are cropped first so running page numbers do not keep
+    two copies of the same page apart. Works the same on thumbnails and full
+    renders, but only hashes of the same resolution should be compared. Flat
+    runs set their bit too, so the right ends of left-aligned words register
+    and not just the column edges every page shares.
+    """
+    cropped = crop_image(
+        image.convert("L"), crop_ratio_top=crop_ratio_top, crop_ratio_bottom=crop_ratio_bottom
+    )
+    pixels = cropped.resize((hash_size + 1, hash_size), Image.Resampling.BOX).tobytes()
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] >= pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(first: int, second: int) -> int:
+    return (first ^ second).bit_count()
+
+
 def save_debug_images(
     debug_dir: Path,
     page_number: int,
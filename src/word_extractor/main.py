@@ -3,19 +3,32 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import sqlite3
+import sys
 from datetime import date
 from pathlib import Path
+from typing import Any, cast
 
-from .core import extract_words
-from .output import add_words_to_db, export_words_to_csv
+from .batch import load_manifest, run_batch
+from .cleaner import MAX_VARIANTS_PER_LINE
+from .core import DEFAULT_DUPLICATE_THRESHOLD, extract_words
+from .image_proc import LAYOUT_FILTER_MODES
+from .output import EXPORT_FORMATS, IMPORT_FORMATS, add_words_to_db, export_words, import_words
+from .profiling import MemoryLimitExceeded, PipelineProfiler, format_bytes
 from .storage import (
+    build_search_index,
     detect_schema_mode,
+    drop_search_index,
+    drop_word_forms,
+    has_word_forms,
     list_versions,
     migrate_legacy_schema,
     normalize_version_key,
     set_default_version,
+    upgrade_versioned_schema,
 )
+from .watch import STATE_FILE_NAME, FolderWatcher, load_watch_settings
 
 
 def parse_args() -> argparse.Namespace:
@@ -63,8 +76,105 @@ def parse_args() -> argparse.Namespace:
         default=0.0,
         help="Column split offset as a fraction of page width (default: 0.0).",
     )
+    parser.add_argument(
+        "--max-variants-per-line",
+        type=int,
+        default=MAX_VARIANTS_PER_LINE,
+        help=f"Cap on variants expanded from one line (default: {MAX_VARIANTS_PER_LINE}).",
+    )
+    parser.add_argument(
+        "--layout-filter",
+        choices=LAYOUT_FILTER_MODES,
+        default="off",
+        help=(
+            "Classify pages from a low-DPI thumbnail first; 'flag' reports pages that do not "
+            "look like two-column word lists, 'skip' also leaves them out (default: off)."
+        ),
+    )
+    parser.add_argument(
+        "--thumbnail-dpi",
+        type=int,
+        default=36,
+        help="DPI of the layout-classification thumbnails (default: 36).",
+    )
+    parser.add_argument(
+        "--skip-duplicate-pages",
+        action="store_true",
+        help="Skip pages that are perceptual-hash near-duplicates of an earlier page.",
+    )
+    parser.add_argument(
+        "--duplicate-threshold",
+        type=int,
+        default=DEFAULT_DUPLICATE_THRESHOLD,
+        help=(
+            "Max differing hash bits (of 1024) for a page to count as a duplicate "
+            f"(default: {DEFAULT_DUPLICATE_THRESHOLD})."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a JSON report of per-stage, per-page and per-column timings to PATH.",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Record per-stage tracemalloc peak/retained memory and RSS growth.",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=_parse_size,
+        metavar="SIZE",
+        help="Abort with an error once process RSS exceeds SIZE (e.g. 1500M, 2G).",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        help="Drop OCR annotations whose confidence is below this value (0-1).",
+    )
 
     subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Extract many PDFs/page ranges/versions from a TOML or JSON manifest.",
+    )
+    batch_parser.add_argument(
+        "--manifest",
+        required=True,
+        help="Path to the batch manifest (.toml or .json).",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Concurrent extraction jobs (default: manifest workers, else min(4, CPUs)).",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Poll a folder and extract new or changed PDFs as they arrive.",
+    )
+    watch_parser.add_argument("--dir", required=True, help="Folder to watch for *.pdf files.")
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help="Seconds between polls (default: 5).",
+    )
+    watch_parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Process the current contents once and exit.",
+    )
+    watch_parser.add_argument(
+        "--state",
+        help=f"State file recording processed PDFs (default: <dir>/{STATE_FILE_NAME}).",
+    )
+    watch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Concurrent extraction jobs per PDF (default: 1).",
+    )
+
     add_parser = subparsers.add_parser(
         "add-words",
         help="Add words manually into the words.sqlite3 database.",
@@ -90,9 +200,53 @@ def parse_args() -> argparse.Namespace:
         help="Existing single-version data version when auto-migrating a legacy database.",
     )
 
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Import words from a CSV, JSONL or plain-text file (or stdin).",
+    )
+    import_parser.add_argument(
+        "--input",
+        default="-",
+        help="File to import; '-' reads stdin (default: -).",
+    )
+    import_parser.add_argument(
+        "--format",
+        choices=("auto", *IMPORT_FORMATS),
+        default="auto",
+        help="Input format (default: auto, from the file extension; stdin defaults to csv).",
+    )
+    import_parser.add_argument(
+        "--db-path",
+        default="output/words.sqlite3",
+        help="Path to words.sqlite3 (default: output/words.sqlite3).",
+    )
+    import_parser.add_argument(
+        "--version",
+        help="Vocabulary version for rows without a version column (e.g. 2026, 27考研).",
+    )
+    import_parser.add_argument(
+        "--legacy-version",
+        help="Existing single-version data version when auto-migrating a legacy database.",
+    )
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=5000,
+        help="Rows per transaction (default: 5000).",
+    )
+    import_parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help=(
+            "Relax journaling and syncing while importing for speed; a crash mid-import "
+            "can corrupt the database, so back it up first."
+        ),
+    )
+
     export_parser = subparsers.add_parser(
-        "export-csv",
-        help="Export words.sqlite3 data to a CSV file.",
+        "export",
+        aliases=["export-csv"],
+        help="Export words.sqlite3 data to a CSV, TSV, JSONL or word-list file.",
     )
     export_parser.add_argument(
         "--db-path",
@@ -100,8 +254,21 @@ def parse_args() -> argparse.Namespace:
         help="Path to words.sqlite3 (default: output/words.sqlite3).",
     )
     export_parser.add_argument(
+        "--output",
         "--csv-path",
-        help="CSV output path (default: words/YYYY-MM-DD.csv).",
+        dest="output",
+        help="Output path, or '-' for stdout (default: words/YYYY-MM-DD.<format>).",
+    )
+    export_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="csv",
+        help="Output format; txt writes one word per line (default: csv).",
+    )
+    export_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip-compress the output.",
     )
     export_parser.add_argument(
         "--columns",
@@ -157,9 +324,112 @@ def parse_args() -> argparse.Namespace:
         help="Version to mark as default (e.g. 2027, 27考研).",
     )
 
+    upgrade_parser = subparsers.add_parser(
+        "upgrade-db",
+        help="Add newer columns and indexes (suffix search, normalized lookup) to an existing database.",
+    )
+    upgrade_parser.add_argument(
+        "--db-path",
+        default="output/words.sqlite3",
+        help="Path to words.sqlite3 (default: output/words.sqlite3).",
+    )
+    word_forms_group = upgrade_parser.add_mutually_exclusive_group()
+    word_forms_group.add_argument(
+        "--word-forms",
+        action="store_true",
+        help=(
+            "Also build the word_forms table of inflected forms, which speeds up inflection "
+            "lookups but grows the database and slows later writes."
+        ),
+    )
+    word_forms_group.add_argument(
+        "--drop-word-forms",
+        action="store_true",
+        help="Remove the word_forms table; lookups then compute inflections at query time.",
+    )
+
+    search_index_parser = subparsers.add_parser(
+        "build-search-index",
+        help="Build a trigram index that speeds up contains/suffix/wildcard searches.",
+    )
+    search_index_parser.add_argument(
+        "--db-path",
+        default="output/words.sqlite3",
+        help="Path to words.sqlite3 (default: output/words.sqlite3).",
+    )
+    search_index_parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="Remove the index and its triggers instead.",
+    )
+
     return parser.parse_args()
 
 
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def _parse_size(value: str) -> int:
+    text = value.strip().upper().removesuffix("IB").removesuffix("B")
+    unit = text[-1:] if text[-1:] in _SIZE_UNITS else ""
+    number = text[: len(text) - len(unit)]
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value!r} (e.g. 512M, 2G).") from exc
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"Size must be positive: {value!r}.")
+    return size
+
+
+def _detect_import_format(input_path: str, requested: str) -> str:
+    if requested != "auto":
+        return requested
+    path = Path(input_path)
+    if path.suffix.lower() == ".gz":
+        path = path.with_suffix("")
+    suffix = path.suffix.lower()
+    if suffix in {".jsonl", ".ndjson"}:
+        return "jsonl"
+    if suffix == ".tsv":
+        return "tsv"
+    if suffix == ".txt":
+        return "txt"
+    return "csv"
+
+
+def _print_batch_event(event: dict[str, object]) -> None:
+    if event["event"] == "job":
+        label = f"{event['pdf']} pages {event['pages']} -> {event['version']}"
+        if "error" in event:
+            print(f"[job] {label}: failed: {event['error']}")
+        else:
+            print(f"[job] {label}: {event['word_count']} word(s)")
+        return
+    if "error" in event:
+        print(f"[version] {event['version']}: {event['error']}")
+    else:
+        print(
+            f"[version] {event['version']}: {event['unique_count']} unique word(s), "
+            f"{event['written_count']} written, {event['rejected_count']} rejected"
+        )
+
+
+def _print_watch_event(event: dict[str, object]) -> None:
+    kind = event["event"]
+    if kind == "warning":
+        print(f"[warning] {event['message']}")
+    elif kind == "start":
+        print(f"[watch] extracting {event['pdf']}")
+    elif kind == "done":
+        status = f"failed: {event['error']}" if "error" in event else "done"
+        if event.get("failed_count"):
+            status = "failed"
+        print(f"[watch] {event['pdf']}: {status}")
+    else:
+        _print_batch_event(event)
+
+
 def main() -> None:
     args = parse_args()
     if args.command == "add-words":
@@ -192,25 +462,102 @@ def main() -> None:
             "duplicates: {duplicate_count}).".format(**stats)
         )
         return
-    if args.command == "export-csv":
+    if args.command == "batch":
+        try:
+            manifest = load_manifest(Path(args.manifest))
+            result = run_batch(manifest, workers=args.workers, on_event=_print_batch_event)
+        except (sqlite3.Error, ValueError) as exc:
+            raise SystemExit(str(exc)) from exc
+        if result["failed_count"]:
+            failed = ", ".join(cast(list[str], result["failed_versions"]))
+            raise SystemExit(
+                f"{result['failed_count']} batch job(s) or version write(s) failed; "
+                f"version(s) not written: {failed}"
+            )
+        return
+    if args.command == "watch":
+        directory = Path(args.dir)
+        if not directory.is_dir():
+            raise SystemExit(f"Watch folder not found: {directory}")
+        try:
+            watcher = FolderWatcher(
+                directory,
+                state_path=Path(args.state) if args.state else None,
+                workers=args.workers,
+                on_event=_print_watch_event,
+            )
+            settings, _ = load_watch_settings(directory)
+            watcher.warm_up(spellcheck=bool(settings.get("spellcheck", True)))
+            watcher.run(interval=args.interval, once=args.once)
+        except (sqlite3.Error, ValueError) as exc:
+            raise SystemExit(str(exc)) from exc
+        except KeyboardInterrupt:
+            print("Stopped watching.")
+        return
+    if args.command == "import":
+        fmt = _detect_import_format(args.input, args.format)
+        try:
+            if args.input == "-":
+                stats = import_words(
+                    sys.stdin,
+                    db_path=Path(args.db_path),
+                    fmt=fmt,
+                    version=args.version,
+                    legacy_version=args.legacy_version,
+                    batch_size=args.batch_size,
+                    bulk=args.bulk,
+                )
+            else:
+                input_path = Path(args.input)
+                if not input_path.exists():
+                    raise SystemExit(f"Input file not found: {input_path}")
+                opener = gzip.open if input_path.suffix.lower() == ".gz" else open
+                with opener(input_path, "rt", encoding="utf-8", newline="") as handle:
+                    stats = import_words(
+                        handle,
+                        db_path=Path(args.db_path),
+                        fmt=fmt,
+                        version=args.version,
+                        legacy_version=args.legacy_version,
+                        batch_size=args.batch_size,
+                        bulk=args.bulk,
+                    )
+        except (sqlite3.Error, ValueError) as exc:
+            raise SystemExit(str(exc)) from exc
+        versions = ", ".join(sorted(cast(dict[str, int], stats["versions"]))) or "none"
+        print(
+            f"Imported {stats['row_count']} of {stats['rows_read']} row(s) into version(s) "
+            f"{versions} in "
+            f"{stats['elapsed_seconds']:.2f}s ({stats['rows_per_second']:.0f} rows/s, "
+            f"{stats['batch_count']} batch(es))."
+        )
+        return
+    if args.command in {"export", "export-csv"}:
         columns = [col.strip() for col in str(args.columns).split(",") if col.strip()]
         if not columns:
             raise SystemExit("--columns must include at least one column name.")
-        csv_path = (
-            Path(args.csv_path)
-            if args.csv_path
-            else Path("words") / f"{date.today().isoformat()}.csv"
-        )
+        suffix = f".{args.format}" + (".gz" if args.gzip else "")
+        if args.output == "-":
+            output_path = None
+        elif args.output:
+            output_path = Path(args.output)
+        else:
+            output_path = Path("words") / f"{date.today().isoformat()}{suffix}"
         try:
-            stats = export_words_to_csv(
+            stats = export_words(
                 Path(args.db_path),
-                csv_path,
+                output_path,
                 columns,
                 version=args.version,
+                fmt=args.format,
+                compress=args.gzip,
             )
         except (FileNotFoundError, ValueError) as exc:
             raise SystemExit(str(exc)) from exc
-        print(f"Exported {stats['row_count']} row(s) to {stats['csv_path']}.")
+        if output_path is None:
+            print(f"Exported {stats['row_count']} row(s) to stdout.", file=sys.stderr)
+        else:
+            print(f"Exported {stats['row_count']} row(s) to {stats['path']}.")
         return
     if args.command == "migrate-db":
         db_path = Path(args.db_path)
@@ -266,25 +613,114 @@ def main() -> None:
             raise SystemExit(str(exc)) from exc
         print(f"Default version set to {row['version']}.")
         return
+    if args.command == "upgrade-db":
+        db_path = Path(args.db_path)
+        if not db_path.exists():
+            raise SystemExit(f"Database not found: {db_path}")
+        try:
+            with sqlite3.connect(db_path) as conn:
+                schema_mode = detect_schema_mode(conn)
+                if schema_mode == "legacy":
+                    raise SystemExit("Legacy single-version schema; run migrate-db first.")
+                if schema_mode != "versioned":
+                    raise SystemExit("Unsupported words schema.")
+                applied = upgrade_versioned_schema(conn, backfill=True, word_forms=args.word_forms)
+                if args.drop_word_forms and has_word_forms(conn):
+                    drop_word_forms(conn)
+                    applied.append("drop_word_forms")
+        except sqlite3.Error as exc:
+            raise SystemExit(f"SQLite error: {exc}") from exc
+        if applied:
+            print(f"Database {db_path} upgraded: {', '.join(applied)}.")
+        else:
+            print(f"Database {db_path} is already up to date.")
+        return
+    if args.command == "build-search-index":
+        db_path = Path(args.db_path)
+        if not db_path.exists():
+            raise SystemExit(f"Database not found: {db_path}")
+        try:
+            with sqlite3.connect(db_path) as conn:
+                if args.drop:
+                    drop_search_index(conn)
+                else:
+                    indexed = build_search_index(conn)
+        except (sqlite3.Error, ValueError) as exc:
+            raise SystemExit(str(exc)) from exc
+        if args.drop:
+            print(f"Search index removed from {db_path}.")
+        else:
+            print(f"Search index built over {indexed} word(s) in {db_path}.")
+        return
 
     missing = [name for name in ("pdf", "start_page", "end_page") if getattr(args, name) is None]
     if missing:
         raise SystemExit("--pdf, --start-page, and --end-page are required for extraction.")
     if args.version is None:
         raise SystemExit("--version is required for extraction.")
-    extract_words(
-        pdf_path=Path(args.pdf),
-        start_page=args.start_page,
-        end_page=args.end_page,
-        output_dir=Path(args.output_dir),
-        debug_dir=Path(args.debug_dir) if args.debug_dir else None,
-        version=args.version,
-        split_offset=args.split_offset,
-        spellcheck=args.spellcheck,
-        spellcheck_rejected=args.spellcheck_rejected,
-        spellcheck_languages=args.spellcheck_language,
-        legacy_version=args.legacy_version,
-    )
+    profiler = None
+    if args.profile or args.track_memory or args.max_memory is not None:
+        profiler = PipelineProfiler(
+            track_memory=args.track_memory, max_memory_bytes=args.max_memory
+        )
+    try:
+        stats = extract_words(
+            pdf_path=Path(args.pdf),
+            start_page=args.start_page,
+            end_page=args.end_page,
+            output_dir=Path(args.output_dir),
+            debug_dir=Path(args.debug_dir) if args.debug_dir else None,
+            version=args.version,
+            split_offset=args.split_offset,
+            spellcheck=args.spellcheck,
+            spellcheck_rejected=args.spellcheck_rejected,
+            spellcheck_languages=args.spellcheck_language,
+            legacy_version=args.legacy_version,
+            max_variants_per_line=args.max_variants_per_line,
+            min_confidence=args.min_confidence,
+            layout_filter=args.layout_filter,
+            thumbnail_dpi=args.thumbnail_dpi,
+            skip_duplicate_pages=args.skip_duplicate_pages,
+            duplicate_threshold=args.duplicate_threshold,
+            profiler=profiler,
+        )
+    except MemoryLimitExceeded as exc:
+        if profiler is not None and args.profile:
+            profiler.write_report(Path(args.profile))
+        raise SystemExit(str(exc)) from exc
+    finally:
+        if profiler is not None:
+            profiler.close()
+    if "layout" in stats:
+        layout = cast(dict[str, Any], stats["layout"])
+        flagged = ", ".join(
+            f"{entry['page']} ({entry['reason']})" for entry in layout["flagged_pages"]
+        )
+        print(
+            f"Layout: {len(layout['flagged_pages'])} page(s) flagged"
+            + (f": {flagged}" if flagged else "")
+            + f"; {layout['skipped_count']} skipped, "
+            f"~{layout['estimated_seconds_saved']:.1f}s saved "
+            f"(thumbnail pass {layout['thumbnail_seconds']:.1f}s)"
+        )
+    if "duplicate_pages" in stats:
+        duplicates = cast(list[dict[str, int]], stats["duplicate_pages"])
+        listed = ", ".join(f"{entry['page']} (= {entry['duplicate_of']})" for entry in duplicates)
+        print(f"Duplicates: {len(duplicates)} page(s) skipped" + (f": {listed}" if listed else ""))
+    if profiler is None:
+        return
+    if args.track_memory:
+        memory = cast(dict[str, Any], stats["memory"])
+        stage_peaks = ", ".join(
+            f"{name} {format_bytes(entry['peak_bytes'])}"
+            for name, entry in memory["stages"].items()
+        )
+        rss = memory["rss_peak_bytes"]
+        rss_text = format_bytes(rss) if rss is not None else "n/a"
+        print(f"Memory: process RSS peak {rss_text} | traced peaks: {stage_peaks}")
+    if args.profile:
+        report = profiler.write_report(Path(args.profile))
+        print(f"{profiler.summary_line(report)} -> {args.profile}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+"""Spelling normalization shared by the writers and the lookup engine."""
+
+from __future__ import annotations
+
+import re
+
+# Pairs the suffix rules below cannot derive, keyed by the British spelling.
+_SPELLING_PAIRS = {
+    "aeroplane": "airplane",
+    "aluminium": "aluminum",
+    "cheque": "check",
+    "clamour": "clamor",
+    "cosy": "cozy",
+    "defence": "defense",
+    "draught": "draft",
+    "enrol": "enroll",
+    "fulfil": "fulfill",
+    "grey": "gray",
+    "jewellery": "jewelry",
+    "judgement": "judgment",
+    "licence": "license",
+    "mould": "mold",
+    "moustache": "mustache",
+    "offence": "offense",
+    "plough": "plow",
+    "practise": "practice",
+    "pretence": "pretense",
+    "programme": "program",
+    "pyjamas": "pajamas",
+    "sceptic": "skeptic",
+    "sceptical": "skeptical",
+    "skilful": "skillful",
+    "storey": "story",
+    "tyre": "tire",
+    "wilful": "willful",
+}
+
+# British -> American suffix rules. Each needs a few letters before the match
+# so that short words which only look British ("four", "rogue") keep their
+# own key; folding only has to avoid merging two distinct real words.
+_SPELLING_RULES = (
+    # colour, favourite, neighbourhood -> color, favorite, neighborhood. Only
+    # at the end of the word or before a known suffix, and not after the stems
+    # of scour, flour, devour, detour, contour, (gl)amour, velour, troubadour.
+    (
+        re.compile(
+            r"(?<=[a-z]{2})(?<!sc)(?<!fl)(?<!ev)(?<!et)(?<!nt)(?<!am)(?<!el)(?<!ad)"
+            r"our(?=(?:s|ed|ing|er|ers|ite|ites|al|ally|ful|less|able|ably|hood|hoods|y)?$)"
+        ),
+        "or",
+    ),
+    # realise, organisation -> realize, organization
+    (re.compile(r"(?<=[a-z]{3})is(e|ed|es|er|ers|ing|ation|ations)$"), r"iz\1"),
+    # analyse, analysed -> analyze, analyzed; "analyses" is left alone because it
+    # is also the plural of "analysis"
+    (re.compile(r"(?<=[a-z]{3})ys(e|ed|er|ers|ing)$"), r"yz\1"),
+    # centre, fibres -> center, fibers (but not "timbre" -> "timber")
+    (re.compile(r"(?<=[a-z][^m])([tb])re(s?)$"), r"\1er\2"),
+    # travelled, cancelling -> traveled, canceling (but not "filled" -> "filed")
+    (re.compile(r"(?<=[a-z]{3}[aeiou])ll(ed|ing|er|ers)$"), r"l\1"),
+    # catalogue, dialogues -> catalog, dialogs
+    (re.compile(r"(?<=[a-z]{3})ogue(s?)$"), r"og\1"),
+)
+
+_NON_LETTERS_RE = re.compile(r"[^a-z]+")
+
+
+def norm_key(text: str) -> str:
+    """Key that is equal for spellings differing in case, hyphens, spaces or British/American form.
+
+    ``"Colour"``, ``"color"`` and ``"co-lour"`` all become ``"color"``; the key is
+    only meant for equality lookups, not for display.
+    """
+    key = _NON_LETTERS_RE.sub("", text.lower())
+    key = _SPELLING_PAIRS.get(key, key)
+    for pattern, replacement in _SPELLING_RULES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+# Irregular verbs and adjectives: headword followed by its irregular forms. The
+# regular -s and -ing forms are still generated, the regular -ed/-er forms are
+# not (list them here where both are in use, e.g. "dreamed").
+_IRREGULAR_FORMS = """
+arise arose arisen; awake awoke awoken; bad worse worst; be was were been am is are;
+bear bore borne born; beat beaten; become became; begin began begun; bend bent;
+bind bound; bite bit bitten; bleed bled; blow blew blown; break broke broken;
+breed bred; bring brought; build built; burn burnt burned; buy bought; catch caught;
+choose chose chosen; cling clung; come came; creep crept; deal dealt; dig dug;
+do did done does; draw drew drawn; dream dreamt dreamed; drink drank drunk;
+drive drove driven; eat ate eaten; fall fell fallen; far farther further farthest furthest;
+feed fed; feel felt; fight fought; find found; flee fled; fling flung; fly flew flown;
+forbid forbade forbidden; forget forgot forgotten; forgive forgave forgiven;
+freeze froze frozen; get got gotten; give gave given; go went gone goes; good better best;
+grind ground; grow grew grown; hang hung hanged; have has had; hear heard; hide hid hidden;
+hold held; ill worse worst; keep kept; kneel knelt; know knew known; lay laid; lead led;
+lean leant leaned; leap leapt leaped; learn learnt learned; leave left; lend lent;
+lie lay lain lied; light lit lighted; little less least; lose lost; make made;
+many more most; mean meant; meet met; mislead misled; mistake mistook mistaken;
+much more most; overcome overcame; overtake overtook overtaken; pay paid; prove proven proved;
+ride rode ridden; ring rang rung; rise rose risen; run ran; say said; see saw seen;
+seek sought; sell sold; send sent; sew sewn sewed; shake shook shaken; shine shone;
+shoot shot; show shown showed; shrink shrank shrunk; sing sang sung; sink sank sunk;
+sit sat; sleep slept; slide slid; sow sown sowed; speak spoke spoken; speed sped;
+spell spelt spelled; spend spent; spill spilt spilled; spin spun; spit spat;
+spoil spoilt spoiled; spring sprang sprung; stand stood; steal stole stolen; stick stuck;
+sting stung; stink stank stunk; strike struck stricken; strive strove striven;
+swear swore sworn; sweep swept; swell swollen swelled; swim swam swum; swing swung;
+take took taken; teach taught; tear tore torn; tell told; think thought; throw threw thrown;
+tread trod trodden; undergo underwent undergone; understand understood;
+undertake undertook undertaken; wake woke woken; wear wore worn; weave wove woven;
+weep wept; well better best; win won; wind wound; withdraw withdrew withdrawn;
+withstand withstood; write wrote written
+"""
+
+_IRREGULAR_PLURALS = """
+analysis analyses; antenna antennae; appendix appendices; axis axes; bacterium bacteria;
+basis bases; cactus cacti; child children; crisis crises; criterion criteria;
+curriculum curricula; datum data; foot feet; formula formulae formulas; fungus fungi;
+goose geese; hypothesis hypotheses; index indices indexes; matrix matrices; medium media;
+mouse mice; nucleus nuclei; ox oxen; person people; phenomenon phenomena; radius radii;
+stimulus stimuli; syllabus syllabi syllabuses; thesis theses; tooth teeth
+"""
+
+# Adjectives that take -er/-est. Deriving comparatives from word shape alone
+# also turns verbs and nouns into false agent nouns ("walker", "booker"), so
+# only listed adjectives get them.
+_GRADABLE_ADJECTIVES = """
+angry big bitter black blue bold brave brief bright broad brown busy calm cheap clean clear
+clever close cold cool crazy cruel dark deep dirty dry dull early easy empty fair fast fat
+few fine firm fit flat free fresh friendly full funny gentle great green happy hard harsh healthy
+heavy high hot huge humble hungry keen kind large late lazy light likely long loose loud
+lovely low lucky mad mild narrow near neat new nice noble noisy odd old pale plain polite
+poor pretty proud pure quick quiet rare raw rich rough rude sad safe shallow sharp short shy
+silly simple slim slow small smart smooth soft solid sour steep strange strict strong stupid
+subtle sure sweet tall thick thin tidy tight tiny tough true ugly warm weak wealthy weird wet
+white wide wild wise young
+"""
+
+
+def _parse_forms(table: str) -> dict[str, tuple[str, ...]]:
+    entries = (entry.split() for entry in table.split(";"))
+    return {words[0]: tuple(words[1:]) for words in entries if words}
+
+
+_IRREGULAR = _parse_forms(_IRREGULAR_FORMS)
+_PLURALS = _parse_forms(_IRREGULAR_PLURALS)
+_GRADABLE = frozenset(_GRADABLE_ADJECTIVES.split())
+_VOWELS = frozenset("aeiou")
+_SYLLABLE_RE = re.compile(r"[aeiouy]+")
+
+
+def _syllables(word: str) -> int:
+    count = len(_SYLLABLE_RE.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def _doubles_final_consonant(word: str) -> bool:
+    """Ends consonant-vowel-consonant, as in stop -> stopped or admit -> admitted."""
+    return (
+        len(word) >= 3
+        and word[-1] not in _VOWELS
+        and word[-1] not in "wxy"
+        and word[-2] in _VOWELS
+        and word[-3] not in _VOWELS
+    )
+
+
+def _s_forms(word: str) -> set[str]:
+    """Plural and third-person singular."""
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        forms = {word + "es"}
+        if word.endswith("is") and len(word) > 4:
+            forms.add(word[:-2] + "es")
+        return forms
+    if word.endswith("y") and word[-2:-1] not in _VOWELS:
+        return {word[:-1] + "ies"}
+    if word.endswith("fe"):
+        return {word + "s", word[:-2] + "ves"}
+    if word.endswith("f"):
+        return {word + "s", word[:-1] + "ves"}
+    if word.endswith("o") and word[-2:-1] not in _VOWELS:
+        return {word + "s", word + "es"}
+    if word.endswith("man") and len(word) > 4:
+        return {word + "s", word[:-3] + "men"}
+    return {word + "s"}
+
+
+def _suffixed(word: str, suffixes: tuple[str, ...]) -> set[str]:
+    """Attach vowel-initial ``suffixes`` (-ed/-ing or -er/-est) with the usual spelling changes."""
+    if word.endswith("ie"):
+        return {word[:-2] + "ying" if suffix == "ing" else word + suffix[1:] for suffix in suffixes}
+    if word.endswith("e"):
+        keep_e = word.endswith(("ee", "ye", "oe"))
+        return {
+            word + suffix if suffix == "ing" and keep_e else word[:-1] + suffix
+            for suffix in suffixes
+        }
+    if word.endswith("y") and word[-2:-1] not in _VOWELS:
+        return {
+            word + suffix if suffix == "ing" else word[:-1] + "i" + suffix for suffix in suffixes
+        }
+    if word.endswith("c"):
+        return {stem + suffix for stem in (word, word + "k") for suffix in suffixes}
+    if _doubles_final_consonant(word):
+        doubled = {word + word[-1] + suffix for suffix in suffixes}
+        if _syllables(word) == 1:
+            return doubled
+        # Stress decides (admitted, visited); both spellings are harmless as keys.
+        return doubled | {word + suffix for suffix in suffixes}
+    return {word + suffix for suffix in suffixes}
+
+
+def inflections(word: str) -> list[str]:
+    """Inflected forms of ``word``, sorted and without ``word`` itself.
+
+    Covers plurals and -s, -ed and -ing with the usual spelling changes, -er
+    and -est for a list of common adjectives, plus tables of irregular verbs,
+    adjectives and plurals. The rules do not know the part of speech, so they
+    over-generate ("tables" but also "tabling"); the forms are only used to
+    map a looked-up word back to a stored headword, where an extra form is
+    harmless.
+    """
+    if len(word) < 2 or not word.isascii() or not word[-1].isalpha():
+        return []
+    forms = _s_forms(word) | _suffixed(word, ("ing",))
+    forms.update(_PLURALS.get(word, ()))
+    if word in _IRREGULAR:
+        forms.update(_IRREGULAR[word])
+    else:
+        forms |= _suffixed(word, ("ed",))
+    if word in _GRADABLE:
+        forms |= _suffixed(word, ("er", "est"))
+    forms.discard(word)
+    return sorted(forms)
+
+
+# Suffixes stripped by ``headword_candidates`` and what may replace them.
+_STEM_SUFFIXES = (
+    ("ies", "y"),
+    ("ied", "y"),
+    ("ier", "y"),
+    ("iest", "y"),
+    ("ying", "ie"),
+    ("ves", "f"),
+    ("ves", "fe"),
+    ("men", "man"),
+    ("es", ""),
+    ("es", "is"),
+    ("s", ""),
+    ("ed", ""),
+    ("ed", "e"),
+    ("d", ""),
+    ("ing", ""),
+    ("ing", "e"),
+    ("er", ""),
+    ("er", "e"),
+    ("est", ""),
+    ("est", "e"),
+)
+
+
+def _irregular_headwords() -> dict[str, tuple[str, ...]]:
+    headwords: dict[str, list[str]] = {}
+    for table in (_IRREGULAR, _PLURALS):
+        for word, forms in table.items():
+            for form in forms:
+                headwords.setdefault(form, []).append(word)
+    return {form: tuple(words) for form, words in headwords.items()}
+
+
+_IRREGULAR_HEADWORDS = _irregular_headwords()
+
+
+def headword_candidates(form: str) -> list[str]:
+    """Words whose ``inflections`` include ``form``, sorted; the inverse of ``inflections``.
+
+    Lets a lookup resolve "abandoned" to "abandon" without a precomputed
+    ``word_forms`` table: suffixes are stripped generously and every candidate
+    is confirmed by generating its forms.
+    """
+    if len(form) < 2 or not form.isascii():
+        return []
+    candidates = set(_IRREGULAR_HEADWORDS.get(form, ()))
+    for suffix, replacement in _STEM_SUFFIXES:
+        if not form.endswith(suffix) or len(form) <= len(suffix):
+            continue
+        stem = form[: -len(suffix)]
+        candidates.add(stem + replacement)
+        if len(stem) > 2 and (stem[-1] == stem[-2] or stem.endswith("ck")):
+            # stopped -> stop, bigger -> big, panicked -> panic
+            candidates.add(stem[:-1])
+    candidates.discard(form)
+    return sorted(word for word in candidates if form in inflections(word))
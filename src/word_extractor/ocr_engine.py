@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import Any, Iterable, Sequence
 
 from PIL import Image
 
+# Neither ocrmac nor the Vision/LiveText calls behind it are documented as safe
+# to use from several threads at once, so recognition is serialized like
+# PDFium; batch workers still overlap rendering, preprocessing and cleaning.
+_OCR_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class OCRAnnotation:
@@ -49,7 +55,10 @@ def run_ocr(
     framework: str = "vision",
     unit: str | None = None,
 ) -> list[OCRAnnotation]:
-    """Run OCR on a PIL image and return normalized annotations."""
+    """Run OCR on a PIL image and return normalized annotations.
+
+    Safe to call from several threads; the backend itself runs one image at a time.
+    """
     ocrmac_module = _load_ocrmac()
     ocr_kwargs: dict[str, Any] = {"framework": framework}
     if language_preference is not None:
@@ -57,12 +66,13 @@ def run_ocr(
     if framework != "livetext":
         ocr_kwargs["recognition_level"] = recognition_level
 
-    ocr_instance = ocrmac_module.OCR(image, **ocr_kwargs)
-    if unit is None:
-        raw_annotations = ocr_instance.recognize()
-    else:
-        try:
-            raw_annotations = ocr_instance.recognize(unit=unit)  # type: ignore[call-arg]
-        except TypeError:
+    with _OCR_LOCK:
+        ocr_instance = ocrmac_module.OCR(image, **ocr_kwargs)
+        if unit is None:
             raw_annotations = ocr_instance.recognize()
+        else:
+            try:
+                raw_annotations = ocr_instance.recognize(unit=unit)  # type: ignore[call-arg]
+            except TypeError:
+                raw_annotations = ocr_instance.recognize()
     return _normalize_annotations(raw_annotations)
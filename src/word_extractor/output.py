@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import importlib
-import re
+import io
+import json
 import sqlite3
+import sys
+import time
 import warnings
 from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence, cast
+from typing import IO, Any, Iterable, Iterator, Mapping, Sequence, TextIO, cast
 
+from .morphology import norm_key
+from .profiling import PipelineProfiler
 from .storage import (
     detect_schema_mode,
     ensure_version_row,
     ensure_writable_schema,
+    fill_word_forms,
+    has_word_forms,
     normalize_version_key,
+    reversed_word,
     table_columns,
 )
 
@@ -27,6 +38,26 @@ except Exception as exc:  # pragma: no cover - platform import guard
 else:
     _NSSPELLCHECKER_IMPORT_ERROR = None
 
+# Connection settings applied only while a bulk load runs. They trade crash
+# durability for throughput, so they are restored as soon as the load commits.
+BULK_LOAD_PRAGMAS: tuple[tuple[str, str], ...] = (
+    ("journal_mode", "MEMORY"),
+    ("synchronous", "OFF"),
+    ("cache_size", "-65536"),
+)
+
+# Equivalent to ``source=COALESCE(words.source, excluded.source)``, but the
+# WHERE clause skips the update entirely when it would not change the row, so
+# re-imports only write new words or newly filled sources.
+_UPSERT_CLAUSE = """
+    ON CONFLICT(version_id, word) DO UPDATE SET source=excluded.source
+    WHERE words.source IS NULL AND excluded.source IS NOT NULL
+"""
+
+IMPORT_FORMATS = ("csv", "tsv", "jsonl", "txt")
+EXPORT_FORMATS = ("csv", "tsv", "jsonl", "txt")
+EXPORT_FETCH_SIZE = 5000
+
 
 def _ensure_spellchecker_available() -> Any:
     if Cocoa is None:
@@ -38,6 +69,13 @@ def _ensure_spellchecker_available() -> Any:
 
 
 def _is_word_spelled_correctly(word: str, *, languages: Sequence[str]) -> bool:
+    return _check_spelling(word, tuple(languages))
+
+
+@lru_cache(maxsize=65536)
+def _check_spelling(word: str, languages: tuple[str, ...]) -> bool:
+    # Vocabulary repeats heavily across pages and syllabus years, so verdicts
+    # are cached for the life of the process.
     cocoa = _ensure_spellchecker_available()
     checker = cocoa.NSSpellChecker.sharedSpellChecker()
     available = set(checker.availableLanguages())
@@ -51,68 +89,165 @@ def _is_word_spelled_correctly(word: str, *, languages: Sequence[str]) -> bool:
     return False
 
 
-def _normalize_words(
-    words: Iterable[str | Mapping[str, object]],
-) -> list[dict[str, object]]:
-    normalized: list[dict[str, object]] = []
-    for item in words:
-        if isinstance(item, str):
-            normalized.append({"word": item})
-        else:
-            normalized.append(dict(item))
-    return normalized
-
-
 def _canonicalize_word(word: str) -> str:
-    normalized = re.sub(r"\s+", " ", word.strip())
-    return normalized.lower()
-
-
-def _compute_stats(words: list[dict[str, object]]) -> dict[str, object]:
-    word_values = [_canonicalize_word(str(item.get("word", ""))) for item in words]
-    total_count = len(word_values)
-    unique_count = len(set(word_values))
-    duplicate_count = total_count - unique_count
-
-    page_counts: dict[int, int] = {}
-    pages = [item.get("page") for item in words if item.get("page") is not None]
-    if pages:
-        counter = Counter(int(str(page)) for page in pages)
-        page_counts = dict(sorted(counter.items()))
-
-    return {
-        "total_count": total_count,
-        "unique_count": unique_count,
-        "duplicate_count": duplicate_count,
-        "per_page_counts": page_counts,
-    }
+    return " ".join(word.split()).lower()
+
+
+class StatsAccumulator:
+    """Incrementally collect output stats while words stream through a writer.
+
+    ``add`` expects words that are already canonicalized, so each word is
+    normalized exactly once on its way to the database.
+    """
+
+    def __init__(self) -> None:
+        self.total_count = 0
+        self.rejected_count = 0
+        self._unique_words: set[str] = set()
+        self._page_counts: Counter[int] = Counter()
+        self._column_counts: Counter[str] = Counter()
+        self._rejected_page_counts: Counter[int] = Counter()
+
+    def add(self, word: str, *, page: object = None, column: object = None) -> None:
+        self.total_count += 1
+        self._unique_words.add(word)
+        if page is not None:
+            self._page_counts[int(str(page))] += 1
+        if column is not None:
+            self._column_counts[str(column)] += 1
+
+    def add_rejected(self, *, page: object = None) -> None:
+        self.rejected_count += 1
+        if page is not None:
+            self._rejected_page_counts[int(str(page))] += 1
+
+    def as_dict(self) -> dict[str, object]:
+        unique_count = len(self._unique_words)
+        return {
+            "total_count": self.total_count,
+            "unique_count": unique_count,
+            "duplicate_count": self.total_count - unique_count,
+            "per_page_counts": dict(sorted(self._page_counts.items())),
+            "per_column_counts": dict(sorted(self._column_counts.items())),
+            "rejected_count": self.rejected_count,
+            "rejected_per_page_counts": dict(sorted(self._rejected_page_counts.items())),
+        }
+
+
+def _canonical_row(
+    record: Mapping[str, object], default_source: str | None
+) -> tuple[str, str | None] | None:
+    """Canonical ``(word, source)`` for a record, or ``None`` when the word is blank."""
+    word = _canonicalize_word(str(record.get("word") or ""))
+    if not word:
+        return None
+    source_value = record.get("source")
+    if source_value is None or not str(source_value).strip():
+        source_value = default_source
+    return word, str(source_value).strip() if source_value is not None else None
+
+
+def _collect_row(rows: dict[str, str | None], word: str, source: str | None) -> None:
+    """Collapse duplicate words in memory; the first non-null source wins."""
+    if rows.get(word) is None:
+        rows[word] = source
+
+
+@contextmanager
+def _bulk_load_pragmas(conn: sqlite3.Connection) -> Iterator[None]:
+    """Apply ``BULK_LOAD_PRAGMAS`` and restore the previous values on exit."""
+    previous: list[tuple[str, object]] = []
+    for name, value in BULK_LOAD_PRAGMAS:
+        row = conn.execute(f"PRAGMA {name}").fetchone()
+        previous.append((name, row[0] if row is not None else None))
+        conn.execute(f"PRAGMA {name} = {value}")
+    try:
+        yield
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        for name, value in reversed(previous):
+            if value is not None:
+                conn.execute(f"PRAGMA {name} = {value}")
+
+
+def _merge_staged_rows(
+    conn: sqlite3.Connection,
+    version_id: int,
+    rows: Iterable[tuple[str, str | None]],
+) -> int:
+    conn.execute("DROP TABLE IF EXISTS temp.words_stage")
+    conn.execute(
+        """
+        CREATE TEMP TABLE words_stage (
+            word TEXT NOT NULL, source TEXT, reversed_word TEXT, norm_key TEXT
+        )
+        """
+    )
+    conn.executemany(
+        "INSERT INTO temp.words_stage (word, source, reversed_word, norm_key) VALUES (?, ?, ?, ?)",
+        ((word, source, reversed_word(word), norm_key(word)) for word, source in rows),
+    )
+    # Merge in index order; rowid keeps input order among duplicates so the
+    # first non-null source still wins, exactly like the row-by-row upsert.
+    written = conn.execute(
+        f"""
+        INSERT INTO words (version_id, word, source, reversed_word, norm_key)
+        SELECT ?, word, source, reversed_word, norm_key FROM temp.words_stage WHERE true
+        ORDER BY word, rowid
+        {_UPSERT_CLAUSE}
+        """,
+        (version_id,),
+    ).rowcount
+    conn.execute("DROP TABLE temp.words_stage")
+    return written
 
 
 def _write_words_db(
     db_path: Path,
-    rows: Sequence[tuple[str, str | None]],
+    rows: Iterable[tuple[str, str | None]],
     *,
     version: str | int,
     legacy_version: str | int | None = None,
     source_pdf: str | None = None,
-) -> None:
+    bulk: bool = False,
+) -> int:
+    """Upsert ``(word, source)`` rows and return how many rows were written."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(db_path) as conn:
-        ensure_writable_schema(conn, legacy_version=legacy_version)
-        version_id = ensure_version_row(
-            conn,
-            version,
-            source_pdf=source_pdf,
-        )
-        conn.executemany(
-            """
-            INSERT INTO words (version_id, word, source)
-            VALUES (?, ?, ?)
-            ON CONFLICT(version_id, word) DO UPDATE SET
-                source=COALESCE(words.source, excluded.source)
-            """,
-            [(version_id, word, source) for word, source in rows],
-        )
+    conn = sqlite3.connect(db_path)
+    try:
+        with _bulk_load_pragmas(conn) if bulk else nullcontext():
+            with conn:
+                ensure_writable_schema(conn, legacy_version=legacy_version)
+                version_id = ensure_version_row(
+                    conn,
+                    version,
+                    source_pdf=source_pdf,
+                )
+                # Ids only grow, so rows above the current maximum are the new
+                # headwords that still need their inflected forms.
+                last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM words").fetchone()[0]
+                # rowcount, unlike total_changes, leaves out writes made by the
+                # search-index triggers.
+                if bulk:
+                    written = _merge_staged_rows(conn, version_id, rows)
+                else:
+                    written = conn.executemany(
+                        f"""
+                        INSERT INTO words (version_id, word, source, reversed_word, norm_key)
+                        VALUES (?, ?, ?, ?, ?)
+                        {_UPSERT_CLAUSE}
+                        """,
+                        (
+                            (version_id, word, source, reversed_word(word), norm_key(word))
+                            for word, source in rows
+                        ),
+                    ).rowcount
+                if has_word_forms(conn):
+                    fill_word_forms(conn, after_id=last_id)
+    finally:
+        conn.close()
+    return written
 
 
 def add_words_to_db(
@@ -122,34 +257,158 @@ def add_words_to_db(
     version: str | int,
     source: str | None = None,
     legacy_version: str | int | None = None,
+    bulk: bool = False,
 ) -> dict[str, object]:
-    """Insert words into the sqlite database and return stats."""
+    """Insert words into the sqlite database and return stats.
+
+    ``bulk`` stages the rows in a temp table and merges them in one statement
+    under relaxed durability pragmas; use it for whole-version imports.
+    """
     version_key = normalize_version_key(version)
-    normalized = _normalize_words(words)
-    accepted: list[dict[str, object]] = []
-    rows: list[tuple[str, str | None]] = []
-    for item in normalized:
-        word = _canonicalize_word(str(item.get("word", "")))
-        if not word:
+    stats = StatsAccumulator()
+    rows: dict[str, str | None] = {}
+    for item in words:
+        record: Mapping[str, object] = {"word": item} if isinstance(item, str) else item
+        row = _canonical_row(record, source)
+        if row is None:
             continue
-        source_value = item.get("source")
-        if source_value is None or not str(source_value).strip():
-            source_value = source
-        source_text = str(source_value).strip() if source_value is not None else None
-        rows.append((word, source_text))
-        accepted.append({"word": word, "source": source_text})
+        _collect_row(rows, *row)
+        stats.add(row[0], page=record.get("page"), column=record.get("column"))
 
+    written_count = 0
     if rows:
-        _write_words_db(
+        written_count = _write_words_db(
             db_path,
-            rows,
+            rows.items(),
             version=version_key,
             legacy_version=legacy_version,
+            bulk=bulk,
         )
 
-    stats = _compute_stats(accepted)
-    stats["version"] = version_key
-    return stats
+    payload = stats.as_dict()
+    payload["version"] = version_key
+    payload["collapsed_count"] = stats.total_count - len(rows)
+    payload["written_count"] = written_count
+    return payload
+
+
+def _iter_import_records(handle: TextIO, fmt: str) -> Iterator[Mapping[str, object]]:
+    if fmt in {"csv", "tsv"}:
+        reader = csv.DictReader(handle, delimiter="\t" if fmt == "tsv" else ",")
+        if reader.fieldnames is None or "word" not in reader.fieldnames:
+            raise ValueError(f"Import {fmt.upper()} must include a 'word' column.")
+        yield from reader
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON on line {line_number}: {exc.msg}") from exc
+            if isinstance(record, str):
+                record = {"word": record}
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number} must be a JSON object or string.")
+            yield record
+    elif fmt == "txt":
+        for line in handle:
+            if line.strip():
+                yield {"word": line}
+    else:
+        raise ValueError(f"Unknown import format: {fmt}. Available: {', '.join(IMPORT_FORMATS)}")
+
+
+def import_words(
+    handle: TextIO,
+    *,
+    db_path: Path,
+    fmt: str = "csv",
+    version: str | int | None = None,
+    legacy_version: str | int | None = None,
+    batch_size: int = 5000,
+    bulk: bool = False,
+) -> dict[str, object]:
+    """Stream words from CSV/TSV/JSONL/text into the database in batched transactions.
+
+    Accepts the columns written by ``export_words``: ``word`` is required,
+    ``source`` and ``version`` are used when present and other columns are ignored.
+    Rows without a ``version`` fall back to ``version``. One connection serves
+    the whole import: the schema check runs once and each batch is merged in
+    its own transaction. ``bulk`` applies ``BULK_LOAD_PRAGMAS`` for the whole
+    import, trading crash safety for throughput. ``rows_read`` counts input
+    rows, ``row_count`` the rows with a non-blank word.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+    default_version = normalize_version_key(version) if version is not None else None
+
+    started = time.perf_counter()
+    version_counts: dict[str, int] = {}
+    version_ids: dict[str, int] = {}
+    rows_read = 0
+    batch_count = 0
+    batch: dict[str, str | None] = {}
+    batch_version: str | None = None
+    batch_rows = 0
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+
+    def flush() -> None:
+        nonlocal batch_count, batch_rows
+        if batch_version is None or not batch_rows:
+            return
+        if batch:
+            with conn:
+                if batch_version not in version_ids:
+                    version_ids[batch_version] = ensure_version_row(conn, batch_version)
+                last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM words").fetchone()[0]
+                _merge_staged_rows(conn, version_ids[batch_version], batch.items())
+                if has_word_forms(conn):
+                    fill_word_forms(conn, after_id=last_id)
+            batch_count += 1
+        batch.clear()
+        batch_rows = 0
+
+    try:
+        with _bulk_load_pragmas(conn) if bulk else nullcontext():
+            with conn:
+                ensure_writable_schema(conn, legacy_version=legacy_version)
+            for row_number, record in enumerate(_iter_import_records(handle, fmt), start=1):
+                rows_read = row_number
+                raw_version = record.get("version")
+                if raw_version is not None and str(raw_version).strip():
+                    row_version = normalize_version_key(str(raw_version))
+                elif default_version is not None:
+                    row_version = default_version
+                else:
+                    raise ValueError(
+                        f"Row {row_number} has no version. "
+                        "Pass a version or include a version column."
+                    )
+                if row_version != batch_version or batch_rows >= batch_size:
+                    flush()
+                    batch_version = row_version
+                batch_rows += 1
+                row = _canonical_row(record, None)
+                if row is None:
+                    continue
+                _collect_row(batch, *row)
+                version_counts[row_version] = version_counts.get(row_version, 0) + 1
+            flush()
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "rows_read": rows_read,
+        "row_count": sum(version_counts.values()),
+        "batch_count": batch_count,
+        "versions": version_counts,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": rows_read / elapsed if elapsed > 0 else 0.0,
+    }
 
 
 def write_outputs(
@@ -162,20 +421,27 @@ def write_outputs(
     spellcheck_languages: Sequence[str] | None = None,
     legacy_version: str | int | None = None,
     source_pdf: str | None = None,
+    bulk: bool = False,
+    profiler: PipelineProfiler | None = None,
+    rejected_csv_path: Path | None = None,
 ) -> dict[str, object]:
-    """Write words to a sqlite database and return stats."""
+    """Write words to a sqlite database and return stats.
+
+    Rejected words go to ``rejected_csv_path`` when given, otherwise to
+    ``rejected_words.csv`` in ``output_dir``.
+
+    With an enabled ``profiler``, the pass over the words (``spellcheck``, or
+    ``collect`` when spellcheck is off) and the database write are recorded as
+    stages.
+    """
+    if profiler is None:
+        profiler = PipelineProfiler(enabled=False)
     version_key = normalize_version_key(version)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    normalized = _normalize_words(words)
-    accepted: list[dict[str, object]] = []
-    rejected: list[dict[str, object]] = []
-
     languages = [lang for lang in (spellcheck_languages or ("en",)) if lang]
-    available_languages: set[str] = set()
     if spellcheck:
-        _ensure_spellchecker_available()
         cocoa = _ensure_spellchecker_available()
         checker = cocoa.NSSpellChecker.sharedSpellChecker()
         available_languages = set(checker.availableLanguages())
@@ -186,132 +452,207 @@ def write_outputs(
                 f"{', '.join(missing)}. Available: {', '.join(sorted(available_languages))}",
                 RuntimeWarning,
             )
-        for item in normalized:
-            word = str(item.get("word", "")).strip()
-            if not word:
-                continue
-            if _is_word_spelled_correctly(word, languages=languages):
-                accepted.append(item)
-            else:
-                rejected.append(item)
-        if spellcheck_rejected == "db":
-            accepted = [item for item in normalized if str(item.get("word", "")).strip()]
-    else:
-        accepted = [item for item in normalized if str(item.get("word", "")).strip()]
-
-    words_db = output_path / "words.sqlite3"
-    rows: list[tuple[str, str | None]] = []
-    for item in accepted:
-        word = _canonicalize_word(str(item.get("word", "")))
-        if not word:
-            continue
-        source_value = item.get("source")
-        source = str(source_value).strip() if source_value is not None else None
-        rows.append((word, source))
-
-    if rows:
-        _write_words_db(
-            words_db,
-            rows,
-            version=version_key,
-            legacy_version=legacy_version,
-            source_pdf=source_pdf,
-        )
 
+    stats = StatsAccumulator()
+    rows: dict[str, str | None] = {}
     rejected_csv = None
-    if spellcheck and spellcheck_rejected == "csv":
-        rejected_csv = output_path / "rejected_words.csv"
-        with rejected_csv.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(
-                handle,
-                fieldnames=["word", "reason", "source"],
+    with ExitStack() as stack:
+        rejected_writer = None
+        if spellcheck and spellcheck_rejected == "csv":
+            rejected_csv = rejected_csv_path or output_path / "rejected_words.csv"
+            handle = stack.enter_context(rejected_csv.open("w", newline="", encoding="utf-8"))
+            rejected_writer = csv.DictWriter(handle, fieldnames=["word", "reason", "source"])
+            rejected_writer.writeheader()
+
+        stack.enter_context(profiler.stage("spellcheck" if spellcheck else "collect"))
+        for item in words:
+            record: Mapping[str, object] = {"word": item} if isinstance(item, str) else item
+            raw_word = str(record.get("word", "")).strip()
+            if not raw_word:
+                continue
+            page = record.get("page")
+            source_value = record.get("source")
+            if spellcheck:
+                spelled_correctly = _is_word_spelled_correctly(raw_word, languages=languages)
+                if not spelled_correctly:
+                    stats.add_rejected(page=page)
+                    if rejected_writer is not None:
+                        rejected_writer.writerow(
+                            {"word": raw_word, "reason": "misspelled", "source": source_value}
+                        )
+                    if spellcheck_rejected != "db":
+                        continue
+            word = _canonicalize_word(raw_word)
+            source = str(source_value).strip() if source_value is not None else None
+            _collect_row(rows, word, source)
+            stats.add(word, page=page, column=record.get("column"))
+
+    written_count = 0
+    if rows:
+        with profiler.stage("db_write"):
+            written_count = _write_words_db(
+                output_path / "words.sqlite3",
+                rows.items(),
+                version=version_key,
+                legacy_version=legacy_version,
+                source_pdf=source_pdf,
+                bulk=bulk,
             )
-            writer.writeheader()
-            for item in rejected:
-                writer.writerow(
-                    {
-                        "word": str(item.get("word", "")).strip(),
-                        "reason": "misspelled",
-                        "source": item.get("source"),
-                    }
-                )
 
-    stats = _compute_stats(accepted)
-    stats["version"] = version_key
-    stats["rejected_count"] = len(rejected)
+    payload = stats.as_dict()
+    payload["version"] = version_key
+    payload["collapsed_count"] = stats.total_count - len(rows)
+    payload["written_count"] = written_count
     if rejected_csv is not None:
-        stats["rejected_csv"] = str(rejected_csv)
-    return stats
+        payload["rejected_csv"] = str(rejected_csv)
+    return payload
 
 
-def export_words_to_csv(
+def _export_query(
+    conn: sqlite3.Connection,
+    column_list: Sequence[str],
+    *,
+    version: str | int | None,
+) -> tuple[str, list[object]]:
+    schema_mode = detect_schema_mode(conn)
+    if schema_mode == "missing":
+        raise ValueError("words table not found in database.")
+    if schema_mode == "unknown":
+        raise ValueError("Unsupported words schema.")
+
+    if schema_mode == "legacy":
+        available_columns = set(table_columns(conn, "words"))
+        missing = [column for column in column_list if column not in available_columns]
+        if missing:
+            available = ", ".join(sorted(available_columns))
+            raise ValueError(f"Unknown columns: {', '.join(missing)}. Available: {available}")
+        select_columns = ", ".join(f'"{column}"' for column in column_list)
+        return f"SELECT {select_columns} FROM words ORDER BY id", []
+
+    available_columns = {"id", "word", "source", "added_at", "version", "label"}
+    missing = [column for column in column_list if column not in available_columns]
+    if missing:
+        available = ", ".join(sorted(available_columns))
+        raise ValueError(f"Unknown columns: {', '.join(missing)}. Available: {available}")
+
+    selected: list[str] = []
+    for column in column_list:
+        if column == "version":
+            selected.append('vv.version_key AS "version"')
+        elif column == "label":
+            selected.append('vv.label AS "label"')
+        else:
+            selected.append(f'w."{column}"')
+    sql = (
+        "SELECT "
+        + ", ".join(selected)
+        + " FROM words AS w JOIN vocab_versions AS vv ON vv.id = w.version_id"
+    )
+    params: list[object] = []
+    if version is not None:
+        sql += " WHERE vv.version_key = ?"
+        params.append(normalize_version_key(version))
+    sql += " ORDER BY vv.version_key, w.id"
+    return sql, params
+
+
+def _write_export_rows(
+    handle: TextIO,
+    cursor: sqlite3.Cursor,
+    column_list: Sequence[str],
+    fmt: str,
+) -> int:
+    row_count = 0
+    if fmt in {"csv", "tsv"}:
+        writer = csv.writer(handle, delimiter="\t" if fmt == "tsv" else ",")
+        writer.writerow(column_list)
+        while batch := cursor.fetchmany(EXPORT_FETCH_SIZE):
+            writer.writerows(batch)
+            row_count += len(batch)
+    elif fmt == "jsonl":
+        while batch := cursor.fetchmany(EXPORT_FETCH_SIZE):
+            handle.write(
+                "".join(
+                    json.dumps(dict(zip(column_list, row)), ensure_ascii=False) + "\n"
+                    for row in batch
+                )
+            )
+            row_count += len(batch)
+    else:
+        while batch := cursor.fetchmany(EXPORT_FETCH_SIZE):
+            handle.write("".join(f"{row[0]}\n" for row in batch))
+            row_count += len(batch)
+    return row_count
+
+
+def export_words(
     db_path: Path,
-    csv_path: Path,
+    output_path: Path | None,
     columns: Sequence[str],
     *,
     version: str | int | None = None,
+    fmt: str = "csv",
+    compress: bool = False,
 ) -> dict[str, object]:
-    """Export the words table to a CSV file."""
+    """Stream the words table to a file, or to stdout when ``output_path`` is None.
+
+    Supports ``csv``, ``tsv``, ``jsonl`` and ``txt`` (one word per line, ignoring
+    ``columns``); ``compress`` gzips the output.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Available: {', '.join(EXPORT_FORMATS)}")
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
 
     column_list = [column.strip() for column in columns if column and column.strip()]
+    if fmt == "txt":
+        column_list = ["word"]
     if not column_list:
         raise ValueError("At least one column must be provided.")
 
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        schema_mode = detect_schema_mode(conn)
-        if schema_mode == "missing":
-            raise ValueError("words table not found in database.")
-        if schema_mode == "unknown":
-            raise ValueError("Unsupported words schema.")
-
-        if schema_mode == "legacy":
-            available_columns = set(table_columns(conn, "words"))
-            missing = [column for column in column_list if column not in available_columns]
-            if missing:
-                available = ", ".join(sorted(available_columns))
-                raise ValueError(f"Unknown columns: {', '.join(missing)}. Available: {available}")
-            select_columns = ", ".join(f'"{column}"' for column in column_list)
-            cursor = conn.execute(f"SELECT {select_columns} FROM words ORDER BY id")
-        else:
-            available_columns = {"id", "word", "source", "added_at", "version", "label"}
-            missing = [column for column in column_list if column not in available_columns]
-            if missing:
-                available = ", ".join(sorted(available_columns))
-                raise ValueError(f"Unknown columns: {', '.join(missing)}. Available: {available}")
-
-            selected: list[str] = []
-            for column in column_list:
-                if column == "version":
-                    selected.append('vv.version_key AS "version"')
-                elif column == "label":
-                    selected.append('vv.label AS "label"')
-                else:
-                    selected.append(f'w."{column}"')
-            sql = (
-                "SELECT "
-                + ", ".join(selected)
-                + " FROM words AS w JOIN vocab_versions AS vv ON vv.id = w.version_id"
-            )
-            params: list[object] = []
-            if version is not None:
-                sql += " WHERE vv.version_key = ?"
-                params.append(normalize_version_key(version))
-            sql += " ORDER BY vv.version_key, w.id"
-            cursor = conn.execute(sql, params)
-
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
-        row_count = 0
-        with csv_path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(column_list)
-            for row in cursor:
-                writer.writerow([row[column] for column in column_list])
-                row_count += 1
-
-    payload: dict[str, object] = {"row_count": row_count, "csv_path": str(csv_path)}
+    conn = sqlite3.connect(db_path)
+    try:
+        sql, params = _export_query(conn, column_list, version=version)
+        cursor = conn.execute(sql, params)
+        with ExitStack() as stack:
+            if output_path is None:
+                sys.stdout.flush()
+                binary: IO[bytes] = sys.stdout.buffer
+            else:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                binary = stack.enter_context(output_path.open("wb"))
+            if compress:
+                binary = stack.enter_context(gzip.GzipFile(fileobj=binary, mode="wb"))
+            handle = io.TextIOWrapper(binary, encoding="utf-8", newline="")
+            try:
+                row_count = _write_export_rows(handle, cursor, column_list, fmt)
+            finally:
+                handle.flush()
+                handle.detach()
+    finally:
+        conn.close()
+
+    payload: dict[str, object] = {
+        "row_count": row_count,
+        "path": str(output_path) if output_path is not None else None,
+        "format": fmt,
+        "compressed": compress,
+    }
     if version is not None:
         payload["version"] = normalize_version_key(version)
     return payload
+
+
+def export_words_to_csv(
+    db_path: Path,
+    csv_path: Path,
+    columns: Sequence[str],
+    *,
+    version: str | int | None = None,
+) -> dict[str, object]:
+    """Export the words table to a CSV file."""
+    stats = export_words(db_path, csv_path, columns, version=version, fmt="csv")
+    payload: dict[str, object] = {"row_count": stats["row_count"], "csv_path": str(csv_path)}
+    if version is not None:
+        payload["version"] = stats["version"]
+    return payload
@@ -2,44 +2,80 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Iterable, List
+from typing import Collection, Iterator, List
 
 import pypdfium2 as pdfium
 from PIL import Image
 
+# PDFium is not thread-safe; every call into it is serialized so batch jobs can
+# render from worker threads while their OCR runs concurrently.
+_PDFIUM_LOCK = threading.Lock()
 
-def render_pdf_pages(
-    pdf_path: Path, start_page: int, end_page: int, dpi: int = 300
-) -> List[Image.Image]:
-    """Render a 1-based inclusive page range to PIL images."""
+
+def _validate_page_range(start_page: int, end_page: int) -> None:
     if start_page < 1 or end_page < 1:
         raise ValueError("Page numbers must be 1-based positive integers.")
     if end_page < start_page:
         raise ValueError("end_page must be greater than or equal to start_page.")
 
-    pdf = pdfium.PdfDocument(str(pdf_path))
-    try:
-        page_indices = range(start_page - 1, end_page)
-        images: List[Image.Image] = []
-        for index in page_indices:
-            if index < 0 or index >= len(pdf):
-                raise ValueError(f"Page index out of range: {index + 1}")
-            page = pdf[index]
-            try:
-                # scale can be float in pypdfium2, suppressing strict int check
-                pil_image = page.render(scale=dpi / 72).to_pil()  # type: ignore[arg-type]
-            finally:
-                page.close()
-            images.append(pil_image)
-        return images
-    finally:
-        pdf.close()
+
+def render_pdf_pages(
+    pdf_path: Path, start_page: int, end_page: int, dpi: int = 300
+) -> List[Image.Image]:
+    """Render a 1-based inclusive page range to PIL images."""
+    return list(iter_pdf_pages(pdf_path, start_page, end_page, dpi=dpi))
 
 
 def iter_pdf_pages(
-    pdf_path: Path, start_page: int, end_page: int, dpi: int = 300
-) -> Iterable[Image.Image]:
-    """Yield PIL images for a 1-based inclusive page range."""
-    for image in render_pdf_pages(pdf_path, start_page, end_page, dpi=dpi):
-        yield image
+    pdf_path: Path,
+    start_page: int,
+    end_page: int,
+    dpi: int = 300,
+    *,
+    skip_pages: Collection[int] = (),
+) -> Iterator[Image.Image]:
+    """Yield PIL images for a 1-based inclusive page range, rendering one page at a time.
+
+    Pages listed in ``skip_pages`` are neither rendered nor yielded. The page
+    numbers, including ``end_page`` against the document's page count, are
+    validated before the generator is returned; the document the pages come
+    from is only opened once iteration starts, and closed with the generator.
+    """
+    _validate_page_range(start_page, end_page)
+    page_count = _page_count(pdf_path)
+    if end_page > page_count:
+        raise ValueError(f"end_page {end_page} exceeds the PDF's {page_count} page(s).")
+    return _render_pages(pdf_path, start_page, end_page, dpi, skip_pages)
+
+
+def _page_count(pdf_path: Path) -> int:
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+
+def _render_pages(
+    pdf_path: Path, start_page: int, end_page: int, dpi: int, skip_pages: Collection[int]
+) -> Iterator[Image.Image]:
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for index in range(start_page - 1, end_page):
+            if index + 1 in skip_pages:
+                continue
+            with _PDFIUM_LOCK:
+                page = pdf[index]
+                try:
+                    # scale can be float in pypdfium2, suppressing strict int check
+                    pil_image = page.render(scale=dpi / 72).to_pil()  # type: ignore[arg-type]
+                finally:
+                    page.close()
+            yield pil_image
+    finally:
+        with _PDFIUM_LOCK:
+            pdf.close()
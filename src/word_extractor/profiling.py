@@ -0,0 +1,240 @@
+"""Stage timing for the extraction pipeline."""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Iterator, cast
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+_NULL_CONTEXT = nullcontext()
+
+
+class MemoryLimitExceeded(RuntimeError):
+    """Raised when process memory grows past the configured limit."""
+
+
+def format_bytes(size: float) -> str:
+    """Render a byte count with a binary unit, e.g. ``1.5 GiB``."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} B" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or its peak where the current value is unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_rss_bytes()
+    return resident_pages * resource.getpagesize() if resource is not None else None
+
+
+def peak_rss_bytes() -> int | None:
+    """High-water mark of the process resident set size."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    # Nearest-rank percentile; sorted_values must be non-empty.
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize(samples: list[float]) -> dict[str, float | int]:
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "count": len(ordered),
+        "total_seconds": total,
+        "mean_seconds": total / len(ordered),
+        "p50_seconds": _percentile(ordered, 0.50),
+        "p90_seconds": _percentile(ordered, 0.90),
+        "p99_seconds": _percentile(ordered, 0.99),
+        "max_seconds": ordered[-1],
+    }
+
+
+class PipelineProfiler:
+    """Collect monotonic stage timings, optionally tagged with page and column.
+
+    A disabled profiler hands out one shared no-op context manager, so the
+    pipeline can wrap every stage unconditionally. With ``track_memory`` each
+    stage also records its tracemalloc peak and retained allocations and how
+    far it grew the process RSS, and the summary reports the process RSS peak
+    once; with ``max_memory_bytes`` the process RSS is checked after every
+    stage and ``MemoryLimitExceeded`` is raised once it is over the limit.
+    Stages must not nest when tracking memory, and ``close`` stops tracemalloc
+    if this profiler started it.
+
+    tracemalloc and RSS are process-global: when other threads allocate at the
+    same time, such as parallel batch workers, their memory is counted in
+    whichever stage is running here.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        track_memory: bool = False,
+        max_memory_bytes: int | None = None,
+    ) -> None:
+        self.enabled = enabled or track_memory or max_memory_bytes is not None
+        self.track_memory = track_memory
+        self.max_memory_bytes = max_memory_bytes
+        self._owns_tracemalloc = False
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._memory: dict[str, dict[str, int]] = {}
+        self._started = time.perf_counter()
+        self._samples: dict[str, list[float]] = defaultdict(list)
+        self._pages: dict[int, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._columns: dict[tuple[int, str], dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+    def stage(
+        self, name: str, *, page: int | None = None, column: str | None = None
+    ) -> ContextManager[None]:
+        """Time the enclosed block as one sample of ``name``."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed(name, page, column)
+
+    @contextmanager
+    def _timed(self, name: str, page: int | None, column: str | None) -> Iterator[None]:
+        traced_before = rss_before = 0
+        if self.track_memory:
+            rss_before = current_rss_bytes() or 0
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, page=page, column=column)
+            if self.track_memory:
+                self._record_memory(name, traced_before, rss_before)
+        self._check_memory_limit(name, page)
+
+    def _record_memory(self, name: str, traced_before: int, rss_before: int) -> None:
+        traced_after, traced_peak = tracemalloc.get_traced_memory()
+        # Where only the peak RSS is available (macOS), this is how far the
+        # stage raised the peak.
+        rss_growth = (current_rss_bytes() or 0) - rss_before
+        entry = self._memory.setdefault(
+            name, {"peak_bytes": 0, "retained_bytes": 0, "rss_growth_bytes": 0}
+        )
+        entry["peak_bytes"] = max(entry["peak_bytes"], traced_peak - traced_before)
+        entry["retained_bytes"] += traced_after - traced_before
+        entry["rss_growth_bytes"] = max(entry["rss_growth_bytes"], rss_growth)
+
+    def _check_memory_limit(self, name: str, page: int | None) -> None:
+        if self.max_memory_bytes is None:
+            return
+        rss = current_rss_bytes()
+        if rss is None or rss <= self.max_memory_bytes:
+            return
+        where = f"{name} on page {page}" if page is not None else name
+        # The check only runs between stages, so the stage named here is where
+        # the limit was noticed, not necessarily where the memory went.
+        raise MemoryLimitExceeded(
+            f"Memory limit exceeded: process RSS is {format_bytes(rss)}, "
+            f"limit is {format_bytes(self.max_memory_bytes)} (noticed after {where}). "
+            "Try a smaller page range or raise --max-memory."
+        )
+
+    def memory_summary(self) -> dict[str, object] | None:
+        """Per-stage tracemalloc peak/retained bytes and RSS growth plus the process RSS peak."""
+        if not self.track_memory:
+            return None
+        return {
+            "rss_peak_bytes": peak_rss_bytes(),
+            "stages": {name: dict(entry) for name, entry in self._memory.items()},
+        }
+
+    def close(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def record(
+        self, name: str, seconds: float, *, page: int | None = None, column: str | None = None
+    ) -> None:
+        """Add an externally measured sample of ``name``."""
+        if not self.enabled:
+            return
+        self._samples[name].append(seconds)
+        if page is not None:
+            self._pages[page][name] += seconds
+            if column is not None:
+                self._columns[(page, column)][name] += seconds
+
+    def report(self) -> dict[str, object]:
+        """Return totals, per-stage percentiles and per-page/per-column breakdowns."""
+        pages = []
+        for page in sorted(self._pages):
+            stages = dict(self._pages[page])
+            columns = {
+                column: dict(stages_by_column)
+                for (column_page, column), stages_by_column in sorted(self._columns.items())
+                if column_page == page
+            }
+            entry: dict[str, object] = {
+                "page": page,
+                "total_seconds": sum(stages.values()),
+                "stages": stages,
+                "columns": columns,
+            }
+            pages.append(entry)
+        page_totals = [cast(float, entry["total_seconds"]) for entry in pages]
+        report: dict[str, object] = {
+            "wall_seconds": time.perf_counter() - self._started,
+            "stages": {name: _summarize(samples) for name, samples in self._samples.items()},
+            "page_seconds": _summarize(page_totals) if page_totals else None,
+            "pages": pages,
+        }
+        memory = self.memory_summary()
+        if memory is not None:
+            report["memory"] = memory
+        return report
+
+    def write_report(self, path: Path) -> dict[str, object]:
+        """Write the JSON report to ``path`` and return it."""
+        report = self.report()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        return report
+
+    def summary_line(self, report: dict[str, object] | None = None) -> str:
+        """One-line breakdown of where the time went, largest stage first."""
+        report = report if report is not None else self.report()
+        wall = float(report["wall_seconds"])  # type: ignore[arg-type]
+        stages = report["stages"]
+        assert isinstance(stages, dict)
+        parts = [f"total {wall:.2f}s"]
+        ordered = sorted(stages.items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+        for name, summary in ordered:
+            seconds = summary["total_seconds"]
+            share = seconds / wall * 100 if wall > 0 else 0.0
+            parts.append(f"{name} {seconds:.2f}s ({share:.0f}%)")
+        return "Profile: " + " | ".join(parts)
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import json
 import os
 import sqlite3
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from .morphology import inflections, norm_key
 
 DEFAULT_RUNTIME_DB_PATH = Path("output") / "words.sqlite3"
 DEFAULT_EXAMPLE_DB_PATH = Path("resources") / "examples" / "words.sqlite3"
 SETTINGS_FILE_NAME = "neep.toml"
+REVERSED_WORD_INDEX = "idx_words_version_reversed"
+NORM_KEY_INDEX = "idx_words_version_norm"
+WORD_FORMS_TABLE = "word_forms"
 
 
 @dataclass(frozen=True)
@@ -211,12 +217,121 @@ def ensure_versioned_schema(conn: sqlite3.Connection) -> None:
             word TEXT NOT NULL,
             source TEXT,
             added_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            reversed_word TEXT,
+            norm_key TEXT,
             UNIQUE(version_id, word)
         )
         """
     )
     conn.execute("CREATE INDEX IF NOT EXISTS idx_words_version_word ON words(version_id, word)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_words_word ON words(word)")
+    upgrade_versioned_schema(conn)
+
+
+def has_index(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def reversed_word(word: str) -> str:
+    """Key for suffix search: ``LIKE '%tion'`` becomes a range scan for ``noit...``."""
+    return word.lower()[::-1]
+
+
+# Columns derived from ``word`` at insert time: (column, function, index).
+_DERIVED_COLUMNS: tuple[tuple[str, Callable[[str], str], str], ...] = (
+    ("reversed_word", reversed_word, REVERSED_WORD_INDEX),
+    ("norm_key", norm_key, NORM_KEY_INDEX),
+)
+
+
+def _register_word_functions(conn: sqlite3.Connection) -> None:
+    for column, function, _ in _DERIVED_COLUMNS:
+        conn.create_function(f"neep_{column}", 1, function, deterministic=True)
+    conn.create_function(
+        "neep_inflections", 1, lambda word: json.dumps(inflections(word)), deterministic=True
+    )
+
+
+def has_word_forms(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (WORD_FORMS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def fill_word_forms(conn: sqlite3.Connection, *, after_id: int = 0) -> int:
+    """Add the inflected forms of every headword whose row id is above ``after_id``.
+
+    Forms are ``(version_id, form) -> word`` rows generated by
+    ``morphology.inflections``; existing rows are kept. Returns how many were added.
+    """
+    _register_word_functions(conn)
+    return conn.execute(
+        f"""
+        INSERT OR IGNORE INTO {WORD_FORMS_TABLE} (version_id, form, word)
+        SELECT w.version_id, f.value, w.word
+        FROM words AS w, json_each(neep_inflections(w.word)) AS f
+        WHERE w.id > ?
+        """,
+        (after_id,),
+    ).rowcount
+
+
+def drop_word_forms(conn: sqlite3.Connection) -> None:
+    conn.execute(f"DROP TABLE IF EXISTS {WORD_FORMS_TABLE}")
+
+
+def upgrade_versioned_schema(
+    conn: sqlite3.Connection, *, backfill: bool = False, word_forms: bool = False
+) -> list[str]:
+    """Bring an existing versioned database up to the current schema.
+
+    Adds the derived ``reversed_word`` and ``norm_key`` columns (filled for
+    every existing row) and their ``(version_id, column)`` indexes. The
+    ``word_forms`` inflection table is optional, since it roughly doubles the
+    database and slows every write: ``word_forms`` creates and fills it,
+    otherwise lookups compute forms at query time. With ``backfill`` it also
+    fills rows left ``NULL`` by writers that predate a column, and forms for
+    headwords they added. Returns the names of the steps that changed something.
+    """
+    applied: list[str] = []
+    _register_word_functions(conn)
+    columns = table_columns(conn, "words")
+    for column, _, index in _DERIVED_COLUMNS:
+        fill = backfill
+        if column not in columns:
+            conn.execute(f"ALTER TABLE words ADD COLUMN {column} TEXT")
+            applied.append(f"add_{column}")
+            fill = True
+        if fill:
+            cursor = conn.execute(
+                f"UPDATE words SET {column} = neep_{column}(word) WHERE {column} IS NULL"
+            )
+            if cursor.rowcount:
+                applied.append(f"backfill_{column}")
+        if not has_index(conn, index):
+            conn.execute(f"CREATE INDEX {index} ON words(version_id, {column})")
+            applied.append(f"index_{column}")
+    fill = backfill and has_word_forms(conn)
+    if word_forms and not has_word_forms(conn):
+        conn.execute(
+            f"""
+            CREATE TABLE {WORD_FORMS_TABLE} (
+                version_id INTEGER NOT NULL REFERENCES vocab_versions(id),
+                form TEXT NOT NULL,
+                word TEXT NOT NULL,
+                PRIMARY KEY (version_id, form, word)
+            ) WITHOUT ROWID
+            """
+        )
+        applied.append("add_word_forms")
+        fill = True
+    if fill and fill_word_forms(conn):
+        applied.append("backfill_word_forms")
+    return applied
 
 
 def migrate_legacy_schema(
@@ -269,19 +384,26 @@ def migrate_legacy_schema(
             word TEXT NOT NULL,
             source TEXT,
             added_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            reversed_word TEXT,
+            norm_key TEXT,
             UNIQUE(version_id, word)
         )
         """
     )
+    _register_word_functions(conn)
     conn.execute(
         """
-        INSERT INTO words_migrated (id, version_id, word, source, added_at)
+        INSERT INTO words_migrated (
+            id, version_id, word, source, added_at, reversed_word, norm_key
+        )
         SELECT
             id,
             ?,
             lower(trim(word)),
             source,
-            COALESCE(added_at, strftime('%Y-%m-%dT%H:%M:%fZ','now'))
+            COALESCE(added_at, strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            neep_reversed_word(lower(trim(word))),
+            neep_norm_key(word)
         FROM words
         ORDER BY id
         """,
@@ -291,6 +413,7 @@ def migrate_legacy_schema(
     conn.execute("ALTER TABLE words_migrated RENAME TO words")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_words_version_word ON words(version_id, word)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_words_word ON words(word)")
+    upgrade_versioned_schema(conn)
     return "migrated"
 
 
@@ -506,3 +629,70 @@ def set_default_version(conn: sqlite3.Connection, version_key: str | int) -> dic
         "label": row[2],
         "is_default": True,
     }
+
+
+SEARCH_INDEX_TABLE = "words_trigram"
+
+_SEARCH_INDEX_TRIGGERS = {
+    "words_trigram_ai": """
+        CREATE TRIGGER words_trigram_ai AFTER INSERT ON words BEGIN
+            INSERT INTO words_trigram (rowid, word) VALUES (new.id, new.word);
+        END
+    """,
+    "words_trigram_ad": """
+        CREATE TRIGGER words_trigram_ad AFTER DELETE ON words BEGIN
+            INSERT INTO words_trigram (words_trigram, rowid, word)
+            VALUES ('delete', old.id, old.word);
+        END
+    """,
+    "words_trigram_au": """
+        CREATE TRIGGER words_trigram_au AFTER UPDATE OF word ON words BEGIN
+            INSERT INTO words_trigram (words_trigram, rowid, word)
+            VALUES ('delete', old.id, old.word);
+            INSERT INTO words_trigram (rowid, word) VALUES (new.id, new.word);
+        END
+    """,
+}
+
+
+def has_search_index(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (SEARCH_INDEX_TABLE,),
+    ).fetchone()
+    return row is not None
+
+
+def build_search_index(conn: sqlite3.Connection) -> int:
+    """Create (or rebuild) the FTS5 trigram index over ``words.word``.
+
+    The index is an external-content table kept in sync by triggers, so later
+    writes through any code path stay indexed. Returns the number of indexed
+    rows. Requires an SQLite build with FTS5 (3.34+ for the trigram tokenizer).
+    """
+    schema_mode = detect_schema_mode(conn)
+    if schema_mode == "missing":
+        raise ValueError("words_table_not_found")
+    if schema_mode != "versioned":
+        raise ValueError("search_index_requires_versioned_schema")
+    try:
+        conn.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} USING fts5(
+                word, content='words', content_rowid='id', tokenize='trigram', detail='none'
+            )
+            """
+        )
+    except sqlite3.OperationalError as exc:
+        raise ValueError(f"search_index_unsupported: {exc}") from exc
+    for name, sql in _SEARCH_INDEX_TRIGGERS.items():
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.execute(sql)
+    conn.execute(f"INSERT INTO {SEARCH_INDEX_TABLE} ({SEARCH_INDEX_TABLE}) VALUES ('rebuild')")
+    return conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+
+
+def drop_search_index(conn: sqlite3.Connection) -> None:
+    for name in _SEARCH_INDEX_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    conn.execute(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}")
@@ -0,0 +1,258 @@
+"""Poll a folder and extract PDFs as they arrive or change."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import tomllib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from . import ocr_engine, output
+from .batch import JOB_OPTIONS, parse_manifest, run_batch
+from .storage import find_settings_file
+
+STATE_FILE_NAME = ".neepwords-watch.json"
+SIDECAR_SUFFIXES = (".toml", ".json")
+_MANIFEST_SETTINGS = frozenset(
+    {"output_dir", "spellcheck", "spellcheck_rejected", "spellcheck_languages", "legacy_version"}
+)
+_JOB_SETTINGS = frozenset({"start_page", "end_page", "version", "debug_dir"}) | JOB_OPTIONS
+# An unchanged PDF whose extraction failed is retried after RETRY_BASE_SECONDS,
+# doubling with every further failure up to RETRY_MAX_SECONDS.
+RETRY_BASE_SECONDS = 60.0
+RETRY_MAX_SECONDS = 3600.0
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    size: int
+    mtime_ns: int
+    sidecar_mtime_ns: int | None
+
+
+def _now() -> float:
+    return time.time()
+
+
+def _retry_delay(attempts: int) -> float:
+    return min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_sidecar(pdf_path: Path) -> Path | None:
+    """Return ``<stem>.toml`` or ``<stem>.json`` next to the PDF, if present."""
+    for suffix in SIDECAR_SUFFIXES:
+        candidate = pdf_path.with_suffix(suffix)
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _load_table(path: Path) -> dict[str, Any]:
+    try:
+        if path.suffix.lower() == ".json":
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        else:
+            with path.open("rb") as handle:
+                payload = tomllib.load(handle)
+    except (json.JSONDecodeError, tomllib.TOMLDecodeError) as exc:
+        raise ValueError(f"Invalid settings file {path}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ValueError(f"Invalid settings file {path}: expected a table/object.")
+    return payload
+
+
+def load_watch_settings(start: Path) -> tuple[dict[str, Any], Path | None]:
+    """Read the ``[watch]`` table from the nearest ``neep.toml``."""
+    settings_path = find_settings_file(start)
+    if settings_path is None:
+        return {}, None
+    watch = _load_table(settings_path).get("watch")
+    return (watch if isinstance(watch, dict) else {}), settings_path
+
+
+class FolderWatcher:
+    """Detect new or changed PDFs in ``directory`` and extract each one.
+
+    A PDF is picked up once its size and mtime have stayed the same for one
+    poll (so half-copied files are left alone) and its SHA-256 differs from the
+    last run; editing its sidecar also triggers a re-run. A failed file is
+    retried as soon as it or its sidecar changes, otherwise only after a
+    backoff that doubles per attempt (see ``RETRY_BASE_SECONDS``). Job settings come from
+    ``neep.toml`` ``[watch]`` overlaid by the PDF's sidecar. Seen files are
+    recorded in ``state_path`` so a restart does not repeat work, and the
+    process keeps the OCR backend, spellchecker and their caches loaded between
+    jobs.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        state_path: Path | None = None,
+        workers: int | None = None,
+        on_event: Callable[[dict[str, object]], None] | None = None,
+    ) -> None:
+        self.directory = directory
+        self.state_path = state_path or directory / STATE_FILE_NAME
+        self.workers = workers
+        self.on_event = on_event
+        self._state: dict[str, dict[str, Any]] = self._load_state()
+        self._last_seen: dict[str, FileFingerprint] = {}
+
+    def _emit(self, event: dict[str, object]) -> None:
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def _load_state(self) -> dict[str, dict[str, Any]]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        files = payload.get("files") if isinstance(payload, dict) else None
+        return files if isinstance(files, dict) else {}
+
+    def _save_state(self) -> None:
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"files": self._state}, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.state_path)
+
+    def warm_up(self, *, spellcheck: bool = True) -> None:
+        """Load the OCR backend and spellchecker once, before the first job."""
+        try:
+            ocr_engine._load_ocrmac()
+            if spellcheck:
+                output._ensure_spellchecker_available().NSSpellChecker.sharedSpellChecker()
+        except RuntimeError as exc:
+            self._emit({"event": "warning", "message": str(exc)})
+
+    def _fingerprint(self, pdf_path: Path) -> FileFingerprint:
+        stat = pdf_path.stat()
+        sidecar = find_sidecar(pdf_path)
+        return FileFingerprint(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sidecar_mtime_ns=sidecar.stat().st_mtime_ns if sidecar is not None else None,
+        )
+
+    def _job_settings(self, pdf_path: Path) -> dict[str, Any]:
+        settings, _ = load_watch_settings(self.directory)
+        sidecar = find_sidecar(pdf_path)
+        if sidecar is not None:
+            settings = {**settings, **_load_table(sidecar)}
+        unknown = sorted(set(settings) - _MANIFEST_SETTINGS - _JOB_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown watch setting(s) for {pdf_path.name}: {', '.join(unknown)}")
+        return settings
+
+    def _extract(self, pdf_path: Path) -> dict[str, object]:
+        settings = self._job_settings(pdf_path)
+        job = {key: value for key, value in settings.items() if key in _JOB_SETTINGS}
+        payload = {key: value for key, value in settings.items() if key in _MANIFEST_SETTINGS}
+        payload["jobs"] = [{"pdf": str(pdf_path), **job}]
+        payload.setdefault("output_dir", str(self.directory / "output"))
+        manifest = parse_manifest(payload, base_dir=self.directory)
+        return run_batch(manifest, workers=self.workers or 1, on_event=self.on_event)
+
+    def poll(self, *, settle: bool = True) -> list[dict[str, object]]:
+        """Scan once and extract every settled new or changed PDF.
+
+        With ``settle=False`` files are processed on first sight, which is what
+        a one-shot run wants.
+        """
+        results: list[dict[str, object]] = []
+        seen_now: dict[str, FileFingerprint] = {}
+        state_changed = False
+        for pdf_path in sorted(self.directory.glob("*.pdf")):
+            if not pdf_path.is_file():
+                continue
+            key = pdf_path.name
+            try:
+                fingerprint = self._fingerprint(pdf_path)
+            except OSError:
+                continue
+            seen_now[key] = fingerprint
+            recorded = self._state.get(key)
+            if recorded is not None and recorded.get("fingerprint") == asdict(fingerprint):
+                if "error" not in recorded or _now() < recorded.get("retry_at", 0):
+                    continue
+            if settle and self._last_seen.get(key) != fingerprint:
+                continue
+
+            try:
+                sha256 = _file_sha256(pdf_path)
+            except OSError:
+                continue
+            unchanged = (
+                recorded is not None
+                and recorded.get("sha256") == sha256
+                and recorded.get("fingerprint", {}).get("sidecar_mtime_ns")
+                == fingerprint.sidecar_mtime_ns
+            )
+            if (
+                unchanged
+                and recorded is not None
+                and recorded.get("fingerprint") != asdict(fingerprint)
+            ):
+                # Touched but identical; remember the new mtime and move on.
+                recorded["fingerprint"] = asdict(fingerprint)
+                state_changed = True
+                if "error" not in recorded or _now() < recorded.get("retry_at", 0):
+                    continue
+
+            self._emit({"event": "start", "pdf": str(pdf_path)})
+            try:
+                result = self._extract(pdf_path)
+            except (OSError, sqlite3.Error, ValueError) as exc:
+                result = {"error": str(exc) or type(exc).__name__}
+            entry: dict[str, Any] = {"fingerprint": asdict(fingerprint), "sha256": sha256}
+            if "error" in result or result.get("failed_count"):
+                # A changed file starts over; an unchanged one backs off further.
+                attempts = int(recorded.get("attempts", 0)) + 1 if unchanged and recorded else 1
+                entry["error"] = result.get("error") or "extraction failed"
+                entry["attempts"] = attempts
+                entry["retry_at"] = _now() + _retry_delay(attempts)
+            self._state[key] = entry
+            state_changed = True
+            event = {"event": "done", "pdf": str(pdf_path), **result}
+            self._emit(event)
+            results.append(event)
+
+        self._last_seen = seen_now
+        if state_changed:
+            self._save_state()
+        return results
+
+    def run(
+        self,
+        *,
+        interval: float = 5.0,
+        once: bool = False,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """Poll every ``interval`` seconds until ``stop`` is set (or once)."""
+        if once:
+            self.poll(settle=False)
+            return
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll()
+            stop.wait(interval)
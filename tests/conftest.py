@@ -66,3 +66,25 @@ def configured_words_db(sample_words_db: Path, monkeypatch: pytest.MonkeyPatch)
     monkeypatch.setenv("NEEP_WORDS_DB_PATH", os.fspath(sample_words_db))
     monkeypatch.delenv("NEEP_WORDS_VERSION", raising=False)
     return sample_words_db
+
+
+def _synthetic_word(index: int) -> str:
+    letters = "etaoinshrdlucmfwypvbgkjqxz"
+    chars: list[str] = []
+    value = index
+    while True:
+        value, remainder = divmod(value, len(letters))
+        chars.append(letters[remainder])
+        if value == 0:
+            break
+    return "".join(chars) + "word"
+
+
+@pytest.fixture
+def synthetic_words():
+    """Return a factory for ``count`` distinct lowercase words, for benchmarks."""
+
+    def _factory(count: int) -> list[str]:
+        return [_synthetic_word(index) for index in range(count)]
+
+    return _factory
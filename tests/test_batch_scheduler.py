@@ -0,0 +1,251 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from word_extractor import batch, core, main, ocr_engine, output
+from word_extractor.batch import load_manifest, run_batch
+
+MANIFEST = """
+output_dir = "out"
+workers = 2
+spellcheck = false
+
+[defaults]
+dpi = 200
+split_offset = -0.1
+
+[[jobs]]
+pdf = "pdfs/2026.pdf"
+start_page = 1
+end_page = 2
+version = "2026"
+
+[[jobs]]
+pdf = "pdfs/2026.pdf"
+start_page = 3
+end_page = 3
+version = "26"
+split_offset = 0.05
+
+[[jobs]]
+pdf = "/abs/2027.pdf"
+start_page = 1
+end_page = 1
+version = "2027考研"
+"""
+
+
+def _write_manifest(tmp_path: Path, text: str = MANIFEST, name: str = "batch.toml") -> Path:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _fake_collect(calls, *, fail_on: str | None = None, delay: float = 0.0):
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0}
+
+    def fake_collect_words(pdf_path, start_page, end_page, debug_dir=None, **options):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+            calls.append((pdf_path.name, start_page, end_page, options))
+        try:
+            time.sleep(delay)
+            if fail_on is not None and pdf_path.name == fail_on:
+                raise RuntimeError("OCR failed")
+            words = [
+                {"word": f"{pdf_path.stem}-p{page}", "source": f"{pdf_path.stem}-{page}"}
+                for page in range(start_page, end_page + 1)
+            ]
+            return words, {"truncated_line_count": 0}
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    return fake_collect_words, state
+
+
+def test_load_manifest_merges_defaults_and_resolves_paths(tmp_path):
+    manifest = load_manifest(_write_manifest(tmp_path))
+
+    assert manifest.output_dir == (tmp_path / "out").resolve()
+    assert manifest.workers == 2
+    assert manifest.spellcheck is False
+    assert [job.version for job in manifest.jobs] == ["2026", "2026", "2027"]
+    assert manifest.jobs[0].pdf == (tmp_path / "pdfs" / "2026.pdf").resolve()
+    assert manifest.jobs[2].pdf == Path("/abs/2027.pdf")
+    assert manifest.jobs[0].options == {"dpi": 200, "split_offset": -0.1}
+    assert manifest.jobs[1].options == {"dpi": 200, "split_offset": 0.05}
+
+
+def test_load_manifest_accepts_json(tmp_path):
+    path = _write_manifest(
+        tmp_path,
+        '{"jobs": [{"pdf": "a.pdf", "start_page": 1, "end_page": 1, "version": 2026}]}',
+        name="batch.json",
+    )
+    manifest = load_manifest(path)
+    assert manifest.output_dir == (tmp_path / "output").resolve()
+    assert manifest.jobs[0].version == "2026"
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("jobs = []", "at least one job"),
+        ('[[jobs]]\npdf = "a.pdf"\nversion = "2026"', "missing: start_page, end_page"),
+        (
+            '[[jobs]]\npdf = "a.pdf"\nstart_page = 1\nend_page = 1\nversion = "2026"\ndpii = 1',
+            r"Unknown key\(s\) in jobs\[0\]: dpii",
+        ),
+        (
+            '[[jobs]]\npdf = "a.pdf"\nstart_page = 1\nend_page = 1\nversion = "abc"',
+            "invalid version",
+        ),
+    ],
+)
+def test_load_manifest_rejects_invalid_manifests(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        load_manifest(_write_manifest(tmp_path, text))
+
+
+def test_run_batch_writes_each_version_once(tmp_path, monkeypatch):
+    calls = []
+    fake, state = _fake_collect(calls, delay=0.05)
+    monkeypatch.setattr(batch.core, "collect_words", fake)
+    manifest = load_manifest(_write_manifest(tmp_path))
+
+    events = []
+    result = run_batch(manifest, on_event=events.append)
+
+    assert result["failed_count"] == 0
+    assert state["max_active"] == 2
+    assert sorted(result["versions"]) == ["2026", "2027"]
+    assert result["versions"]["2026"]["written_count"] == 3
+    assert [event["event"] for event in events].count("version") == 2
+
+    db_path = tmp_path / "out" / "words.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT vv.version_key, w.word
+            FROM words AS w JOIN vocab_versions AS vv ON vv.id = w.version_id
+            ORDER BY vv.version_key, w.word
+            """
+        ).fetchall()
+    assert rows == [
+        ("2026", "2026-p1"),
+        ("2026", "2026-p2"),
+        ("2026", "2026-p3"),
+        ("2027", "2027-p1"),
+    ]
+
+
+def test_run_batch_skips_version_with_failed_job(tmp_path, monkeypatch):
+    calls = []
+    fake, _ = _fake_collect(calls, fail_on="2027.pdf")
+    monkeypatch.setattr(batch.core, "collect_words", fake)
+    manifest = load_manifest(_write_manifest(tmp_path))
+
+    result = run_batch(manifest, workers=1)
+
+    assert result["failed_count"] == 1
+    assert result["failed_versions"] == ["2027"]
+    assert "error" in result["versions"]["2027"]
+    assert result["jobs"][2]["error"] == "OCR failed"
+    with sqlite3.connect(tmp_path / "out" / "words.sqlite3") as conn:
+        versions = [row[0] for row in conn.execute("SELECT version_key FROM vocab_versions")]
+    assert versions == ["2026"]
+
+
+def test_batch_cli_reports_jobs_and_fails_on_errors(tmp_path, monkeypatch, capsys):
+    calls = []
+    fake, _ = _fake_collect(calls, fail_on="2027.pdf")
+    monkeypatch.setattr(batch.core, "collect_words", fake)
+    manifest_path = _write_manifest(tmp_path)
+    monkeypatch.setattr(
+        "sys.argv", ["neepwords", "batch", "--manifest", str(manifest_path), "--workers", "1"]
+    )
+
+    with pytest.raises(SystemExit, match="1 batch job\\(s\\) or version write\\(s\\) failed"):
+        main.main()
+
+    output = capsys.readouterr().out
+    assert "[version] 2026: 3 unique word(s), 3 written, 0 rejected" in output
+    assert "2027.pdf pages 1-1 -> 2027: failed: OCR failed" in output
+
+
+def test_batch_cli_fails_when_a_version_write_fails(tmp_path, monkeypatch, capsys):
+    calls = []
+    fake, _ = _fake_collect(calls)
+    monkeypatch.setattr(batch.core, "collect_words", fake)
+
+    def locked_db(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(output, "_write_words_db", locked_db)
+    manifest_path = _write_manifest(tmp_path)
+    monkeypatch.setattr(
+        "sys.argv", ["neepwords", "batch", "--manifest", str(manifest_path), "--workers", "1"]
+    )
+
+    with pytest.raises(SystemExit, match="2 batch job\\(s\\) or version write\\(s\\) failed"):
+        main.main()
+
+    assert "database is locked" in capsys.readouterr().out
+    result = run_batch(load_manifest(manifest_path), workers=1)
+    assert result["failed_count"] == 2
+    assert result["failed_versions"] == ["2026", "2027"]
+
+
+def test_run_batch_serializes_the_ocr_backend(tmp_path, monkeypatch):
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0, "calls": 0}
+
+    class FakeOCR:
+        def __init__(self, image, **kwargs):
+            pass
+
+        def recognize(self, unit=None):
+            with lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+                state["calls"] += 1
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return [("alpha", 0.9, (0, 0, 1, 1))]
+
+    class FakeModule:
+        OCR = FakeOCR
+
+    monkeypatch.setattr(ocr_engine, "_load_ocrmac", lambda: FakeModule)
+    monkeypatch.setattr(
+        core,
+        "iter_pdf_pages",
+        lambda pdf_path, start_page, end_page, dpi=300: iter(
+            [Image.new("RGB", (60, 60), "white")] * (end_page - start_page + 1)
+        ),
+    )
+    manifest = batch.parse_manifest(
+        {
+            "output_dir": "out",
+            "spellcheck": False,
+            "jobs": [
+                {"pdf": f"{index}.pdf", "start_page": 1, "end_page": 2, "version": "2027"}
+                for index in range(4)
+            ],
+        },
+        base_dir=tmp_path,
+    )
+
+    result = run_batch(manifest, workers=4)
+
+    assert result["failed_count"] == 0
+    assert state["calls"] == 16
+    assert state["max_active"] == 1
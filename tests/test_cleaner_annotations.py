@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from word_extractor.cleaner import (
+    AnnotationCleaner,
+    CleanedLine,
+    iter_clean_annotations,
+    normalize_text,
+)
+from word_extractor.ocr_engine import OCRAnnotation
+
+
+def test_iter_clean_annotations_keeps_bbox_and_confidence():
+    annotations = [
+        OCRAnnotation("abandon 12", 0.9, (0.1, 0.8, 0.3, 0.05)),
+        OCRAnnotation("—", 0.4, (0.1, 0.7, 0.1, 0.05)),
+        OCRAnnotation("ability", None, None),
+    ]
+    assert list(iter_clean_annotations(annotations)) == [
+        CleanedLine("abandon", 0.9, (0.1, 0.8, 0.3, 0.05)),
+        CleanedLine("ability", None, None),
+    ]
+
+
+def test_iter_clean_annotations_merges_hyphenation_across_annotations():
+    annotations = [
+        OCRAnnotation("inter-", 0.9, (0.1, 0.5, 0.2, 0.1)),
+        OCRAnnotation("national", 0.7, (0.0, 0.4, 0.4, 0.1)),
+    ]
+    [line] = iter_clean_annotations(annotations)
+    assert line.text == "international"
+    assert line.confidence == 0.7
+    assert line.bbox == pytest.approx((0.0, 0.4, 0.4, 0.2))
+
+
+def test_iter_clean_annotations_filters_low_confidence():
+    annotations = [
+        OCRAnnotation("abandon", 0.95, None),
+        OCRAnnotation("xqzt", 0.2, None),
+        OCRAnnotation("ability", None, None),
+    ]
+    lines = iter_clean_annotations(annotations, min_confidence=0.5)
+    assert [line.text for line in lines] == ["abandon", "ability"]
+
+
+def test_iter_clean_annotations_is_lazy():
+    def annotations():
+        yield OCRAnnotation("abandon", 0.9, None)
+        yield OCRAnnotation("ability", 0.9, None)
+        raise AssertionError("consumed past the first line")
+
+    lines = iter_clean_annotations(annotations())
+    assert next(lines).text == "abandon"
+
+
+def test_iter_clean_annotations_matches_normalize_text():
+    rng = random.Random(33)
+    pieces = ["stor(e)y", "inter-", "national", "-", "  ", "12", "gaol /jail", "a\nb-", "考研", ""]
+    for _ in range(2000):
+        texts = [rng.choice(pieces) for _ in range(rng.randint(0, 8))]
+        annotations = [OCRAnnotation(text, 0.9, None) for text in texts]
+        expected = normalize_text("\n".join(text for text in texts if text))
+        assert [line.text for line in iter_clean_annotations(annotations)] == expected, texts
+
+
+def test_annotation_cleaner_merges_across_feeds_with_locations():
+    cleaner = AnnotationCleaner()
+    first = list(
+        cleaner.feed(
+            [OCRAnnotation("alpha", 0.9, None), OCRAnnotation("inter-", 0.9, (0.1, 0.1, 0.2, 0.1))],
+            location=(1, "L"),
+        )
+    )
+    assert first == [CleanedLine("alpha", 0.9, None, ((1, "L"),))]
+
+    second = list(
+        cleaner.feed(
+            [OCRAnnotation("national", 0.6, (0.5, 0.9, 0.3, 0.1))],
+            location=(1, "R"),
+        )
+    )
+    assert second == [
+        CleanedLine("international", 0.6, (0.1, 0.1, 0.2, 0.1), ((1, "L"), (1, "R"))),
+    ]
+    assert list(cleaner.flush()) == []
+
+
+def test_annotation_cleaner_flush_emits_trailing_line():
+    cleaner = AnnotationCleaner()
+    assert list(cleaner.feed([OCRAnnotation("abandon-", 0.9, None)], location="p1")) == []
+    assert list(cleaner.flush()) == [CleanedLine("abandon-", 0.9, None, ("p1",))]
+    assert list(cleaner.flush()) == []
@@ -1,5 +1,68 @@
+import os
+import random
+import re
+import time
+
+import pytest
+
 from word_extractor.cleaner import expand_variants, normalize_text
 
+_FUZZ_ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyzAEIOUXYZ"
+    + "------////(((()))))\\\\"
+    + "0123456789.,;:'\"!?_*&%#@[]{}|~`^<>=+$"
+    + "     \t\r\n\n\n\x0b\x0c\x1c\x1d\x1e\x85\u00a0\u2028\u2029\u3000"
+    + "中文éßÆΩKſ"
+)
+
+
+def _reference_normalize_text(text: str) -> list[str]:
+    """The original regex implementation that the table-driven one must match."""
+    whitespace_re = re.compile(r"\s+")
+    slash_re = re.compile(r"\s*/\s*")
+    allowed_re = re.compile(r"[^a-zA-Z()/\\ -]+")
+
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    merged: list[str] = []
+    idx = 0
+    while idx < len(lines):
+        line = lines[idx]
+        if line.endswith("-") and idx + 1 < len(lines):
+            next_line = lines[idx + 1].lstrip()
+            if next_line and next_line[0].isalpha():
+                merged.append(line[:-1] + next_line)
+                idx += 2
+                continue
+        merged.append(line)
+        idx += 1
+
+    cleaned: list[str] = []
+    for line in merged:
+        line = allowed_re.sub(" ", line)
+        line = slash_re.sub(" / ", line)
+        line = whitespace_re.sub(" ", line).strip()
+        if len(line) < 2:
+            continue
+        alpha_count = sum(1 for char in line if char.isalpha())
+        if alpha_count / len(line) < 0.5:
+            continue
+        cleaned.append(line)
+    return cleaned
+
+
+def _ocr_like_page(rng: random.Random, lines: int = 60) -> str:
+    words = ["abandon", "ability", "stor(e)y", "colou(r)", "gaol / jail", "inter-", "national"]
+    noise = ["12", "—", "·", "p. 45", "()", "考研", "|", "-"]
+    rows = []
+    for _ in range(lines):
+        row = rng.choice(words)
+        if rng.random() < 0.3:
+            row += " " + rng.choice(noise)
+        if rng.random() < 0.1:
+            row = rng.choice(noise)
+        rows.append("  " + row + " " * rng.randint(0, 3))
+    return "\n".join(rows)
+
 
 def test_normalize_text_strips_disallowed_chars():
     text = "ab1c, 你好"
@@ -31,3 +94,37 @@ def test_expand_variants_expands_parentheses():
 
 def test_expand_variants_handles_combined_cases():
     assert expand_variants("colou(r) / color") == ["colour", "color"]
+
+
+def test_normalize_text_matches_reference_on_fuzzed_input():
+    rng = random.Random(20261019)
+    for _ in range(3000):
+        text = "".join(rng.choice(_FUZZ_ALPHABET) for _ in range(rng.randint(0, 120)))
+        assert normalize_text(text) == _reference_normalize_text(text), repr(text)
+
+
+def test_normalize_text_matches_reference_on_ocr_like_pages():
+    rng = random.Random(7)
+    for _ in range(200):
+        text = _ocr_like_page(rng)
+        assert normalize_text(text) == _reference_normalize_text(text)
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_normalize_text_performance_comparison():
+    rng = random.Random(1)
+    pages = [_ocr_like_page(rng, lines=80) for _ in range(2000)]
+
+    timings: dict[str, float] = {}
+    for name, func in (("reference", _reference_normalize_text), ("table", normalize_text)):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        timings[name] = time.perf_counter() - start
+
+    print(f"normalize_text over {len(pages)} pages (seconds)")
+    for name, elapsed in timings.items():
+        print(f"{name}: {elapsed:.4f}")
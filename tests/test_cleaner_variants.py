@@ -0,0 +1,130 @@
+import os
+import random
+import time
+
+import pytest
+
+from word_extractor.cleaner import (
+    MAX_VARIANTS_PER_LINE,
+    _expand_line,
+    expand_variants,
+    expand_variants_bounded,
+)
+
+
+def _reference_expand_parentheses(word: str) -> list[str]:
+    """The original recursive expansion that the iterative one must match."""
+    start = word.find("(")
+    if start == -1:
+        return [word]
+    end = word.find(")", start + 1)
+    if end == -1:
+        return [word.replace("(", "").replace(")", "")]
+    prefix = word[:start]
+    optional = word[start + 1 : end]
+    suffix = word[end + 1 :]
+    without_optional = f"{prefix}{suffix}"
+    if not optional:
+        return [without_optional]
+    with_optional = f"{prefix}{optional}{suffix}"
+    expanded: list[str] = []
+    for candidate in (without_optional, with_optional):
+        expanded.extend(_reference_expand_parentheses(candidate))
+    return expanded
+
+
+def _reference_expand_variants(line: str) -> list[str]:
+    parts = [part.strip() for part in line.split(" / ") if part.strip()]
+    variants: list[str] = []
+    seen: set[str] = set()
+    for part in parts:
+        for expanded in _reference_expand_parentheses(part):
+            if expanded and expanded not in seen:
+                variants.append(expanded)
+                seen.add(expanded)
+    return [
+        variant
+        for variant in variants
+        if not variant.startswith("-")
+        if not (variant.endswith("ou") and f"{variant}r" in seen)
+    ]
+
+
+def _adversarial_line(groups: int) -> str:
+    return "a" + "".join(f"({chr(ord('b') + index % 24)})" for index in range(groups))
+
+
+def test_expand_variants_matches_reference_on_fuzzed_lines():
+    rng = random.Random(32)
+    alphabet = "abcou-()/ r"
+    for _ in range(3000):
+        line = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 18)))
+        line = line.replace("/", " / ")
+        assert expand_variants(line, max_variants=10_000) == _reference_expand_variants(line), repr(
+            line
+        )
+
+
+def test_expand_variants_bounded_reports_truncation():
+    line = _adversarial_line(10)
+    variants, truncated = expand_variants_bounded(line, max_variants=8)
+    assert truncated is True
+    assert variants == _reference_expand_variants(line)[:8]
+
+    variants, truncated = expand_variants_bounded("stor(e)y / storey")
+    assert truncated is False
+    assert variants == ["story", "storey"]
+
+
+def test_expand_variants_caps_adversarial_line_by_default():
+    variants, truncated = expand_variants_bounded(_adversarial_line(40))
+    assert truncated is True
+    assert len(variants) == MAX_VARIANTS_PER_LINE
+
+
+def test_expand_variants_exact_cap_is_not_truncated():
+    variants, truncated = expand_variants_bounded("a(b)(c)", max_variants=4)
+    assert variants == ["a", "ac", "ab", "abc"]
+    assert truncated is False
+
+
+def test_expand_variants_rejects_non_positive_cap():
+    with pytest.raises(ValueError):
+        expand_variants("stor(e)y", max_variants=0)
+
+
+def test_expand_variants_returns_independent_lists_from_cache():
+    _expand_line.cache_clear()
+    first = expand_variants("colou(r) / color")
+    first.append("mutated")
+    assert expand_variants("colou(r) / color") == ["colour", "color"]
+    assert _expand_line.cache_info().hits == 1
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_expand_variants_performance_comparison():
+    rng = random.Random(1)
+    normal = [
+        rng.choice(["stor(e)y", "colou(r) / color", "gaol / jail", "abandon", "judg(e)ment"])
+        for _ in range(200_000)
+    ]
+    adversarial = [_adversarial_line(16) for _ in range(20)]
+
+    timings: dict[str, float] = {}
+    for name, lines in (("normal", normal), ("adversarial", adversarial)):
+        for impl, func in (
+            ("reference", _reference_expand_variants),
+            ("bounded", expand_variants),
+        ):
+            _expand_line.cache_clear()
+            start = time.perf_counter()
+            for line in lines:
+                func(line)
+            timings[f"{name}/{impl}"] = time.perf_counter() - start
+
+    print("expand_variants (seconds)")
+    for name, elapsed in timings.items():
+        print(f"{name}: {elapsed:.4f}")
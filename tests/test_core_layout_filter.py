@@ -0,0 +1,177 @@
+import random
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+from word_extractor import core
+from word_extractor.ocr_engine import OCRAnnotation
+
+
+def _thumbnail(word_list: bool) -> Image.Image:
+    image = Image.new("RGB", (298, 421), "white")
+    if word_list:
+        draw = ImageDraw.Draw(image)
+        for top in range(40, 380, 7):
+            draw.rectangle((20, top, 90, top + 3), fill="black")
+            draw.rectangle((165, top, 235, top + 3), fill="black")
+    return image
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    # Page 2 is blank; pages 1 and 3 are word lists.
+    renders = []
+    ocr_calls = []
+
+    def fake_iter_pdf_pages(pdf_path, start_page, end_page, dpi=300, *, skip_pages=()):
+        pages = [page for page in range(start_page, end_page + 1) if page not in skip_pages]
+        renders.append((dpi, pages))
+        for page in pages:
+            yield _thumbnail(page != 2) if dpi == 36 else Image.new("RGB", (100, 100))
+
+    def fake_run_ocr(image, **kwargs):
+        ocr_calls.append(image)
+        return [OCRAnnotation("alpha", 0.9, None)]
+
+    monkeypatch.setattr(core, "iter_pdf_pages", fake_iter_pdf_pages)
+    monkeypatch.setattr(core, "run_ocr", fake_run_ocr)
+    return renders, ocr_calls
+
+
+def test_layout_filter_skip_leaves_flagged_pages_out(tmp_path, fake_pdf):
+    renders, ocr_calls = fake_pdf
+
+    words, stats = core.collect_words(Path("dummy.pdf"), 1, 3, layout_filter="skip")
+
+    assert renders == [(36, [1, 2, 3]), (300, [1, 3])]
+    assert len(ocr_calls) == 4
+    assert sorted({word["page"] for word in words}) == [1, 3]
+    layout = stats["layout"]
+    assert layout["flagged_pages"] == [{"page": 2, "reason": "blank"}]
+    assert layout["skipped_count"] == 1
+    assert "estimated_seconds_saved" in layout
+    assert layout["thumbnail_seconds"] >= 0
+
+
+def test_layout_filter_flag_still_processes_every_page(tmp_path, fake_pdf):
+    renders, ocr_calls = fake_pdf
+
+    words, stats = core.collect_words(Path("dummy.pdf"), 1, 3, layout_filter="flag")
+
+    assert renders == [(36, [1, 2, 3]), (300, [1, 2, 3])]
+    assert len(ocr_calls) == 6
+    assert stats["layout"]["flagged_pages"] == [{"page": 2, "reason": "blank"}]
+    assert stats["layout"]["skipped_count"] == 0
+
+
+def test_layout_filter_off_skips_the_thumbnail_pass(tmp_path, fake_pdf):
+    renders, _ = fake_pdf
+
+    _, stats = core.collect_words(Path("dummy.pdf"), 1, 3)
+
+    assert renders == [(300, [1, 2, 3])]
+    assert stats == {"truncated_line_count": 0}
+
+
+def test_layout_filter_rejects_unknown_mode():
+    with pytest.raises(ValueError, match="layout_filter must be one of"):
+        core.collect_words(Path("dummy.pdf"), 1, 1, layout_filter="maybe")
+
+
+@pytest.fixture
+def duplicated_pdf(monkeypatch):
+    # Page 3 is a rescan of page 1.
+    renders = []
+    ocr_calls = []
+    contents = {1: 1, 2: 2, 3: 1}
+
+    def fake_iter_pdf_pages(pdf_path, start_page, end_page, dpi=300, *, skip_pages=()):
+        pages = [page for page in range(start_page, end_page + 1) if page not in skip_pages]
+        renders.append((dpi, pages))
+        for page in pages:
+            image = Image.new("RGB", (298, 421), "white")
+            draw = ImageDraw.Draw(image)
+            for index, top in enumerate(range(40, 380, 7)):
+                width = 30 + (index * 37 * contents[page]) % 60
+                draw.rectangle((20, top, 20 + width, top + 3), fill="black")
+                draw.rectangle((165, top, 165 + width, top + 3), fill="black")
+            yield image
+
+    def fake_run_ocr(image, **kwargs):
+        ocr_calls.append(image)
+        return [OCRAnnotation("alpha", 0.9, None)]
+
+    monkeypatch.setattr(core, "iter_pdf_pages", fake_iter_pdf_pages)
+    monkeypatch.setattr(core, "run_ocr", fake_run_ocr)
+    return renders, ocr_calls
+
+
+def test_skip_duplicate_pages_on_full_renders(duplicated_pdf):
+    renders, ocr_calls = duplicated_pdf
+
+    words, stats = core.collect_words(Path("dummy.pdf"), 1, 3, skip_duplicate_pages=True)
+
+    assert renders == [(300, [1, 2, 3])]
+    assert len(ocr_calls) == 4
+    assert [entry["page"] for entry in stats["duplicate_pages"]] == [3]
+    assert stats["duplicate_pages"][0]["duplicate_of"] == 1
+    assert sorted({word["page"] for word in words}) == [1, 2]
+
+
+def test_skip_duplicate_pages_uses_thumbnails_with_layout_filter(duplicated_pdf):
+    renders, ocr_calls = duplicated_pdf
+
+    _, stats = core.collect_words(
+        Path("dummy.pdf"), 1, 3, layout_filter="flag", skip_duplicate_pages=True
+    )
+
+    assert renders == [(36, [1, 2, 3]), (300, [1, 2])]
+    assert stats["duplicate_pages"] == [{"page": 3, "duplicate_of": 1, "distance": 0}]
+
+
+def test_skip_duplicate_pages_keeps_distinct_pages_with_the_same_layout(monkeypatch):
+    # Same two-column layout and similar word lengths, different words.
+    ocr_calls = []
+
+    def fake_iter_pdf_pages(pdf_path, start_page, end_page, dpi=300, *, skip_pages=()):
+        for page in range(start_page, end_page + 1):
+            if page in skip_pages:
+                continue
+            rng = random.Random(page)
+            image = Image.new("RGB", (298, 421), "white")
+            draw = ImageDraw.Draw(image)
+            for top in range(40, 380, 7):
+                draw.rectangle((20, top, 20 + rng.randint(55, 65), top + 3), fill="black")
+                draw.rectangle((165, top, 165 + rng.randint(55, 65), top + 3), fill="black")
+            yield image
+
+    monkeypatch.setattr(core, "iter_pdf_pages", fake_iter_pdf_pages)
+    monkeypatch.setattr(core, "run_ocr", lambda image, **kwargs: ocr_calls.append(image) or [])
+
+    for layout_filter in ("off", "flag"):
+        ocr_calls.clear()
+        _, stats = core.collect_words(
+            Path("dummy.pdf"), 1, 4, layout_filter=layout_filter, skip_duplicate_pages=True
+        )
+        assert stats["duplicate_pages"] == []
+        assert len(ocr_calls) == 8
+
+
+def test_skip_duplicate_pages_does_not_hash_flagged_thumbnails(fake_pdf, monkeypatch):
+    hashed = []
+    real_dhash = core.page_dhash
+
+    def recording_dhash(image, **kwargs):
+        hashed.append(image)
+        return real_dhash(image, **kwargs)
+
+    monkeypatch.setattr(core, "page_dhash", recording_dhash)
+
+    _, stats = core.collect_words(
+        Path("dummy.pdf"), 1, 3, layout_filter="flag", skip_duplicate_pages=True
+    )
+
+    # Blank page 2 is flagged, so only pages 1 and 3 are hashed and compared.
+    assert len(hashed) == 2
+    assert stats["duplicate_pages"] == [{"page": 3, "duplicate_of": 1, "distance": 0}]
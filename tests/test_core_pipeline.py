@@ -44,7 +44,7 @@ def test_extract_words_wires_pipeline(tmp_path, monkeypatch):
         split_offset=0.0,
     )
 
-    assert stats == {"total_count": 4}
+    assert stats == {"total_count": 4, "truncated_line_count": 0}
     assert saved["called"] is True
     assert captured["words"] == [
         {
@@ -78,3 +78,48 @@ def test_extract_words_wires_pipeline(tmp_path, monkeypatch):
     ]
     assert captured["version"] == "2027"
     assert captured["source_pdf"] == "dummy.pdf"
+
+
+def test_extract_words_merges_hyphenation_across_columns_and_pages(tmp_path, monkeypatch):
+    images = [Image.new("RGB", (100, 100), "white") for _ in range(2)]
+    columns = iter(
+        [
+            [OCRAnnotation("alpha", 0.9, None), OCRAnnotation("inter-", 0.9, None)],
+            [OCRAnnotation("national", 0.8, None), OCRAnnotation("envi-", 0.9, None)],
+            [OCRAnnotation("ronment", 0.9, None)],
+            [OCRAnnotation("beta", 0.9, None)],
+        ]
+    )
+
+    def fake_iter_pdf_pages(pdf_path, start_page, end_page, dpi=300):
+        return iter(images)
+
+    def fake_run_ocr(image, **kwargs):
+        return next(columns)
+
+    captured = {}
+
+    def fake_write_outputs(words, output_dir, **kwargs):
+        captured["words"] = words
+        return {"total_count": len(words)}
+
+    monkeypatch.setattr(core, "iter_pdf_pages", fake_iter_pdf_pages)
+    monkeypatch.setattr(core, "run_ocr", fake_run_ocr)
+    monkeypatch.setattr(core, "write_outputs", fake_write_outputs)
+
+    core.extract_words(
+        pdf_path=Path("dummy.pdf"),
+        start_page=3,
+        end_page=4,
+        output_dir=tmp_path,
+        version="2027",
+        crop_ratio_top=0.0,
+        crop_ratio_bottom=0.0,
+    )
+
+    assert [(item["word"], item["source"], item["line"]) for item in captured["words"]] == [
+        ("alpha", "dummy-3-L-1-alpha", 1),
+        ("international", "dummy-3-L-2+3-R-1-international", 2),
+        ("environment", "dummy-3-R-2+4-L-1-environment", 2),
+        ("beta", "dummy-4-R-1-beta", 1),
+    ]
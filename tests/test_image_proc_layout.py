@@ -0,0 +1,79 @@
+import random
+
+from PIL import Image, ImageDraw
+
+from word_extractor.image_proc import analyze_page_layout, hamming_distance, page_dhash
+
+THUMB_SIZE = (298, 421)  # A4 at 36 DPI
+
+
+def _word_list_page(seed: int = 0) -> Image.Image:
+    rng = random.Random(seed)
+    image = Image.new("RGB", THUMB_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+    for top in range(40, 380, 7):
+        draw.rectangle((20, top, 20 + rng.randint(25, 100), top + 3), fill="black")
+        draw.rectangle((165, top, 165 + rng.randint(25, 100), top + 3), fill="black")
+    return image
+
+
+def _title_page() -> Image.Image:
+    image = Image.new("RGB", THUMB_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((60, 150, 240, 165), fill="black")
+    draw.rectangle((100, 190, 200, 196), fill="black")
+    return image
+
+
+def _table_page() -> Image.Image:
+    image = Image.new("RGB", THUMB_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+    for top in range(40, 380, 14):
+        draw.line((20, top, 278, top), fill="black")
+        draw.rectangle((25, top + 4, 270, top + 8), fill="gray")
+    for left in (20, 100, 149, 200, 278):
+        draw.line((left, 40, left, 376), fill="black")
+    return image
+
+
+def _single_column_page() -> Image.Image:
+    image = Image.new("RGB", THUMB_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+    for top in range(40, 380, 7):
+        draw.rectangle((20, top, 120, top + 3), fill="black")
+    return image
+
+
+def test_analyze_page_layout_accepts_two_column_word_list():
+    layout = analyze_page_layout(_word_list_page())
+    assert layout.is_word_list
+    assert layout.text_rows >= 40
+    assert layout.gutter_width > 0.05
+
+
+def test_analyze_page_layout_rejects_non_vocabulary_pages():
+    assert analyze_page_layout(Image.new("RGB", THUMB_SIZE, "white")).reason == "blank"
+    assert analyze_page_layout(_title_page()).reason == "sparse"
+    # Ruled tables merge every row into one band and have no blank gutter.
+    assert analyze_page_layout(_table_page()).reason in {"sparse", "no_gutter"}
+    assert analyze_page_layout(_single_column_page()).reason == "single_column"
+
+
+def test_analyze_page_layout_respects_split_offset():
+    layout = analyze_page_layout(_word_list_page(), split_offset=0.05)
+    assert layout.is_word_list
+
+
+def _with_footer(image: Image.Image, page_number: int) -> Image.Image:
+    stamped = image.copy()
+    ImageDraw.Draw(stamped).text((140, 405), str(page_number), fill="black")
+    return stamped
+
+
+def test_page_dhash_matches_rescans_and_ignores_page_numbers():
+    page = _word_list_page(seed=1)
+    rescan = _with_footer(page, 42).rotate(0.3, fillcolor="white")
+
+    assert hamming_distance(page_dhash(page), page_dhash(rescan)) <= 12
+    assert hamming_distance(page_dhash(page), page_dhash(_word_list_page(seed=2))) > 40
+    assert page_dhash(page).bit_length() <= 256
@@ -1,12 +1,24 @@
 import json
 import os
+import sqlite3
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 import pytest
 
+from neep_mcp import lexicon as lexicon_module
 from neep_mcp.lexicon import WordsLexicon, build_lexicon
+from neep_mcp.snapshot import SNAPSHOTS
+from word_extractor.output import add_words_to_db
+from word_extractor.storage import (
+    build_search_index,
+    ensure_version_row,
+    ensure_versioned_schema,
+    has_word_forms,
+    upgrade_versioned_schema,
+)
 
 
 @pytest.fixture
@@ -32,6 +44,206 @@ def test_lookup_words_uses_db_default_version(lexicon: WordsLexicon):
     assert missing["version"] == "2026"
 
 
+def test_lookup_words_keeps_input_order_duplicates_and_invalid_items(lexicon: WordsLexicon):
+    inputs = ["Transport", "中文", "zzzz", "abandon", "transport", "form"]
+
+    payload, warnings = lexicon.lookup_words(inputs, version="2026")
+
+    assert warnings == ["no_english_tokens"]
+    assert [item["input"] for item in payload["results"]] == inputs
+    assert [item["found"] for item in payload["results"]] == [True, False, False, True, True, True]
+    assert payload["results"][1] == {"input": "中文", "found": False, "error": "invalid_input"}
+    assert payload["results"][0]["word"] == payload["results"][4]["word"] == "transport"
+    assert payload["results"][2] == {
+        "input": "zzzz",
+        "query": "zzzz",
+        "found": False,
+        "version": "2026",
+    }
+
+
+def test_lookup_words_spans_several_query_chunks(
+    tmp_path: Path, synthetic_words, monkeypatch: pytest.MonkeyPatch
+):
+    db_path = tmp_path / "words.sqlite3"
+    stored = synthetic_words(30)
+    add_words_to_db(stored, db_path=db_path, version="2026")
+    monkeypatch.setattr(lexicon_module, "_LOOKUP_CHUNK_SIZE", 7)
+
+    queries = [*reversed(stored), "missingword"]
+    payload, _ = WordsLexicon(db_path).lookup_words(queries)
+
+    assert [item["query"] for item in payload["results"]] == queries
+    assert [item["found"] for item in payload["results"]] == [True] * 30 + [False]
+
+
+@pytest.mark.parametrize("engine", lexicon_module.ENGINES)
+def test_lookup_words_norm_match_folds_spelling_variants(sample_words_db: Path, engine: str):
+    add_words_to_db(
+        ["colour", "color", "center", "organise"], db_path=sample_words_db, version="2026"
+    )
+    inputs = ["Color", "colour", "centre", "Organize", "COOPERATE", "co operate", "xyz", "中文"]
+
+    payload, warnings = WordsLexicon(sample_words_db, engine=engine).lookup_words(
+        inputs, match="norm", version="2026"
+    )
+
+    assert warnings == ["no_english_tokens"]
+    assert [item.get("word") for item in payload["results"]] == [
+        "color",
+        "colour",
+        "center",
+        "organise",
+        "co-operate",
+        "co-operate",
+        None,
+        None,
+    ]
+    assert payload["results"][2]["query"] == "center"
+    assert payload["results"][6] == {
+        "input": "xyz",
+        "query": "xyz",
+        "found": False,
+        "version": "2026",
+    }
+
+
+def test_lookup_words_norm_match_before_and_after_schema_upgrade(sample_words_db: Path):
+    # Recreate the pre-upgrade schema: no norm_key column or index.
+    with sqlite3.connect(sample_words_db) as conn:
+        conn.execute("DROP INDEX idx_words_version_norm")
+        conn.execute("ALTER TABLE words DROP COLUMN norm_key")
+    lexicon = WordsLexicon(sample_words_db)
+
+    def found_words() -> list[str | None]:
+        payload, _ = lexicon.lookup_words(["Cooperate", "TEST", "forms"], match="norm")
+        return [item.get("word") for item in payload["results"]]
+
+    assert found_words() == ["co-operate", "test", None]
+
+    with sqlite3.connect(sample_words_db) as conn:
+        applied = upgrade_versioned_schema(conn)
+        assert applied == ["add_norm_key", "backfill_norm_key", "index_norm_key"]
+        # A writer that predates the column leaves it empty.
+        conn.execute("UPDATE words SET norm_key = NULL WHERE word = 'co-operate'")
+    assert found_words() == ["co-operate", "test", None]
+
+
+@pytest.mark.parametrize("word_forms", [False, True])
+@pytest.mark.parametrize("engine", lexicon_module.ENGINES)
+def test_lookup_words_resolves_inflected_forms_to_headwords(
+    sample_words_db: Path, engine: str, word_forms: bool
+):
+    if word_forms:
+        with sqlite3.connect(sample_words_db) as conn:
+            upgrade_versioned_schema(conn, word_forms=True)
+    add_words_to_db(["go", "big"], db_path=sample_words_db, version="2026")
+    lexicon = WordsLexicon(sample_words_db, engine=engine)
+    inputs = ["abandoned", "Abilities", "went", "bigger", "transport", "deformation"]
+
+    payload, _ = lexicon.lookup_words(inputs, version="2026")
+
+    results = payload["results"]
+    assert [item.get("word") for item in results] == [
+        "abandon",
+        "ability",
+        "go",
+        "big",
+        "transport",
+        None,
+    ]
+    assert [item.get("matched_by") for item in results] == ["inflection"] * 4 + [None, None]
+    assert results[0]["query"] == "abandoned"
+    strict, _ = lexicon.lookup_words(["abandoned"], match="word", version="2026")
+    assert strict["results"][0]["found"] is False
+
+
+def test_lookup_words_does_not_map_agent_nouns_to_verbs(sample_words_db: Path):
+    add_words_to_db(["walk"], db_path=sample_words_db, version="2026")
+    lexicon = WordsLexicon(sample_words_db)
+
+    payload, _ = lexicon.lookup_words(["walked", "walker", "tester"], version="2026")
+
+    assert [item["found"] for item in payload["results"]] == [True, False, False]
+
+
+def test_word_forms_table_is_opt_in(sample_words_db: Path):
+    lexicon = WordsLexicon(sample_words_db)
+
+    with sqlite3.connect(sample_words_db) as conn:
+        assert not has_word_forms(conn)
+        assert upgrade_versioned_schema(conn, backfill=True) == []
+    payload, _ = lexicon.lookup_words(["tested"], version="2026")
+    assert payload["results"][0]["word"] == "test"
+
+    with sqlite3.connect(sample_words_db) as conn:
+        applied = upgrade_versioned_schema(conn, word_forms=True)
+        assert applied == ["add_word_forms", "backfill_word_forms"]
+        assert conn.execute(
+            "SELECT word FROM word_forms WHERE form = 'tested' ORDER BY version_id"
+        ).fetchall() == [("test",)]
+        assert upgrade_versioned_schema(conn, backfill=True, word_forms=True) == []
+    # Once the table exists, writers keep it filled.
+    add_words_to_db(["stop"], db_path=sample_words_db, version="2026")
+    with sqlite3.connect(sample_words_db) as conn:
+        assert conn.execute("SELECT word FROM word_forms WHERE form = 'stopped'").fetchall() == [
+            ("stop",)
+        ]
+    payload, _ = lexicon.lookup_words(["tested", "stopped"], version="2026")
+    assert [item["word"] for item in payload["results"]] == ["test", "stop"]
+
+
+def test_lookup_across_versions_matches_with_and_without_word_forms(sample_words_db: Path):
+    lexicon = WordsLexicon(sample_words_db)
+    inputs = ["transported", "abandoned", "formations", "tested", "walker"]
+
+    computed, _ = lexicon.lookup_words(inputs, versions="all")
+    with sqlite3.connect(sample_words_db) as conn:
+        upgrade_versioned_schema(conn, word_forms=True)
+    stored, _ = lexicon.lookup_words(inputs, versions="all")
+
+    assert computed == stored
+    assert [item.get("word") for item in computed["results"]] == [
+        "transport",
+        "abandon",
+        "formation",
+        "test",
+        None,
+    ]
+
+
+def test_lookup_words_reports_versions_containing_each_word(lexicon: WordsLexicon):
+    inputs = ["abandon", "adaptive", "biology", "co-operate", "transported", "zzzz", "中文"]
+
+    payload, warnings = lexicon.lookup_words(inputs, versions="all")
+
+    assert warnings == ["no_english_tokens"]
+    assert payload["versions"] == ["2026", "2027"]
+    assert [item.get("versions") for item in payload["results"]] == [
+        ["2026", "2027"],
+        ["2027"],
+        ["2026"],
+        ["2026", "2027"],
+        ["2026", "2027"],
+        [],
+        None,
+    ]
+    assert payload["results"][4]["word"] == "transport"
+    assert payload["results"][4]["matched_by"] == "inflection"
+
+    subset, _ = lexicon.lookup_words(["abandon", "biology"], versions=["2027", "2027"])
+    assert subset["versions"] == ["2027"]
+    assert [item["found"] for item in subset["results"]] == [True, False]
+
+    for kwargs in ({"versions": "all", "version": "2026"}, {"versions": "all", "match": "norm"}):
+        with pytest.raises(ValueError, match="invalid_versions"):
+            lexicon.lookup_words(["abandon"], **kwargs)
+    with pytest.raises(ValueError, match="invalid_versions"):
+        lexicon.lookup_words(["abandon"], versions=[])
+    with pytest.raises(ValueError, match="unknown_version"):
+        lexicon.lookup_words(["abandon"], versions=["2030"])
+
+
 def test_search_words_supports_explicit_version(lexicon: WordsLexicon):
     payload, warnings = lexicon.search_words(
         "form",
@@ -52,6 +264,137 @@ def test_search_words_supports_explicit_version(lexicon: WordsLexicon):
     assert {item["word"] for item in payload["results"]} == {"formation"}
 
 
+@pytest.mark.parametrize(
+    ("mode", "query"),
+    [
+        ("prefix", "trans"),
+        ("suffix", "logy"),
+        ("contains", "ver"),
+        ("fuzzy", "tnt"),
+        ("wildcard", "%o_m%"),
+        ("wildcard", "CO-%"),
+    ],
+)
+def test_memory_engine_matches_sqlite_results_and_paging(sample_words_db: Path, mode, query):
+    sqlite_lexicon = WordsLexicon(sample_words_db)
+    memory_lexicon = WordsLexicon(sample_words_db, engine="memory")
+
+    for offset in (0, 1, 3):
+        expected = sqlite_lexicon.search_words(query, mode=mode, limit=2, offset=offset)
+        assert memory_lexicon.search_words(query, mode=mode, limit=2, offset=offset) == expected
+    inputs = ["abandon", "Adaptive", "missing", "中文", "abandon"]
+    for version in ("2026", "2027"):
+        expected = sqlite_lexicon.lookup_words(inputs, version=version)
+        assert memory_lexicon.lookup_words(inputs, version=version) == expected
+
+
+def test_memory_engine_reloads_after_the_database_changes(sample_words_db: Path):
+    SNAPSHOTS.clear()
+    lexicon = WordsLexicon(sample_words_db, engine="memory")
+    assert lexicon.lookup_words(["zebra"], version="2027")[0]["results"][0]["found"] is False
+
+    add_words_to_db(["zebra"], db_path=sample_words_db, version="2027")
+
+    payload, _ = lexicon.lookup_words(["zebra"], version="2027")
+    assert payload["results"][0]["found"] is True
+    search, _ = lexicon.search_words("ze", mode="prefix", version="2027")
+    assert search["results"] == [{"word": "zebra"}]
+
+
+def test_search_words_with_trigram_index_matches_like_scan(sample_words_db: Path):
+    searches = [
+        ("contains", "form"),
+        ("contains", "vert"),
+        ("suffix", "logy"),
+        ("suffix", "ion"),
+        ("wildcard", "%por%"),
+        ("wildcard", "in%tion"),
+        ("fuzzy", "tnt"),
+        ("prefix", "trans"),
+    ]
+    lexicon = WordsLexicon(sample_words_db)
+    expected = [lexicon.search_words(query, mode=mode, version="2026") for mode, query in searches]
+    expected_ion_pages = _like_scan(sample_words_db, "%ion%", "2026")
+
+    with sqlite3.connect(sample_words_db) as conn:
+        assert build_search_index(conn) == 37
+
+    assert [
+        lexicon.search_words(query, mode=mode, version="2026") for mode, query in searches
+    ] == expected
+
+    first, _ = lexicon.search_words("ion", mode="contains", limit=2, version="2026")
+    second, _ = lexicon.search_words(
+        "ion", mode="contains", limit=2, version="2026", cursor=first["next_cursor"]
+    )
+    assert first["results"] + second["results"] == expected_ion_pages
+    assert second["next_cursor"] is None
+    assert [
+        lexicon.search_words(query, mode=mode, version="2026", count_only=True)[0]["total"]
+        for mode, query in searches
+    ] == [len(payload["results"]) for payload, _ in expected]
+
+    stats = add_words_to_db(["reformation", "form"], db_path=sample_words_db, version="2026")
+    assert stats["written_count"] == 1
+    payload, _ = lexicon.search_words("formation", mode="contains", version="2026")
+    assert payload["results"] == [{"word": "information"}, {"word": "reformation"}]
+
+
+def _like_scan(db_path: Path, pattern: str, version: str) -> list[dict[str, str]]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT w.word FROM words AS w JOIN vocab_versions AS vv ON vv.id = w.version_id
+            WHERE vv.version_key = ? AND w.word LIKE ? ORDER BY w.word
+            """,
+            (version, pattern),
+        ).fetchall()
+    return [{"word": row[0]} for row in rows]
+
+
+def test_suffix_search_matches_like_before_and_after_schema_upgrade(sample_words_db: Path):
+    # Recreate the pre-upgrade schema: no reversed_word column or index.
+    with sqlite3.connect(sample_words_db) as conn:
+        conn.execute("DROP INDEX idx_words_version_reversed")
+        conn.execute("ALTER TABLE words DROP COLUMN reversed_word")
+    lexicon = WordsLexicon(sample_words_db)
+    suffixes = ["ion", "logy", "t", "-operate"]
+
+    def search_all() -> list[list[dict[str, str]]]:
+        return [
+            lexicon.search_words(suffix, mode="suffix", limit=200, version="2026")[0]["results"]
+            for suffix in suffixes
+        ]
+
+    expected = [_like_scan(sample_words_db, f"%{suffix}", "2026") for suffix in suffixes]
+    assert search_all() == expected
+
+    with sqlite3.connect(sample_words_db) as conn:
+        applied = upgrade_versioned_schema(conn)
+        assert applied == ["add_reversed_word", "backfill_reversed_word", "index_reversed_word"]
+        assert conn.execute(
+            "SELECT COUNT(*) FROM words WHERE reversed_word IS NULL"
+        ).fetchone() == (0,)
+        # A writer that predates the column leaves it empty.
+        conn.execute("UPDATE words SET reversed_word = NULL WHERE word = 'termination'")
+    assert search_all() == expected
+
+    payload, _ = lexicon.search_words("ion", mode="suffix", limit=2, offset=1, version="2026")
+    assert payload["results"] == expected[0][1:3]
+
+
+def test_build_lexicon_reads_engine_from_env(
+    sample_words_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("NEEP_WORDS_DB_PATH", os.fspath(sample_words_db))
+    monkeypatch.setenv("NEEP_WORDS_ENGINE", "memory")
+    assert build_lexicon(start=Path.cwd()).engine == "memory"
+
+    monkeypatch.setenv("NEEP_WORDS_ENGINE", "redis")
+    with pytest.raises(ValueError, match="invalid_engine"):
+        build_lexicon(start=Path.cwd())
+
+
 def test_build_lexicon_uses_env_default_version(
     sample_words_db: Path, monkeypatch: pytest.MonkeyPatch
 ):
@@ -97,6 +440,31 @@ def test_skill_query_script_json_output(sample_words_db: Path):
     assert response["data"]["results"][1]["status"] == "not_found"
 
 
+def test_skill_lookup_script_reports_versions(sample_words_db: Path):
+    env = {**os.environ, "NEEP_WORDS_DB_PATH": str(sample_words_db)}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "skills/neep-vocab/scripts/neep_vocab.py",
+            "lookup",
+            "--versions",
+            "2026, 2027",
+            "abandon",
+            "adaptive",
+        ],
+        cwd=Path.cwd(),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.splitlines() == [
+        "abandon: found | word=abandon | versions=2026,2027",
+        "adaptive: found | word=adaptive | versions=2027",
+    ]
+
+
 def test_skill_search_script_json_output(sample_words_db: Path):
     env = {**os.environ, "NEEP_WORDS_DB_PATH": str(sample_words_db)}
     result = subprocess.run(
@@ -255,3 +623,156 @@ def test_skill_search_script_reports_structured_error(sample_words_db: Path):
     assert response["error"]["code"] == "invalid_query"
     assert response["error"]["retryable"] is False
     assert "English letter" in response["error"]["hint"]
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_lookup_words_performance(tmp_path: Path, synthetic_words, monkeypatch: pytest.MonkeyPatch):
+    db_path = tmp_path / "words.sqlite3"
+    stored = synthetic_words(20_000)
+    add_words_to_db(stored, db_path=db_path, version="2026")
+    monkeypatch.setattr(lexicon_module, "MAX_LOOKUP", 10_000)
+    lexicon = WordsLexicon(db_path)
+
+    print("lookup_words latency (seconds)")
+    for count in (1, 50, 200, 10_000):
+        # Every other query misses so both branches are exercised.
+        queries = [word if index % 2 else f"{word}x" for index, word in enumerate(stored[:count])]
+        loops = 20 if count < 10_000 else 3
+        start = time.perf_counter()
+        for _ in range(loops):
+            payload, _ = lexicon.lookup_words(queries)
+        elapsed = (time.perf_counter() - start) / loops
+        assert len(payload["results"]) == count
+        print(f"{count}: {elapsed:.6f}")
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_lookup_words_across_versions_performance(tmp_path: Path, synthetic_words):
+    db_path = tmp_path / "words.sqlite3"
+    stored = synthetic_words(10_000)
+    version_keys = [str(2016 + index) for index in range(10)]
+    for index, version in enumerate(version_keys):
+        # Each version keeps a different 90% of the words.
+        add_words_to_db(
+            [word for number, word in enumerate(stored) if number % 10 != index],
+            db_path=db_path,
+            version=version,
+        )
+    lexicon = WordsLexicon(db_path)
+    queries = stored[::50]
+
+    def per_version() -> dict[str, list[str]]:
+        found: dict[str, list[str]] = {word: [] for word in queries}
+        for version in version_keys:
+            payload, _ = lexicon.lookup_words(queries, version=version)
+            for item in payload["results"]:
+                if item["found"]:
+                    found[item["query"]].append(version)
+        return found
+
+    def grouped() -> dict[str, list[str]]:
+        payload, _ = lexicon.lookup_words(queries, versions="all")
+        return {item["query"]: item["versions"] for item in payload["results"]}
+
+    assert grouped() == per_version()
+    loops = 20
+    timings = {}
+    for name, run in (("per_version", per_version), ("versions_all", grouped)):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        timings[name] = (time.perf_counter() - start) / loops
+    print(
+        f"membership of {len(queries)} words across {len(version_keys)} versions: "
+        f"per-version calls {timings['per_version']:.4f}s, "
+        f"versions='all' {timings['versions_all']:.4f}s"
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_search_words_trigram_index_performance(tmp_path: Path, synthetic_words):
+    db_path = tmp_path / "words.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        ensure_versioned_schema(conn)
+        version_ids = [ensure_version_row(conn, str(year)) for year in range(2026, 2030)]
+        conn.executemany(
+            "INSERT INTO words (version_id, word) VALUES (?, ?)",
+            (
+                (version_ids[index % 4], word)
+                for index, word in enumerate(synthetic_words(1_000_000))
+            ),
+        )
+    lexicon = WordsLexicon(db_path)
+    # Synthetic words all end in "word", so queries avoid that trigram.
+    searches = [
+        ("contains", "vert"),
+        ("contains", "qxz"),
+        ("suffix", "hrdword"),
+        ("wildcard", "%tio%"),
+    ]
+
+    def measure() -> dict[tuple[str, str], tuple[float, list[dict[str, str]]]]:
+        timings = {}
+        for mode, query in searches:
+            start = time.perf_counter()
+            for _ in range(5):
+                payload, _ = lexicon.search_words(query, mode=mode, limit=20, version="2027")
+            timings[(mode, query)] = ((time.perf_counter() - start) / 5, payload["results"])
+        return timings
+
+    before = measure()
+    with sqlite3.connect(db_path) as conn:
+        start = time.perf_counter()
+        build_search_index(conn)
+        build_seconds = time.perf_counter() - start
+    after = measure()
+
+    print(f"search_words latency on 1M words (seconds), index build {build_seconds:.1f}s")
+    for key, (seconds, results) in before.items():
+        assert after[key][1] == results
+        print(f"{key[0]} {key[1]}: LIKE scan {seconds:.6f} -> trigram {after[key][0]:.6f}")
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_search_words_cursor_vs_offset_performance(tmp_path: Path, synthetic_words):
+    db_path = tmp_path / "words.sqlite3"
+    add_words_to_db(synthetic_words(200_000), db_path=db_path, version="2026")
+    lexicon = WordsLexicon(db_path)
+
+    def page_through(use_cursor: bool) -> tuple[int, float, float]:
+        pages, offset, cursor = 0, 0, None
+        start = time.perf_counter()
+        last_page = 0.0
+        while pages < 500:
+            page_start = time.perf_counter()
+            payload, _ = lexicon.search_words(
+                "e",
+                mode="contains",
+                limit=200,
+                offset=0 if use_cursor else offset,
+                cursor=cursor if use_cursor else None,
+            )
+            last_page = time.perf_counter() - page_start
+            pages += 1
+            offset += 200
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                break
+        return pages, time.perf_counter() - start, last_page
+
+    print("contains 'e' paged 200 at a time (seconds)")
+    for label, use_cursor in (("offset", False), ("cursor", True)):
+        pages, total, last_page = page_through(use_cursor)
+        print(f"{label}: {pages} pages in {total:.3f}, last page {last_page:.6f}")
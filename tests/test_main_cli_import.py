@@ -0,0 +1,114 @@
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_import_cli_reads_stdin_csv(tmp_path: Path):
+    db_path = tmp_path / "words.sqlite3"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "word_extractor",
+            "import",
+            "--db-path",
+            str(db_path),
+            "--version",
+            "2027",
+        ],
+        cwd=Path.cwd(),
+        input="word,source\nadaptive,manual-1\n  ,blank\ndebug,\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.startswith("Imported 2 of 3 row(s) into version(s) 2027 in ")
+    assert "rows/s" in result.stdout
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT word, source FROM words ORDER BY word").fetchall()
+    assert rows == [("adaptive", "manual-1"), ("debug", None)]
+
+
+def test_import_cli_detects_jsonl_file(tmp_path: Path):
+    db_path = tmp_path / "words.sqlite3"
+    input_path = tmp_path / "words.jsonl"
+    input_path.write_text('{"word": "abandon", "version": "26"}\n', encoding="utf-8")
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "word_extractor",
+            "import",
+            "--db-path",
+            str(db_path),
+            "--input",
+            str(input_path),
+            "--bulk",
+        ],
+        cwd=Path.cwd(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT vv.version_key, w.word
+            FROM words AS w
+            JOIN vocab_versions AS vv ON vv.id = w.version_id
+            """
+        ).fetchall()
+    assert rows == [("2026", "abandon")]
+
+
+def test_export_cli_streams_to_stdout_for_import(sample_words_db: Path, tmp_path: Path):
+    exported = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "word_extractor",
+            "export",
+            "--db-path",
+            str(sample_words_db),
+            "--output",
+            "-",
+            "--format",
+            "jsonl",
+            "--columns",
+            "version,word,source",
+            "--version",
+            "2027",
+        ],
+        cwd=Path.cwd(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert exported.stderr.strip() == "Exported 8 row(s) to stdout."
+
+    db_path = tmp_path / "copy.sqlite3"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "word_extractor",
+            "import",
+            "--db-path",
+            str(db_path),
+            "--format",
+            "jsonl",
+        ],
+        cwd=Path.cwd(),
+        input=exported.stdout,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    with sqlite3.connect(db_path) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+    assert count == 8
@@ -1,5 +1,6 @@
 import json
 import os
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
@@ -68,3 +69,75 @@ def test_set_default_version_cli_switches_default(sample_words_db: Path):
     assert response["data"]["version"] == "2027"
     assert response["data"]["version_source"] == "db_default"
     assert response["data"]["results"][0]["found"] is True
+
+
+def test_build_search_index_cli_reports_indexed_words(sample_words_db: Path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "word_extractor",
+            "build-search-index",
+            "--db-path",
+            str(sample_words_db),
+        ],
+        cwd=Path.cwd(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == f"Search index built over 37 word(s) in {sample_words_db}."
+
+
+def test_upgrade_db_cli_adds_reversed_word_index(sample_words_db: Path):
+    with sqlite3.connect(sample_words_db) as conn:
+        conn.execute("DROP INDEX idx_words_version_reversed")
+        conn.execute("ALTER TABLE words DROP COLUMN reversed_word")
+
+    command = [
+        sys.executable,
+        "-m",
+        "word_extractor",
+        "upgrade-db",
+        "--db-path",
+        str(sample_words_db),
+    ]
+    first = subprocess.run(command, cwd=Path.cwd(), capture_output=True, text=True, check=True)
+    second = subprocess.run(command, cwd=Path.cwd(), capture_output=True, text=True, check=True)
+
+    assert first.stdout.strip() == (
+        f"Database {sample_words_db} upgraded: "
+        "add_reversed_word, backfill_reversed_word, index_reversed_word."
+    )
+    assert second.stdout.strip() == f"Database {sample_words_db} is already up to date."
+
+
+def test_upgrade_db_cli_builds_and_drops_word_forms(sample_words_db: Path):
+    def upgrade(*flags: str) -> str:
+        return subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "word_extractor",
+                "upgrade-db",
+                "--db-path",
+                str(sample_words_db),
+                *flags,
+            ],
+            cwd=Path.cwd(),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    assert upgrade() == f"Database {sample_words_db} is already up to date."
+    assert upgrade("--word-forms") == (
+        f"Database {sample_words_db} upgraded: add_word_forms, backfill_word_forms."
+    )
+    assert upgrade("--drop-word-forms") == f"Database {sample_words_db} upgraded: drop_word_forms."
+    with sqlite3.connect(sample_words_db) as conn:
+        assert (
+            conn.execute("SELECT name FROM sqlite_master WHERE name = 'word_forms'").fetchall()
+            == []
+        )
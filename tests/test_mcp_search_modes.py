@@ -13,8 +13,9 @@ sys.path.append(os.getcwd())
 from neep_mcp import server as mcp_server
 
 
-@pytest.fixture(autouse=True)
-def _configure_db(configured_words_db):
+@pytest.fixture(autouse=True, params=["sqlite", "memory"])
+def _configure_db(request, configured_words_db, monkeypatch):
+    monkeypatch.setenv("NEEP_WORDS_ENGINE", request.param)
     return configured_words_db
 
 
@@ -49,9 +50,9 @@ def _is_subsequence(needle: str, haystack: str) -> bool:
     return all(ch in it for ch in needle)
 
 
-def _search(mode: str, query: str, limit: int = 200, offset: int = 0):
+def _search(mode: str, query: str, limit: int = 200, offset: int = 0, **kwargs):
     with _rate_limiter_disabled():
-        return mcp_server.search_words(query=query, mode=mode, limit=limit, offset=offset)
+        return mcp_server.search_words(query=query, mode=mode, limit=limit, offset=offset, **kwargs)
 
 
 def _extract_words(response: dict) -> list[str]:
@@ -134,6 +135,87 @@ def test_search_words_wildcard_matches_contains_equivalent():
         assert wildcard_words.issubset(contains_words)
 
 
+def test_search_words_typo_ranks_by_edit_distance():
+    response = _search("typo", "tranpsort")
+
+    assert response["data"]["max_distance"] == 2
+    assert response["data"]["results"][0] == {"word": "transport", "distance": 1}
+    distances = [row["distance"] for row in response["data"]["results"]]
+    assert distances == sorted(distances)
+    assert {"word": "transplant", "distance": 2} not in response["data"]["results"]
+
+
+def test_search_words_typo_respects_max_distance():
+    assert _extract_words(_search("typo", "bialagy", max_distance=1)) == []
+    assert _extract_words(_search("typo", "bialagy", max_distance=2)) == ["biology"]
+    assert _search("typo", "test", max_distance=3)["error"] == "invalid_max_distance"
+
+
+@pytest.mark.parametrize(
+    ("mode", "query"),
+    [("contains", "e"), ("suffix", "t"), ("prefix", "tr"), ("fuzzy", "tn"), ("typo", "transpat")],
+)
+def test_search_words_cursor_pages_match_a_single_query(mode: str, query: str):
+    expected = _search(mode, query)["data"]["results"]
+    pages: list[dict] = []
+    cursor = None
+    while True:
+        data = _search(mode, query, limit=3, cursor=cursor)["data"]
+        pages.extend(data["results"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(expected) > 3
+    assert pages == expected
+
+
+def test_search_words_rejects_foreign_or_corrupt_cursors():
+    cursor = _search("contains", "e", limit=2)["data"]["next_cursor"]
+
+    assert _search("contains", "o", cursor=cursor)["error"] == "invalid_cursor"
+    assert _search("prefix", "e", cursor=cursor)["error"] == "invalid_cursor"
+    assert _search("contains", "e", cursor="not-a-cursor")["error"] == "invalid_cursor"
+    # OFFSET still works, and composes with a cursor.
+    offset_page = _search("contains", "e", limit=2, offset=2)["data"]["results"]
+    assert _search("contains", "e", limit=2, cursor=cursor)["data"]["results"] == offset_page
+
+
+@pytest.mark.parametrize(
+    ("mode", "query"),
+    [
+        ("contains", "e"),
+        ("suffix", "ion"),
+        ("prefix", "tr"),
+        ("wildcard", "in%tion"),
+        ("typo", "transpat"),
+    ],
+)
+def test_search_words_totals_count_every_page(mode: str, query: str):
+    expected = _search(mode, query)["data"]["results"]
+
+    data = _search(mode, query, limit=2, with_total=True)["data"]
+    assert data["total"] == len(expected)
+    assert data["total_exact"] is True
+    assert data["results"] == expected[:2]
+
+    counted = _search(mode, query, count_only=True)["data"]
+    assert counted["total"] == len(expected)
+    assert "results" not in counted
+    assert "total" not in _search(mode, query, limit=2)["data"]
+
+
+def test_search_words_total_is_capped(monkeypatch: pytest.MonkeyPatch):
+    from neep_mcp import lexicon
+
+    monkeypatch.setattr(lexicon, "MAX_COUNT", 3)
+    data = _search("contains", "e", limit=2, with_total=True)["data"]
+    assert data["total"] == 3
+    assert data["total_exact"] is False
+    assert len(data["results"]) == 2
+    assert _search("prefix", "tr", count_only=True)["data"]["total_exact"] is False
+
+
 @pytest.mark.skipif(
     os.environ.get("NEEP_PERF_TEST") != "1",
     reason="set NEEP_PERF_TEST=1 to run perf comparison",
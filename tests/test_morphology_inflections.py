@@ -0,0 +1,72 @@
+import pytest
+
+from word_extractor.morphology import headword_candidates, inflections
+
+
+@pytest.mark.parametrize(
+    ("word", "forms"),
+    [
+        ("abandon", {"abandons", "abandoned", "abandoning"}),
+        ("ability", {"abilities"}),
+        ("stop", {"stops", "stopped", "stopping"}),
+        ("make", {"makes", "making", "made"}),
+        ("die", {"dies", "died", "dying"}),
+        ("agree", {"agrees", "agreed", "agreeing"}),
+        ("happy", {"happier", "happiest"}),
+        ("big", {"bigger", "biggest"}),
+        ("box", {"boxes"}),
+        ("knife", {"knives"}),
+        ("panic", {"panicked", "panicking"}),
+        ("go", {"goes", "going", "went", "gone"}),
+        ("child", {"children"}),
+        ("good", {"better", "best"}),
+        ("analysis", {"analyses"}),
+    ],
+)
+def test_inflections_cover_regular_and_irregular_forms(word: str, forms: set[str]):
+    assert forms <= set(inflections(word))
+
+
+def test_inflections_skip_regular_past_of_irregular_verbs():
+    forms = inflections("go")
+    assert "goed" not in forms
+    assert forms == sorted(forms)
+    assert "go" not in forms
+    assert inflections("x") == []
+
+
+@pytest.mark.parametrize(
+    ("word", "form"), [("walk", "walker"), ("book", "booker"), ("test", "tester")]
+)
+def test_inflections_leave_out_comparatives_of_non_adjectives(word: str, form: str):
+    assert form not in inflections(word)
+    assert {"lighter", "lightest", "lit"} <= set(inflections("light"))
+
+
+@pytest.mark.parametrize(
+    "word",
+    [
+        "abandon",
+        "ability",
+        "stop",
+        "make",
+        "die",
+        "agree",
+        "happy",
+        "big",
+        "knife",
+        "panic",
+        "go",
+        "child",
+        "good",
+        "analysis",
+        "admit",
+        "woman",
+        "lie",
+        "free",
+    ],
+)
+def test_headword_candidates_invert_inflections(word: str):
+    for form in inflections(word):
+        assert word in headword_candidates(form)
+    assert headword_candidates("walker") == []
@@ -0,0 +1,59 @@
+import pytest
+
+from word_extractor.morphology import norm_key
+
+
+@pytest.mark.parametrize(
+    ("british", "american"),
+    [
+        ("colour", "color"),
+        ("favourite", "favorite"),
+        ("neighbourhood", "neighborhood"),
+        ("behavioural", "behavioral"),
+        ("honourable", "honorable"),
+        ("clamour", "clamor"),
+        ("realise", "realize"),
+        ("organisation", "organization"),
+        ("analyse", "analyze"),
+        ("analysed", "analyzed"),
+        ("centre", "center"),
+        ("fibres", "fibers"),
+        ("travelled", "traveled"),
+        ("catalogue", "catalog"),
+        ("grey", "gray"),
+        ("defence", "defense"),
+    ],
+)
+def test_norm_key_folds_british_and_american_spellings(british: str, american: str):
+    assert norm_key(british) == norm_key(american) == american
+
+
+def test_norm_key_ignores_case_hyphens_and_spaces():
+    assert norm_key("Co-Operate") == norm_key("cooperate") == "cooperate"
+    assert norm_key("ice cream") == norm_key("ice-cream") == "icecream"
+    assert norm_key("中文") == ""
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ("four", "for"),
+        ("filled", "filed"),
+        ("timbre", "timber"),
+        ("rogue", "rog"),
+        ("analyses", "analyzes"),
+        ("paralyses", "paralyzes"),
+        ("scour", "scor"),
+        ("flour", "flor"),
+        ("contour", "contor"),
+    ],
+)
+def test_norm_key_keeps_distinct_words_apart(first: str, second: str):
+    assert norm_key(first) != norm_key(second)
+
+
+@pytest.mark.parametrize(
+    "word", ["scour", "devoured", "detours", "resource", "flourish", "journal"]
+)
+def test_norm_key_leaves_our_inside_other_words(word: str):
+    assert norm_key(word) == word
@@ -1,6 +1,20 @@
+import gzip
+import io
+import json
+import os
 import sqlite3
+import time
 
-from word_extractor.output import add_words_to_db, export_words_to_csv, write_outputs
+import pytest
+
+from word_extractor import output
+from word_extractor.output import (
+    add_words_to_db,
+    export_words,
+    export_words_to_csv,
+    import_words,
+    write_outputs,
+)
 
 
 def test_write_outputs_with_strings(tmp_path):
@@ -20,7 +34,15 @@ def test_write_outputs_with_strings(tmp_path):
         version_columns = conn.execute("PRAGMA table_info(vocab_versions)").fetchall()
 
     assert rows == [("2026", "alpha"), ("2026", "beta")]
-    assert [column[1] for column in columns] == ["id", "version_id", "word", "source", "added_at"]
+    assert [column[1] for column in columns] == [
+        "id",
+        "version_id",
+        "word",
+        "source",
+        "added_at",
+        "reversed_word",
+        "norm_key",
+    ]
     assert [column[1] for column in version_columns] == [
         "id",
         "version_key",
@@ -128,3 +150,291 @@ def test_export_words_to_csv_filters_by_version(tmp_path):
         "2027,beta",
         "2027,gamma",
     ]
+
+
+def test_add_words_to_db_bulk_matches_row_by_row_upsert(tmp_path):
+    entries = [
+        {"word": "beta", "source": None},
+        {"word": "Alpha", "source": "a-1"},
+        {"word": "beta", "source": "b-2"},
+        {"word": "alpha", "source": "a-3"},
+        {"word": "gamma"},
+    ]
+    rows_by_mode = {}
+    for bulk in (False, True):
+        db_path = tmp_path / f"bulk-{bulk}.sqlite3"
+        add_words_to_db(entries, db_path=db_path, version="2026", source="manual")
+        add_words_to_db([{"word": "delta", "source": "d-1"}], db_path=db_path, version="2026")
+        add_words_to_db(entries, db_path=db_path, version="2026", bulk=bulk)
+        with sqlite3.connect(db_path) as conn:
+            rows_by_mode[bulk] = conn.execute(
+                "SELECT word, source FROM words ORDER BY word"
+            ).fetchall()
+
+    assert rows_by_mode[True] == rows_by_mode[False]
+    assert rows_by_mode[True] == [
+        ("alpha", "a-1"),
+        ("beta", "manual"),
+        ("delta", "d-1"),
+        ("gamma", "manual"),
+    ]
+
+
+def test_bulk_load_pragmas_are_restored(tmp_path):
+    db_path = tmp_path / "words.sqlite3"
+    conn = sqlite3.connect(db_path)
+    try:
+        before = [
+            conn.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in ("journal_mode", "synchronous", "cache_size")
+        ]
+        with output._bulk_load_pragmas(conn):
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        after = [
+            conn.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in ("journal_mode", "synchronous", "cache_size")
+        ]
+    finally:
+        conn.close()
+
+    assert after == before
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+@pytest.mark.parametrize("row_count", [10_000, 100_000, 1_000_000])
+def test_write_words_db_bulk_throughput(tmp_path, synthetic_words, row_count):
+    words = synthetic_words(row_count)
+    rows = [(word, f"bench-{index}") for index, word in enumerate(reversed(words))]
+
+    timings: dict[str, float] = {}
+    for bulk in (False, True):
+        db_path = tmp_path / f"bench-{bulk}.sqlite3"
+        start = time.perf_counter()
+        output._write_words_db(db_path, rows, version="2026", bulk=bulk)
+        timings["bulk" if bulk else "upsert"] = time.perf_counter() - start
+
+    print(f"_write_words_db rows/s at {row_count} rows")
+    for mode, elapsed in timings.items():
+        print(f"{mode}: {row_count / elapsed:,.0f}")
+
+
+def test_import_words_round_trips_export_columns(tmp_path):
+    source_db = tmp_path / "source.sqlite3"
+    csv_path = tmp_path / "words.csv"
+    add_words_to_db(
+        [{"word": "alpha", "source": "s-a"}, {"word": "beta", "source": None}],
+        db_path=source_db,
+        version="2026",
+    )
+    add_words_to_db([{"word": "gamma", "source": "s-g"}], db_path=source_db, version="2027")
+    export_words_to_csv(source_db, csv_path, ["id", "version", "word", "source", "added_at"])
+
+    target_db = tmp_path / "target.sqlite3"
+    with csv_path.open(encoding="utf-8", newline="") as handle:
+        stats = import_words(handle, db_path=target_db, batch_size=1)
+
+    with sqlite3.connect(target_db) as conn:
+        rows = conn.execute(
+            """
+            SELECT vv.version_key, w.word, w.source
+            FROM words AS w
+            JOIN vocab_versions AS vv ON vv.id = w.version_id
+            ORDER BY vv.version_key, w.word
+            """
+        ).fetchall()
+
+    assert rows == [("2026", "alpha", "s-a"), ("2026", "beta", None), ("2027", "gamma", "s-g")]
+    assert stats["row_count"] == 3
+    assert stats["batch_count"] == 3
+    assert stats["versions"] == {"2026": 2, "2027": 1}
+
+
+def test_import_words_reads_jsonl_and_text(tmp_path):
+    db_path = tmp_path / "words.sqlite3"
+    jsonl = io.StringIO('{"word": "Alpha", "source": "j-1"}\n\n"beta"\n')
+    text = io.StringIO("gamma\n  \nalpha\n")
+
+    import_words(jsonl, db_path=db_path, fmt="jsonl", version="2027")
+    stats = import_words(text, db_path=db_path, fmt="txt", version="27考研")
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT word, source FROM words ORDER BY word").fetchall()
+
+    assert rows == [("alpha", "j-1"), ("beta", None), ("gamma", None)]
+    assert stats["versions"] == {"2027": 2}
+    assert stats["rows_read"] == stats["row_count"] == 2
+
+
+def test_import_words_checks_the_schema_once_per_import(tmp_path, monkeypatch):
+    calls = []
+    real_ensure = output.ensure_writable_schema
+
+    def counting_ensure(conn, **kwargs):
+        calls.append(kwargs)
+        return real_ensure(conn, **kwargs)
+
+    monkeypatch.setattr(output, "ensure_writable_schema", counting_ensure)
+    words = io.StringIO("".join(f"word{index}\n" for index in range(10)))
+    stats = import_words(
+        words, db_path=tmp_path / "words.sqlite3", fmt="txt", version="2027", batch_size=3
+    )
+
+    assert len(calls) == 1
+    assert stats["batch_count"] == 4
+    assert stats["rows_read"] == stats["row_count"] == 10
+
+
+@pytest.mark.parametrize(("bulk", "expected"), [(False, (2, "delete")), (True, (0, "memory"))])
+def test_import_words_relaxes_pragmas_only_with_bulk(tmp_path, monkeypatch, bulk, expected):
+    seen = []
+    real_merge = output._merge_staged_rows
+
+    def recording_merge(conn, version_id, rows):
+        seen.append(
+            (
+                conn.execute("PRAGMA synchronous").fetchone()[0],
+                conn.execute("PRAGMA journal_mode").fetchone()[0],
+            )
+        )
+        return real_merge(conn, version_id, rows)
+
+    monkeypatch.setattr(output, "_merge_staged_rows", recording_merge)
+    words = io.StringIO("alpha\nbeta\ngamma\n")
+
+    import_words(
+        words,
+        db_path=tmp_path / "words.sqlite3",
+        fmt="txt",
+        version="2027",
+        batch_size=2,
+        bulk=bulk,
+    )
+
+    assert seen == [expected, expected]
+
+
+def test_import_words_requires_version(tmp_path):
+    with pytest.raises(ValueError, match="no version"):
+        import_words(io.StringIO("word\nalpha\n"), db_path=tmp_path / "words.sqlite3")
+
+
+def test_export_words_supports_formats_and_gzip(tmp_path):
+    db_path = tmp_path / "words.sqlite3"
+    add_words_to_db([{"word": "alpha", "source": "s,1"}, "beta"], db_path=db_path, version="2026")
+
+    tsv = export_words(db_path, tmp_path / "words.tsv", ["word", "source"], fmt="tsv")
+    jsonl = export_words(db_path, tmp_path / "words.jsonl", ["version", "word"], fmt="jsonl")
+    txt = export_words(db_path, tmp_path / "words.txt.gz", ["source"], fmt="txt", compress=True)
+
+    assert tsv["row_count"] == jsonl["row_count"] == txt["row_count"] == 2
+    assert (tmp_path / "words.tsv").read_text(encoding="utf-8").splitlines() == [
+        "word\tsource",
+        "alpha\ts,1",
+        "beta\t",
+    ]
+    assert [
+        json.loads(line)
+        for line in (tmp_path / "words.jsonl").read_text(encoding="utf-8").splitlines()
+    ] == [{"version": "2026", "word": "alpha"}, {"version": "2026", "word": "beta"}]
+    with gzip.open(tmp_path / "words.txt.gz", "rt", encoding="utf-8") as handle:
+        assert handle.read() == "alpha\nbeta\n"
+    assert txt["compressed"] is True
+    assert txt["format"] == "txt"
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_export_words_throughput(tmp_path, synthetic_words):
+    row_count = 1_000_000
+    db_path = tmp_path / "bench.sqlite3"
+    rows = [(word, f"bench-{index}") for index, word in enumerate(synthetic_words(row_count))]
+    output._write_words_db(db_path, rows, version="2026", bulk=True)
+
+    print(f"export_words rows/s at {row_count} rows")
+    for fmt, compress in (
+        ("csv", False),
+        ("tsv", False),
+        ("jsonl", False),
+        ("txt", False),
+        ("csv", True),
+    ):
+        target = tmp_path / f"bench.{fmt}{'.gz' if compress else ''}"
+        start = time.perf_counter()
+        stats = export_words(
+            db_path, target, ["version", "word", "source"], fmt=fmt, compress=compress
+        )
+        elapsed = time.perf_counter() - start
+        assert stats["row_count"] == row_count
+        print(f"{target.name}: {row_count / elapsed:,.0f}")
+
+
+def test_write_outputs_reports_column_and_rejected_page_counts(tmp_path, monkeypatch):
+    class _FakeChecker:
+        def availableLanguages(self):
+            return ["en"]
+
+    class _FakeSpellChecker:
+        @staticmethod
+        def sharedSpellChecker():
+            return _FakeChecker()
+
+    class _FakeCocoa:
+        NSSpellChecker = _FakeSpellChecker
+
+    monkeypatch.setattr(output, "_ensure_spellchecker_available", lambda: _FakeCocoa)
+    monkeypatch.setattr(
+        output, "_is_word_spelled_correctly", lambda word, *, languages: word != "teh"
+    )
+    words = [
+        {"word": "Alpha", "page": 1, "column": "L", "source": "p1L1"},
+        {"word": "teh", "page": 1, "column": "R", "source": "p1R1"},
+        {"word": "alpha ", "page": 2, "column": "R", "source": "p2R1"},
+        {"word": "teh", "page": 2, "column": "L", "source": "p2L1"},
+        {"word": "beta", "page": 2, "column": "L", "source": "p2L2"},
+    ]
+
+    stats = write_outputs(words, tmp_path, version="2026")
+
+    assert stats["total_count"] == 3
+    assert stats["unique_count"] == 2
+    assert stats["duplicate_count"] == 1
+    assert stats["per_page_counts"] == {1: 1, 2: 2}
+    assert stats["per_column_counts"] == {"L": 2, "R": 1}
+    assert stats["rejected_count"] == 2
+    assert stats["rejected_per_page_counts"] == {1: 1, 2: 1}
+    assert (tmp_path / "rejected_words.csv").read_text(encoding="utf-8").splitlines() == [
+        "word,reason,source",
+        "teh,misspelled,p1R1",
+        "teh,misspelled,p2L1",
+    ]
+
+
+def test_add_words_to_db_collapses_duplicates_and_skips_unchanged_rows(tmp_path):
+    db_path = tmp_path / "words.sqlite3"
+    entries = [
+        {"word": "alpha", "source": None},
+        {"word": "Alpha", "source": "a-2"},
+        {"word": "alpha", "source": "a-3"},
+        {"word": "beta", "source": "b-1"},
+    ]
+
+    first = add_words_to_db(entries, db_path=db_path, version="2026")
+    again = add_words_to_db(entries, db_path=db_path, version="2026")
+    extended = add_words_to_db(
+        [*entries, {"word": "gamma", "source": "g-1"}], db_path=db_path, version="2026"
+    )
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT word, source FROM words ORDER BY word").fetchall()
+
+    assert rows == [("alpha", "a-2"), ("beta", "b-1"), ("gamma", "g-1")]
+    assert first["collapsed_count"] == 2
+    assert first["written_count"] == 2
+    assert again["written_count"] == 0
+    assert extended["written_count"] == 1
@@ -2,7 +2,8 @@ from pathlib import Path
 
 import pytest
 
-from word_extractor.pdf_renderer import render_pdf_pages
+from word_extractor import pdf_renderer
+from word_extractor.pdf_renderer import iter_pdf_pages, render_pdf_pages
 
 
 def test_render_pdf_pages_rejects_non_positive_pages():
@@ -16,3 +17,49 @@ def test_render_pdf_pages_rejects_non_positive_pages():
 def test_render_pdf_pages_rejects_end_before_start():
     with pytest.raises(ValueError, match="end_page"):
         render_pdf_pages(Path("/tmp/does_not_exist.pdf"), 3, 2)
+
+
+def test_iter_pdf_pages_rejects_end_past_page_count_before_iterating(tmp_path):
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf_path = tmp_path / "two-pages.pdf"
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(2):
+        pdf.new_page(72, 72)
+    pdf.save(str(pdf_path))
+    pdf.close()
+
+    # Raised by the call itself, not on the first next().
+    with pytest.raises(ValueError, match="end_page 3 exceeds the PDF's 2 page"):
+        iter_pdf_pages(pdf_path, 1, 3)
+    assert [image.size for image in iter_pdf_pages(pdf_path, 2, 2, dpi=72)] == [(72, 72)]
+
+
+def test_iter_pdf_pages_opens_the_document_only_when_iterated(tmp_path, monkeypatch):
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf_path = tmp_path / "one-page.pdf"
+    pdf = pdfium.PdfDocument.new()
+    pdf.new_page(72, 72)
+    pdf.save(str(pdf_path))
+    pdf.close()
+    open_documents = []
+    real_document = pdfium.PdfDocument
+
+    class TrackedDocument(real_document):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            open_documents.append(self)
+
+        def close(self):
+            open_documents.remove(self)
+            super().close()
+
+    monkeypatch.setattr(pdf_renderer.pdfium, "PdfDocument", TrackedDocument)
+
+    pages = iter_pdf_pages(pdf_path, 1, 1, dpi=72)
+    assert open_documents == []
+    next(pages)
+    assert len(open_documents) == 1
+    pages.close()
+    assert open_documents == []
+    assert list(iter_pdf_pages(pdf_path, 1, 1, skip_pages={1})) == []
+    assert open_documents == []
@@ -0,0 +1,105 @@
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from word_extractor import core, main, profiling
+from word_extractor.ocr_engine import OCRAnnotation
+from word_extractor.profiling import MemoryLimitExceeded, PipelineProfiler
+
+
+def test_track_memory_records_stage_peak_and_retained():
+    profiler = PipelineProfiler(track_memory=True)
+    try:
+        kept = []
+        with profiler.stage("render", page=1):
+            kept.append(bytearray(2_000_000))
+            scratch = bytearray(4_000_000)
+            del scratch
+    finally:
+        profiler.close()
+
+    memory = profiler.memory_summary()
+    stage = memory["stages"]["render"]
+    assert stage["peak_bytes"] >= 6_000_000
+    assert 2_000_000 <= stage["retained_bytes"] < 4_000_000
+    assert stage["rss_growth_bytes"] >= 0
+    assert memory["rss_peak_bytes"] > 0
+    assert "rss_peak_bytes" not in profiler.report()["pages"][0]
+    assert not tracemalloc.is_tracing()
+
+
+def test_max_memory_guard_raises_with_stage_and_page(monkeypatch):
+    monkeypatch.setattr(profiling, "current_rss_bytes", lambda: 3 * 1024**3)
+    profiler = PipelineProfiler(enabled=False, max_memory_bytes=2 * 1024**3)
+
+    with pytest.raises(
+        MemoryLimitExceeded,
+        match=r"process RSS is 3.0 GiB, limit is 2.0 GiB \(noticed after ocr on page 7\)",
+    ):
+        with profiler.stage("ocr", page=7, column="L"):
+            pass
+
+
+def test_parse_size_accepts_units():
+    assert main._parse_size("512M") == 512 * 1024**2
+    assert main._parse_size("1.5GiB") == int(1.5 * 1024**3)
+    assert main._parse_size("2048") == 2048
+
+
+def test_main_max_memory_exits_with_clear_message(tmp_path, monkeypatch):
+    def fake_extract_words(**kwargs):
+        with kwargs["profiler"].stage("render", page=1):
+            pass
+
+    monkeypatch.setattr(main, "extract_words", fake_extract_words)
+    monkeypatch.setattr(profiling, "current_rss_bytes", lambda: 900 * 1024**2)
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "neepwords",
+            "--pdf",
+            "dummy.pdf",
+            "--start-page",
+            "1",
+            "--end-page",
+            "1",
+            "--version",
+            "2027",
+            "--max-memory",
+            "512M",
+            "--profile",
+            str(tmp_path / "profile.json"),
+        ],
+    )
+
+    with pytest.raises(
+        SystemExit, match=r"Memory limit exceeded: .* \(noticed after render on page 1\)"
+    ):
+        main.main()
+    assert (tmp_path / "profile.json").exists()
+
+
+def test_extract_words_reports_memory_in_stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        core,
+        "iter_pdf_pages",
+        lambda pdf_path, start_page, end_page, dpi=300: iter([Image.new("RGB", (50, 50))]),
+    )
+    monkeypatch.setattr(core, "run_ocr", lambda image, **kwargs: [OCRAnnotation("alpha", 1, None)])
+    profiler = PipelineProfiler(track_memory=True)
+    try:
+        stats = core.extract_words(
+            pdf_path=Path("dummy.pdf"),
+            start_page=1,
+            end_page=1,
+            output_dir=tmp_path,
+            version="2027",
+            spellcheck=False,
+            profiler=profiler,
+        )
+    finally:
+        profiler.close()
+
+    assert {"render", "preprocess", "ocr", "collect", "db_write"} <= set(stats["memory"]["stages"])
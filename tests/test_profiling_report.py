@@ -0,0 +1,133 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from word_extractor import core, main
+from word_extractor.ocr_engine import OCRAnnotation
+from word_extractor.profiling import PipelineProfiler
+
+
+def test_profiler_report_totals_pages_and_percentiles():
+    profiler = PipelineProfiler()
+    for page, seconds in ((1, 0.5), (2, 1.5)):
+        profiler.record("render", seconds, page=page)
+        profiler.record("ocr", seconds * 2, page=page, column="L")
+        profiler.record("ocr", seconds, page=page, column="R")
+    profiler.record("db_write", 0.25)
+
+    report = profiler.report()
+
+    assert report["stages"]["ocr"]["count"] == 4
+    assert report["stages"]["ocr"]["total_seconds"] == 6.0
+    assert report["stages"]["ocr"]["p50_seconds"] == 1.0
+    assert report["stages"]["ocr"]["max_seconds"] == 3.0
+    assert report["stages"]["db_write"]["count"] == 1
+    assert report["pages"][1] == {
+        "page": 2,
+        "total_seconds": 6.0,
+        "stages": {"render": 1.5, "ocr": 4.5},
+        "columns": {"L": {"ocr": 3.0}, "R": {"ocr": 1.5}},
+    }
+    assert report["page_seconds"]["total_seconds"] == 8.0
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = PipelineProfiler(enabled=False)
+    with profiler.stage("ocr", page=1, column="L"):
+        pass
+    profiler.record("render", 1.0, page=1)
+
+    report = profiler.report()
+    assert report["stages"] == {}
+    assert report["pages"] == []
+
+
+def _patch_pipeline(monkeypatch):
+    def fake_iter_pdf_pages(pdf_path, start_page, end_page, dpi=300):
+        return iter([Image.new("RGB", (100, 100), "white") for _ in range(2)])
+
+    def fake_run_ocr(image, **kwargs):
+        return [OCRAnnotation("alpha", 0.9, None)]
+
+    monkeypatch.setattr(core, "iter_pdf_pages", fake_iter_pdf_pages)
+    monkeypatch.setattr(core, "run_ocr", fake_run_ocr)
+
+
+def test_extract_words_profiles_each_stage(tmp_path, monkeypatch):
+    _patch_pipeline(monkeypatch)
+    profiler = PipelineProfiler()
+
+    core.extract_words(
+        pdf_path=Path("dummy.pdf"),
+        start_page=1,
+        end_page=2,
+        output_dir=tmp_path,
+        version="2027",
+        spellcheck=False,
+        profiler=profiler,
+    )
+
+    report = profiler.report()
+    assert {"render", "preprocess", "ocr", "clean", "db_write"} <= set(report["stages"])
+    assert report["stages"]["render"]["count"] == 2
+    assert report["stages"]["ocr"]["count"] == 4
+    assert [entry["page"] for entry in report["pages"]] == [1, 2]
+    assert set(report["pages"][0]["columns"]) == {"L", "R"}
+
+
+def test_main_profile_flag_writes_report(tmp_path, monkeypatch, capsys):
+    _patch_pipeline(monkeypatch)
+    profile_path = tmp_path / "profile.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "neepwords",
+            "--pdf",
+            "dummy.pdf",
+            "--start-page",
+            "1",
+            "--end-page",
+            "2",
+            "--version",
+            "2027",
+            "--no-spellcheck",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--profile",
+            str(profile_path),
+        ],
+    )
+
+    main.main()
+
+    report = json.loads(profile_path.read_text(encoding="utf-8"))
+    assert len(report["pages"]) == 2
+    summary = capsys.readouterr().out.strip().splitlines()[-1]
+    assert summary.startswith("Profile: total ")
+    assert summary.endswith(f"-> {profile_path}")
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_profiler_overhead_comparison():
+    iterations = 1_000_000
+    timings: dict[str, float] = {}
+    for name, profiler in (
+        ("disabled", PipelineProfiler(enabled=False)),
+        ("enabled", PipelineProfiler()),
+    ):
+        start = time.perf_counter()
+        for index in range(iterations):
+            with profiler.stage("ocr", page=index % 100, column="L"):
+                pass
+        timings[name] = time.perf_counter() - start
+
+    print(f"profiler.stage x{iterations} (seconds)")
+    for name, elapsed in timings.items():
+        print(f"{name}: {elapsed:.4f}")
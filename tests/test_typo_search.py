@@ -0,0 +1,90 @@
+import os
+import random
+import time
+
+import pytest
+
+from neep_mcp.typo import TypoIndex, osa_distance
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        ("accommodate", "acommodate", 1),
+        ("receive", "recieve", 1),
+        ("form", "from", 1),
+        ("kitten", "sitting", 3),
+        ("", "ab", 2),
+        ("same", "same", 0),
+    ],
+)
+def test_osa_distance(first, second, expected):
+    assert osa_distance(first, second, 3) == expected
+
+
+def test_osa_distance_stops_past_the_limit():
+    assert osa_distance("abandon", "xyzxyzx", 2) == 3
+    assert osa_distance("a", "abcdef", 2) == 3
+
+
+def _random_words(rng: random.Random, count: int) -> list[str]:
+    letters = "eeeettaaooiinnsshrdlucmfwypvbgk"
+    words = {"".join(rng.choice(letters) for _ in range(rng.randint(2, 12))) for _ in range(count)}
+    return sorted(words)
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    chars = list(word)
+    for _ in range(rng.randint(1, 2)):
+        index = rng.randrange(len(chars))
+        operation = rng.randrange(4)
+        if operation == 0 and len(chars) > 1:
+            del chars[index]
+        elif operation == 1:
+            chars.insert(index, rng.choice("aeiourst"))
+        elif operation == 2:
+            chars[index] = rng.choice("aeiourst")
+        elif index + 1 < len(chars):
+            chars[index], chars[index + 1] = chars[index + 1], chars[index]
+    return "".join(chars)
+
+
+def test_typo_index_matches_brute_force():
+    rng = random.Random(7)
+    words = _random_words(rng, 3000)
+    index = TypoIndex(words)
+
+    for query in [_typo(rng, rng.choice(words)) for _ in range(150)]:
+        for max_distance in (1, 2):
+            expected = sorted(
+                (distance, word)
+                for word in words
+                if (distance := osa_distance(query, word, max_distance)) <= max_distance
+            )
+            assert index.search(query, max_distance) == expected
+
+
+def test_typo_index_rejects_distances_beyond_the_index():
+    with pytest.raises(ValueError, match="invalid_max_distance"):
+        TypoIndex(["alpha"], max_distance=1).search("alpah", 2)
+
+
+@pytest.mark.skipif(
+    os.environ.get("NEEP_PERF_TEST") != "1",
+    reason="set NEEP_PERF_TEST=1 to run perf comparison",
+)
+def test_typo_index_performance():
+    rng = random.Random(0)
+    words = _random_words(rng, 120_000)[:100_000]
+    queries = [_typo(rng, rng.choice(words)) for _ in range(500)]
+
+    start = time.perf_counter()
+    index = TypoIndex(words)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, 2)
+    query_seconds = (time.perf_counter() - start) / len(queries)
+
+    print(f"typo index over {len(words)} words: build {build_seconds:.2f}s")
+    print(f"avg query latency (max_distance=2): {query_seconds * 1000:.2f} ms")
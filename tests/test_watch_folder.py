@@ -0,0 +1,184 @@
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from word_extractor import core, main, watch
+from word_extractor.ocr_engine import OCRAnnotation
+from word_extractor.watch import STATE_FILE_NAME, FolderWatcher
+
+SIDECAR = 'version = "2027"\nstart_page = 1\nend_page = 1\nspellcheck = false\n'
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    calls = []
+
+    def fake_iter_pdf_pages(pdf_path, start_page, end_page, dpi=300):
+        calls.append(Path(pdf_path).name)
+        return iter([Image.new("RGB", (60, 60), "white")])
+
+    def fake_run_ocr(image, **kwargs):
+        return [OCRAnnotation("alpha", 0.9, None), OCRAnnotation("beta", 0.9, None)]
+
+    monkeypatch.setattr(core, "iter_pdf_pages", fake_iter_pdf_pages)
+    monkeypatch.setattr(core, "run_ocr", fake_run_ocr)
+    return calls
+
+
+def _drop_pdf(folder: Path, name: str = "2027.pdf", content: bytes = b"%PDF-1.7 a") -> Path:
+    pdf_path = folder / name
+    pdf_path.write_bytes(content)
+    pdf_path.with_suffix(".toml").write_text(SIDECAR, encoding="utf-8")
+    return pdf_path
+
+
+def _db_words(folder: Path) -> list[str]:
+    with sqlite3.connect(folder / "output" / "words.sqlite3") as conn:
+        return [row[0] for row in conn.execute("SELECT word FROM words ORDER BY word")]
+
+
+def test_watch_processes_new_pdf_once_and_records_state(tmp_path, fake_ocr):
+    _drop_pdf(tmp_path)
+    watcher = FolderWatcher(tmp_path)
+
+    results = watcher.poll(settle=False)
+
+    assert len(results) == 1
+    assert results[0]["failed_count"] == 0
+    assert _db_words(tmp_path) == ["alpha", "beta"]
+    state = json.loads((tmp_path / STATE_FILE_NAME).read_text(encoding="utf-8"))
+    assert set(state["files"]) == {"2027.pdf"}
+
+    assert watcher.poll(settle=False) == []
+    assert FolderWatcher(tmp_path).poll(settle=False) == []
+    assert fake_ocr == ["2027.pdf"]
+
+
+def test_watch_waits_for_file_to_settle(tmp_path, fake_ocr):
+    watcher = FolderWatcher(tmp_path)
+    _drop_pdf(tmp_path)
+
+    assert watcher.poll() == []
+    assert len(watcher.poll()) == 1
+
+
+def test_watch_reruns_only_when_content_or_sidecar_changes(tmp_path, fake_ocr):
+    pdf_path = _drop_pdf(tmp_path)
+    watcher = FolderWatcher(tmp_path)
+    watcher.poll(settle=False)
+
+    stat = pdf_path.stat()
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert watcher.poll(settle=False) == []
+
+    pdf_path.write_bytes(b"%PDF-1.7 rescanned")
+    assert len(watcher.poll(settle=False)) == 1
+
+    sidecar = pdf_path.with_suffix(".toml")
+    sidecar.write_text(SIDECAR + "dpi = 200\n", encoding="utf-8")
+    sidecar_stat = sidecar.stat()
+    os.utime(sidecar, ns=(sidecar_stat.st_atime_ns, sidecar_stat.st_mtime_ns + 10_000_000))
+    assert len(watcher.poll(settle=False)) == 1
+    assert fake_ocr == ["2027.pdf"] * 3
+
+
+def test_watch_uses_neep_toml_defaults_and_records_errors(tmp_path, fake_ocr):
+    (tmp_path / "neep.toml").write_text(
+        "[watch]\nstart_page = 1\nend_page = 1\nspellcheck = false\n", encoding="utf-8"
+    )
+    (tmp_path / "no-version.pdf").write_bytes(b"%PDF-1.7")
+    watcher = FolderWatcher(tmp_path)
+
+    [result] = watcher.poll(settle=False)
+    assert "missing: version" in result["error"]
+    state = json.loads((tmp_path / STATE_FILE_NAME).read_text(encoding="utf-8"))
+    entry = state["files"]["no-version.pdf"]
+    assert entry["error"] == result["error"]
+    assert entry["attempts"] == 1
+    assert entry["sha256"]
+    # Nothing changed, so the failure is not retried yet.
+    assert watcher.poll(settle=False) == []
+
+    (tmp_path / "no-version.json").write_text('{"version": "2026"}', encoding="utf-8")
+    [result] = watcher.poll(settle=False)
+    assert result["versions"]["2026"]["unique_count"] == 2
+
+
+def test_watch_backs_off_on_an_unchanged_failing_file(tmp_path, fake_ocr, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(watch, "_now", lambda: now[0])
+    pdf_path = _drop_pdf(tmp_path)
+    watcher = FolderWatcher(tmp_path)
+    extracted = []
+
+    def failing_extract(pdf_path):
+        extracted.append(pdf_path.name)
+        return {"failed_count": 1}
+
+    monkeypatch.setattr(watcher, "_extract", failing_extract)
+
+    assert len(watcher.poll(settle=False)) == 1
+    assert watcher.poll(settle=False) == []
+    stat = pdf_path.stat()
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert watcher.poll(settle=False) == []
+    assert FolderWatcher(tmp_path).poll(settle=False) == []
+    assert extracted == ["2027.pdf"]
+
+    # The delay doubles with each failed attempt.
+    now[0] += watch.RETRY_BASE_SECONDS
+    assert len(watcher.poll(settle=False)) == 1
+    now[0] += watch.RETRY_BASE_SECONDS
+    assert watcher.poll(settle=False) == []
+    now[0] += watch.RETRY_BASE_SECONDS
+    assert len(watcher.poll(settle=False)) == 1
+    state = json.loads((tmp_path / STATE_FILE_NAME).read_text(encoding="utf-8"))
+    assert state["files"]["2027.pdf"]["attempts"] == 3
+
+    # A new scan is tried at once and starts the count over.
+    pdf_path.write_bytes(b"%PDF-1.7 rescanned")
+    assert len(watcher.poll(settle=False)) == 1
+    state = json.loads((tmp_path / STATE_FILE_NAME).read_text(encoding="utf-8"))
+    assert state["files"]["2027.pdf"]["attempts"] == 1
+    assert extracted == ["2027.pdf"] * 4
+
+
+def test_watch_retries_after_a_transient_database_error(tmp_path, fake_ocr, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(watch, "_now", lambda: now[0])
+    _drop_pdf(tmp_path)
+    watcher = FolderWatcher(tmp_path)
+    real_extract = watcher._extract
+    failures = [sqlite3.OperationalError("database is locked"), OSError("disk busy")]
+
+    def flaky_extract(pdf_path):
+        if failures:
+            raise failures.pop(0)
+        return real_extract(pdf_path)
+
+    monkeypatch.setattr(watcher, "_extract", flaky_extract)
+
+    assert [result["error"] for result in watcher.poll(settle=False)] == ["database is locked"]
+    now[0] += watch.RETRY_MAX_SECONDS
+    assert [result["error"] for result in watcher.poll(settle=False)] == ["disk busy"]
+    now[0] += watch.RETRY_MAX_SECONDS
+    [result] = watcher.poll(settle=False)
+    assert result["failed_count"] == 0
+    assert _db_words(tmp_path) == ["alpha", "beta"]
+    assert watcher.poll(settle=False) == []
+
+
+def test_watch_cli_once(tmp_path, fake_ocr, monkeypatch, capsys):
+    _drop_pdf(tmp_path)
+    monkeypatch.setattr("sys.argv", ["neepwords", "watch", "--dir", str(tmp_path), "--once"])
+
+    main.main()
+
+    output = capsys.readouterr().out
+    assert f"[watch] extracting {tmp_path / '2027.pdf'}" in output
+    assert "[version] 2027: 2 unique word(s), 2 written, 0 rejected" in output
+    assert f"[watch] {tmp_path / '2027.pdf'}: done" in output